@@ -0,0 +1,69 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from chip8 import Chip8
+from chip8.benchmark import PROGRAMS, find_regressions, run_suite
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the CHIP-8 emulator on synthetic programs.',
+    )
+    parser.add_argument(
+        'benchmarks', nargs='*',
+        help=f'Benchmarks to run: {", ".join(PROGRAMS)} (default: all).',
+    )
+    parser.add_argument(
+        '--engine', action='append', choices=Chip8.ENGINES,
+        help='Execution engine, can be repeated (default: all).',
+    )
+    parser.add_argument(
+        '--mode', choices=Chip8.MODES, default='strict',
+        help='Execution mode (default: %(default)s).',
+    )
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--instructions-per-frame', type=int, default=1000)
+    parser.add_argument('--output', type=str, help='Path to write JSON to.')
+    parser.add_argument(
+        '--baseline', type=str, help='JSON report to compare results with.',
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='Allowed slowdown against baseline (default: %(default)s).',
+    )
+    args = parser.parse_args()
+
+    if unknown := set(args.benchmarks) - set(PROGRAMS):
+        parser.error(f'unknown benchmarks: {", ".join(sorted(unknown))}')
+
+    report = run_suite(
+        args.benchmarks, args.engine, args.frames, args.instructions_per_frame,
+        args.mode,
+    )
+
+    print(
+        f'{"benchmark":<10} {"engine":<12} {"instr/s":>12} '
+        f'{"ns/instr":>9} {"render ns/frame":>16}',
+    )
+    for result in report['results']:
+        print(
+            f'{result["benchmark"]:<10} {result["engine"]:<12} '
+            f'{result["instructions_per_second"]:>12,.0f} '
+            f'{result["ns_per_instruction"]:>9.0f} '
+            f'{result["render_ns_per_frame"]:>16,.0f}',
+        )
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(report, indent=2) + '\n', encoding='utf-8',
+        )
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        regressions = find_regressions(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+
+        if regressions:
+            sys.exit(1)
@@ -1,70 +1,73 @@
 import argparse
+import json
+import sys
 from pathlib import Path
 
+# Runs as "python bin/disassemble_rom.py", the package is one level up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def get_opcode_name(opcode: int) -> str:
-    nnn = opcode & 0x0FFF       # Addr: Lowest 12 bits of the opcode
-    n = opcode & 0x000F         # Nibble: Lowest 4 bits of the opcode
-    x = (opcode & 0x0F00) >> 8       # Register X: lower 4 bits of the high byte
-    y = (opcode & 0x00F0) >> 4       # Register Y: upper 4 bits of the high byte
-    kk = opcode & 0x00FF        # Immediate byte: the lowest 8 bits
-
-    match opcode:
-        case 0x00E0:
-            return '00E0 - CLS'
-        case _ if opcode & 0xF000 == 0x1000:
-            return f'1nnn - JP {nnn:04x}'
-        case _ if opcode & 0xF000 == 0x3000:
-            return f'3xkk - SE V{x}, {kk}'
-        case _ if opcode & 0xF000 == 0x4000:
-            return f'4xkk - SNE V{x}, {kk}'
-        case _ if opcode & 0xF000 == 0x6000:
-            return f'6xkk - LD V{x}, {kk}'
-        case _ if opcode & 0xF000 == 0x7000:
-            return f'7xkk - ADD V{x}, {kk}'
-        case _ if opcode & 0xF00F == 0x8004:
-            return f'8xy4 - ADD V{x}, V{y}'
-        case _ if opcode & 0xF000 == 0xA000:
-            return f'Annn - LD I, {nnn}'
-        case _ if opcode & 0xF000 == 0xD000:
-            return f'Dxyn - DRW V{x}, V{y}, {n}'
-        case _ if opcode & 0xF0FF == 0xF007:
-            return f'Fx07 - LD V{x}, DT'
-        case _ if opcode & 0xF0FF == 0xF00A:
-            return f'Fx0A - LD V{x}, K'
-        case _ if opcode & 0xF0FF == 0xF015:
-            return f'Fx15 - LD DT, V{x}'
-        case _ if opcode & 0xF0FF == 0xF018:
-            return f'Fx18 - LD ST, V{x}'
-        case _:
-            return f'Unknown opcode: "{hex(opcode)}"'
-
-
-def read_opcode(opcode: int) -> str:
-    """
-    Read opcode and return its string representation.
-    """
-    # Convert the opcode to a 4-digit hexadecimal string
-    hex_opcode = f'{opcode:04X}'
-
-    # # Split the opcode into its components
-    nibbles = [ hex_opcode[i : i + 2] for i in range(0, len(hex_opcode), 2) ]
-
-    # Format the opcode as a string
-    return '0x' + ' '.join(nibbles)
-
+from chip8.disassembler import ControlFlowGraph, get_opcode_name
+from chip8.library import DisassemblyCache, disassemble_library
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Run the CHIP-8 emulator.')
     parser.add_argument('rom_path', type=str, help='Path to the ROM file to load.')
+    parser.add_argument(
+        'more_paths', nargs='*', help='More ROMs or directories for --batch.',
+    )
+    parser.add_argument(
+        '--linear', action='store_true',
+        help='Decode every pair of bytes, even sprite data.',
+    )
+    parser.add_argument(
+        '--cfg-json', type=str, default=None,
+        help='Write basic blocks and their successors as JSON.',
+    )
+    parser.add_argument(
+        '--batch', action='store_true',
+        help='Write opcode histograms of all given ROMs as JSON lines.',
+    )
+    parser.add_argument(
+        '--cache-dir', type=str, default='.disassembly_cache',
+        help='Directory to cache batch results in (default: %(default)s).',
+    )
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Processes to analyse ROMs with (default: CPU count).',
+    )
     args = parser.parse_args()
 
+    if args.batch:
+        cache = None if args.no_cache else DisassemblyCache(args.cache_dir)
+        for analysis in disassemble_library(
+            [args.rom_path, *args.more_paths], cache, args.workers,
+        ):
+            sys.stdout.write(json.dumps(analysis) + '\n')
+        sys.exit()
+    if args.more_paths:
+        parser.error('multiple paths are only supported with --batch')
+
     rom_data = Path(args.rom_path).read_bytes()
 
-    for i in range(0, len(rom_data), 2):
-        # Read two bytes from the ROM data
-        opcode = (rom_data[i] << 8) | rom_data[i + 1]
+    if args.linear:
+        for i in range(0, len(rom_data) - 1, 2):
+            # Read two bytes from the ROM data
+            opcode = (rom_data[i] << 8) | rom_data[i + 1]
+
+            opcode_name = get_opcode_name(opcode)
+
+            print(f'{i + 0x200:04x}: {opcode:04x} — {opcode_name}')
 
-        opcode_name = get_opcode_name(opcode)
+        # Odd-length ROMs end with a single byte
+        if len(rom_data) % 2:
+            address = len(rom_data) - 1 + 0x200
+            print(f'{address:04x}: {rom_data[-1]:02x}   — data')
+    else:
+        cfg = ControlFlowGraph(rom_data)
+        print('\n'.join(cfg.listing()))
 
-        print(f'{i + 0x200:04x}: {opcode:04x} — {opcode_name}')
+        if args.cfg_json is not None:
+            Path(args.cfg_json).write_text(
+                json.dumps(cfg.to_json(), indent=2), encoding='utf-8',
+            )
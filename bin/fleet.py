@@ -0,0 +1,46 @@
+import argparse
+import json
+import os
+from pathlib import Path
+
+from chip8 import Chip8
+from chip8.fleet import Chip8Fleet, summarize
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Run many CHIP-8 machines across worker processes.',
+    )
+    parser.add_argument('rom_paths', nargs='+', help='ROM files to run.')
+    parser.add_argument(
+        '--copies', type=int, default=1,
+        help='Machines to run per ROM (default: %(default)s).',
+    )
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--instructions-per-frame', type=int, default=None)
+    parser.add_argument(
+        '--engine', choices=Chip8.ENGINES, default='interpreter',
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Worker processes (default: CPU count).',
+    )
+    parser.add_argument(
+        '--throttle', action='store_true',
+        help='Run machines in real time instead of as fast as possible.',
+    )
+    args = parser.parse_args()
+
+    roms = [Path(rom_path).read_bytes() for rom_path in args.rom_paths]
+    machines = len(roms) * args.copies
+
+    with Chip8Fleet(machines, args.workers or os.cpu_count()) as fleet:
+        for rom in roms:
+            for _ in range(args.copies):
+                fleet.start(
+                    rom, args.frames,
+                    engine=args.engine,
+                    instructions_per_frame=args.instructions_per_frame,
+                    turbo=not args.throttle,
+                )
+
+        print(json.dumps(summarize(fleet.wait()), indent=2))
@@ -0,0 +1,44 @@
+import argparse
+
+from chip8.disassembler import get_opcode_name
+from chip8.trace import NO_REGISTER, read_trace
+
+
+def parse_address_range(value: str) -> tuple[int, int]:
+    # Single address "200" or an inclusive range "200-2ff", hexadecimal
+    start, _, end = value.partition('-')
+    return int(start, 16), int(end or start, 16)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Print a binary CHIP-8 execution trace.',
+    )
+    parser.add_argument('trace_path', type=str, help='Path to the trace.')
+    parser.add_argument(
+        '--address', type=parse_address_range, default=None,
+        help='Hexadecimal address or inclusive range, e.g. 200-2ff.',
+    )
+    parser.add_argument(
+        '--opcode', type=str, default=None,
+        help='Opcode class to keep, e.g. 8xy4 or dxyn.',
+    )
+    parser.add_argument(
+        '--limit', type=int, default=None,
+        help='Stop after printing given amount of records.',
+    )
+    args = parser.parse_args()
+
+    records = read_trace(
+        args.trace_path, address_range=args.address, opcode_class=args.opcode,
+    )
+    for printed, record in enumerate(records):
+        if args.limit is not None and printed >= args.limit:
+            break
+
+        cycle, counter, opcode, register, value, vf, i = record
+        change = '' if register == NO_REGISTER else f'V{register:X}={value:02x}'
+        print(
+            f'{cycle:>12} {counter:04x}: {opcode:04x} '
+            f'{get_opcode_name(opcode):<28} {change:<7} VF={vf:02x} I={i:03x}',
+        )
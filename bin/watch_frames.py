@@ -0,0 +1,26 @@
+import argparse
+
+from chip8.display import Chip8Display
+from chip8.streaming import FrameClient, parse_address
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Watch frames streamed by a running CHIP-8 emulator.',
+    )
+    parser.add_argument(
+        'address', type=str, help='host:port or a Unix socket path.',
+    )
+    args = parser.parse_args()
+
+    display = Chip8Display()
+    try:
+        with FrameClient(parse_address(args.address)) as client:
+            for _, rows in client.frames():
+                # Marking changed rows, so only they are redrawn
+                for y, row in enumerate(rows):
+                    if display.rows[y] != row:
+                        display.rows[y] = row
+                        display.dirty_rows |= 1 << y
+                display.render()
+    except KeyboardInterrupt:
+        print('\nStopped')
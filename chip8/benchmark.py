@@ -0,0 +1,171 @@
+import io
+import platform
+import time
+from contextlib import redirect_stdout
+
+from .cpu import Chip8
+
+BENCHMARK_FORMAT_VERSION: int = 1
+
+SPRITE_ADDRESS: int = 0x300
+SPRITE: bytes = bytes([0xF0, 0x90, 0x90, 0x90, 0xF0])  # Digit "0"
+
+# Synthetic programs, each one stresses a single opcode family
+PROGRAMS: dict[str, bytes] = {
+    # Register arithmetic: 8xy4 with carry and 6xkk loads
+    'alu': bytes([
+        0x60, 0x00,  # 0x200: LD V0, 0
+        0x61, 0x01,  # 0x202: LD V1, 1
+        0x80, 0x14,  # 0x204: ADD V0, V1
+        0x62, 0x03,  # 0x206: LD V2, 3
+        0x80, 0x24,  # 0x208: ADD V0, V2
+        0x63, 0x05,  # 0x20A: LD V3, 5
+        0x80, 0x34,  # 0x20C: ADD V0, V3
+        0x12, 0x04,  # 0x20E: JP 0x204
+    ]),
+    # Chain of unconditional 1nnn jumps
+    'jumps': b''.join(
+        bytes([0x12, (offset + 2) & 0xFF]) for offset in range(0, 0x1E, 2)
+    ) + bytes([0x12, 0x00]),
+    # Dxyn drawing a 5 rows sprite all over the screen
+    'sprites': bytes([
+        0xA3, 0x00,  # 0x200: LD I, 0x300
+        0x60, 0x00,  # 0x202: LD V0, 0
+        0x61, 0x00,  # 0x204: LD V1, 0
+        0x62, 0x03,  # 0x206: LD V2, 3
+        0x63, 0x05,  # 0x208: LD V3, 5
+        0xD0, 0x15,  # 0x20A: DRW V0, V1, 5
+        0x80, 0x24,  # 0x20C: ADD V0, V2
+        0x81, 0x34,  # 0x20E: ADD V1, V3
+        0x12, 0x0A,  # 0x210: JP 0x20A
+    ]),
+    # Polling the delay timer with Fx07 until it runs out
+    'timers': bytes([
+        0x60, 0x10,  # 0x200: LD V0, 0x10
+        0xF0, 0x15,  # 0x202: LD DT, V0
+        0xF1, 0x07,  # 0x204: LD V1, DT
+        0x31, 0x00,  # 0x206: SE V1, 0
+        0x12, 0x04,  # 0x208: JP 0x204
+        0x12, 0x00,  # 0x20A: JP 0x200
+    ]),
+    # Drawing a sprite and clearing the display with 00E0
+    'clears': bytes([
+        0xA3, 0x00,  # 0x200: LD I, 0x300
+        0xD0, 0x15,  # 0x202: DRW V0, V1, 5
+        0x00, 0xE0,  # 0x204: CLS
+        0x12, 0x02,  # 0x206: JP 0x202
+    ]),
+}
+
+
+def run_benchmark(
+    name: str,
+    engine: str = 'interpreter',
+    frames: int = 600,
+    instructions_per_frame: int = 1000,
+    mode: str = 'strict',
+) -> dict[str, str | int | float]:
+    """
+    Running a synthetic program headless and as fast as possible.
+    Idle loops are executed, skipping them would measure nothing
+    """
+    chip = Chip8(
+        engine,
+        instructions_per_frame=instructions_per_frame,
+        turbo=True,
+        skip_idle=False,
+        mode=mode,
+    )
+    chip.memory.write(chip.PROGRAM_START, PROGRAMS[name])
+    chip.memory.write(SPRITE_ADDRESS, SPRITE)
+
+    # Timing rendering separately from the CPU
+    render = chip.display.render
+    render_time = 0
+
+    def timed_render() -> None:
+        nonlocal render_time
+        start = time.perf_counter_ns()
+        render()
+        render_time += time.perf_counter_ns() - start
+
+    chip.display.render = timed_render
+
+    # Terminal output is rendered, but not printed
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter_ns()
+        chip.run(frames)
+        elapsed = time.perf_counter_ns() - start
+
+    instructions = chip.scheduler.cycles
+    return {
+        'benchmark': name,
+        'engine': engine,
+        'mode': mode,
+        'frames': frames,
+        'instructions': instructions,
+        'seconds': elapsed / 1e9,
+        'instructions_per_second': instructions * 1e9 / elapsed,
+        'ns_per_instruction': (elapsed - render_time) / instructions,
+        'render_ns_per_frame': render_time / frames,
+    }
+
+
+def run_suite(
+    names: list[str] | None = None,
+    engines: list[str] | None = None,
+    frames: int = 600,
+    instructions_per_frame: int = 1000,
+    mode: str = 'strict',
+) -> dict:
+    results = [
+        run_benchmark(name, engine, frames, instructions_per_frame, mode)
+        for name in names or PROGRAMS
+        for engine in engines or Chip8.ENGINES
+    ]
+
+    return {
+        'version': BENCHMARK_FORMAT_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def find_regressions(
+    report: dict,
+    baseline: dict,
+    threshold: float = 0.1,
+) -> list[str]:
+    """
+    Comparing instructions/s against a baseline report. Benchmark is
+    regressed when it's slower than the baseline by more than threshold
+    """
+    # Reports written before modes existed were all strict
+    def key_of(result: dict) -> tuple[str, str, str]:
+        return (
+            result['benchmark'], result['engine'],
+            result.get('mode', 'strict'),
+        )
+
+    baseline_results = {
+        key_of(result): result for result in baseline['results']
+    }
+
+    regressions: list[str] = []
+    for result in report['results']:
+        key = key_of(result)
+        if key not in baseline_results:
+            continue
+
+        expected = baseline_results[key]['instructions_per_second']
+        actual = result['instructions_per_second']
+        if actual < expected * (1 - threshold):
+            name, engine, mode = key
+            label = engine if mode == 'strict' else f'{engine}, {mode}'
+            regressions.append(
+                f'{name} [{label}]: {actual:,.0f} instructions/s, '
+                f'baseline {expected:,.0f} ({actual / expected - 1:+.1%})',
+            )
+
+    return regressions
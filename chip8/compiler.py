@@ -0,0 +1,161 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .decoder import DECODE_TABLE
+from .utils import parse_byte
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+    from .memory import Chip8Memory
+
+
+# Straight-line instructions and the Python code executing them. Templates
+# are formatted with decoded operands, `v` is the V registers bytearray
+STRAIGHT_LINE_TEMPLATES: dict[str, str] = {
+    'op_00e0': 'chip.display.clear()',
+    'op_6xkk': 'v[{0}] = {1}',
+    'op_7xkk': 'v[{0}] = parse_byte(v[{0}] + {1})',
+    'op_8xy4': (
+        'result = v[{0}] + v[{1}]\n'
+        'v[{0}] = result & 0xFF\n'
+        'v[0xF] = 1 if result > 0xFF else 0'
+    ),
+    'op_annn': 'chip.registers.i = {0}',
+    'op_fx07': 'v[{0}] = chip.delay_timer.value',
+    'op_fx15': 'chip.delay_timer.update(v[{0}])',
+    'op_fx18': 'chip.sound_timer.update(v[{0}])',
+}
+
+# Fast mode masks overflowing values instead of panicking
+FAST_TEMPLATES: dict[str, str] = {
+    **STRAIGHT_LINE_TEMPLATES,
+    'op_7xkk': 'v[{0}] = (v[{0}] + {1}) & 0xFF',
+}
+
+# Instructions ending a block: jumps, skips, waiting for a key and drawing.
+# They are executed by the interpreter handlers at the end of the block
+BLOCK_TERMINATORS: frozenset[str] = frozenset({
+    'op_1nnn', 'op_3xkk', 'op_4xkk', 'op_dxyn', 'op_ex9e', 'op_exa1',
+    'op_fx0a',
+})
+
+
+class CompiledBlock:
+    start: int  # Address of the first instruction
+    end: int  # Address right after the last instruction
+    length: int  # Amount of instructions, i.e. CPU cycles it takes
+    source: str  # Generated Python source, kept for debugging
+    function: Callable[['Chip8'], None]
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        source: str,
+        function: Callable[['Chip8'], None],
+    ) -> None:
+        self.start = start
+        self.end = end
+        self.length = (end - start) // 2
+        self.source = source
+        self.function = function
+
+
+class BlockCompiler:
+    """
+    Compiling basic blocks of CHIP-8 code into Python functions.
+    A basic block is a run of straight-line instructions ending with a jump,
+    a skip, a key wait or a draw. Whole block is executed in a single call
+    """
+
+    MAX_BLOCK_LENGTH: int = 64  # Instructions
+
+    memory: 'Chip8Memory'
+    templates: dict[str, str]  # Strict or fast, same as the interpreter
+    blocks: dict[int, CompiledBlock | None]  # Start address -> block
+
+    def __init__(self, memory: 'Chip8Memory', *, strict: bool = True) -> None:
+        self.memory = memory
+        self.templates = STRAIGHT_LINE_TEMPLATES if strict else FAST_TEMPLATES
+        self.blocks = {}
+
+        self.memory.add_write_listener(self.invalidate)
+
+    def get_block(self, address: int) -> CompiledBlock | None:
+        """
+        Returning compiled block starting at address, None if the first
+        instruction there can't be compiled and must be interpreted
+        """
+        try:
+            return self.blocks[address]
+        except KeyError:
+            block = self.blocks[address] = self.compile_block(address)
+            return block
+
+    def invalidate(self, address: int, length: int) -> None:
+        # Dropping every block overlapping the written range
+        stale_blocks = [
+            start
+            for start, block in self.blocks.items()
+            if (
+                block is None and address - 1 <= start < address + length
+            ) or (
+                block is not None
+                and block.start < address + length
+                and address < block.end
+            )
+        ]
+        for start in stale_blocks:
+            del self.blocks[start]
+
+    def compile_block(self, start: int) -> CompiledBlock | None:
+        lines: list[str] = []
+        terminated = False
+
+        address = start
+        data = self.memory.data
+        while not terminated and address + 1 < len(data):
+            opcode = (data[address] << 8) | data[address + 1]
+            handler_name, operands = DECODE_TABLE[opcode]
+            arguments = ', '.join(str(operand) for operand in operands)
+
+            if handler_name in BLOCK_TERMINATORS:
+                # Counter is updated before the handler, same as in Chip8.tick
+                address += 2
+                lines.extend((
+                    f'chip.counter = {address:#05x}',
+                    f'chip.{handler_name}({arguments})',
+                ))
+                terminated = True
+
+            # Unknown opcodes are left to the interpreter to report them
+            elif handler_name in self.templates:
+                template = self.templates[handler_name]
+                lines.extend(template.format(*operands).splitlines())
+                address += 2
+
+                if (address - start) // 2 >= self.MAX_BLOCK_LENGTH:
+                    break
+            else:
+                break
+
+        # Nothing to compile, first instruction must be interpreted
+        if address == start:
+            return None
+
+        if not terminated:
+            lines.append(f'chip.counter = {address:#05x}')
+
+        function_name = f'block_{start:03x}'
+        body = '\n'.join(f'    {line}' for line in lines)
+        source = (
+            f'def {function_name}(chip):\n'
+            f'    v = chip.registers.v\n'
+            f'{body}\n'
+        )
+
+        namespace = {'parse_byte': parse_byte}
+        code = compile(source, f'<chip8 block {start:#05x}>', 'exec')
+        exec(code, namespace)  # noqa: S102
+
+        return CompiledBlock(start, address, source, namespace[function_name])
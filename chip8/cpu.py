@@ -1,9 +1,23 @@
+from pathlib import Path
+
+from .compiler import BlockCompiler
+from .decoder import Handler, Operands, build_dispatch_table
 from .display import Chip8Display
 from .errors import Chip8Panic
+from .export import FrameExporter
+from .idle import IdleLoopDetector
 from .input import Chip8Keyboard
-from .memory import Chip8Memory
+from .memory import Chip8Memory, FastMemory
+from .profiler import Chip8Profiler
+from .recording import InputRecorder, ReplayKeyboard, read_input_log
+from .render import RenderThread
+from .rewind import RewindBuffer
+from .scheduler import Chip8Scheduler
+from .state import load_state, save_state
+from .streaming import Address, FrameServer
 from .timers import DelayTimer, SoundTimer
-from .utils import QuartzClock, parse_byte
+from .trace import TraceWriter
+from .utils import mask_byte, parse_byte
 
 
 class Chip8Registers:
@@ -35,11 +49,36 @@ class Chip8Registers:
         return self.i
 
 
-class Chip8(QuartzClock):
+class FastRegisters(Chip8Registers):
+    """
+    Fast mode: decoder only produces indexes 0..F, so they aren't checked,
+    values are masked to the register size instead of panicking
+    """
+
+    def set_v(self, index: int, value: int) -> None:
+        self.v[index] = value & 0xFF
+
+    def get_v(self, index: int) -> int:
+        return self.v[index]
+
+    def set_i(self, value: int) -> None:
+        self.i = mask_byte(value, length=2)
+
+
+class Chip8:  # noqa: PLR0904
     CLOCK_RATE: int = 100  # Hz
 
     PROGRAM_START: int = 0x200
 
+    # Execution engines: interpreting one instruction at a time or
+    # compiling basic blocks into Python functions
+    ENGINES: tuple[str, ...] = ('interpreter', 'compiler')
+
+    # Strict mode panics on invalid register indexes, overflowing values
+    # and memory accesses out of bounds, helping to debug ROMs. Fast mode
+    # skips those checks, masking values and wrapping addresses instead
+    MODES: tuple[str, ...] = ('strict', 'fast')
+
     display: Chip8Display
     keyboard: Chip8Keyboard
     memory: Chip8Memory
@@ -48,191 +87,475 @@ class Chip8(QuartzClock):
     delay_timer: DelayTimer
     sound_timer: SoundTimer
 
-    counter: int
+    scheduler: Chip8Scheduler
+    rewind_buffer: RewindBuffer | None
+    profiler: Chip8Profiler | None
+    trace_writer: TraceWriter | None
+    render_thread: RenderThread | None
 
-    def __init__(self) -> None:
-        super().__init__()
+    counter: int
+    clock_rate: int  # Hz
+
+    mode: str
+    engine: str
+    compiler: BlockCompiler | None
+    idle_loops: IdleLoopDetector | None  # None executes idle loops as is
+
+    # Opcode -> (handler, operands), shared between instances of the class
+    dispatch_table: tuple[tuple[Handler, Operands], ...]
+
+    # Memory address -> decoded instruction, None until it is executed once
+    instruction_cache: list[tuple[Handler, Operands] | None]
+
+    def __init__(  # noqa: PLR0913
+        self,
+        engine: str = 'interpreter',
+        *,
+        clock_rate: int | None = None,
+        timer_rate: int = Chip8Scheduler.FRAME_RATE,
+        instructions_per_frame: int | None = None,
+        turbo: bool = False,
+        skip_idle: bool = True,
+        mode: str = 'strict',
+    ) -> None:
+        if clock_rate is None:
+            clock_rate = self.CLOCK_RATE
+        if clock_rate <= 0:
+            raise ValueError(f'Clock rate must be positive: {clock_rate}')
+        self.clock_rate = clock_rate
+
+        if engine not in self.ENGINES:
+            raise ValueError(f'Unknown execution engine: {engine}')
+        if mode not in self.MODES:
+            raise ValueError(f'Unknown execution mode: {mode}')
+        self.mode = mode
 
         self.display = Chip8Display()
-        self.memory = Chip8Memory()
-        self.registers = Chip8Registers()
-
-        self.delay_timer = DelayTimer()
-        self.sound_timer = SoundTimer()
+        if mode == 'strict':
+            self.memory = Chip8Memory()
+            self.registers = Chip8Registers()
+        else:
+            self.memory = FastMemory()
+            self.registers = FastRegisters()
 
         self.keyboard = Chip8Keyboard()
 
+        self.scheduler = Chip8Scheduler(
+            self,
+            throttle=not turbo,
+            frame_rate=timer_rate,
+            instructions_per_frame=instructions_per_frame,
+        )
+
+        # Timers count down emulated frames
+        self.delay_timer = DelayTimer(self.scheduler)
+        self.sound_timer = SoundTimer(self.scheduler)
+        self.rewind_buffer = None
+        self.profiler = None
+        self.trace_writer = None
+        self.render_thread = None
+
         # Setting CPU counter to the 512th byte on boot
         self.counter = self.PROGRAM_START
 
-    def fetch_opcode(self) -> int:
-        # Since Chip8 uses 2 bytes opcodes, we are reading 2 bytes
-        [ high_byte, low_byte ] = self.memory.read(self.counter, 2)
-
-        # Returning one "16-bit" integer from two read bytes
-        return (high_byte << 8) | low_byte
-
-    def execute_opcode(self, opcode: int) -> None:  # noqa: PLR0912
-        nnn = opcode & 0x0FFF       # Addr: Lowest 12 bits of the opcode
-        n = opcode & 0x000F         # Nibble: Lowest 4 bits of the opcode
-        x = (opcode & 0x0F00) >> 8  # Register X: lower 4 bits of the high byte
-        y = (opcode & 0x00F0) >> 4  # Register Y: upper 4 bits of the high byte
-        kk = opcode & 0x00FF        # Immediate byte: the lowest 8 bits
-
-        # LIST OF IMPLEMENTED OPCODES
-        # https://devernay.free.fr/hacks/chip8/C8TECH10.HTM#3.1
-        match opcode:
-            case 0x00E0:
-                # 00E0 - CLS
-                # Clear the display.
-                self.display.clear()
-
-            case _ if opcode & 0xF000 == 0x1000:
-                # 1nnn - JP addr
-                # Jump to location nnn.
-
-                # The interpreter sets the program counter to nnn.
-                self.counter = nnn
-
-            case _ if opcode & 0xF000 == 0x3000:
-                # 3xkk - SE Vx, byte
-                # Skip next instruction if Vx = kk
-
-                # The interpreter compares register Vx to kk, and if they are
-                # equal, increments the program counter by 2.
-                if self.registers.get_v(x) == kk:
-                    self.counter += 2
-
-            case _ if opcode & 0xF000 == 0x6000:
-                # 6xkk - LD Vx, byte
-                # Set Vx = kk.
-
-                # The interpreter puts the value kk into register Vx.
-                self.registers.set_v(x, kk)
-
-            case _ if opcode & 0xF000 == 0x7000:
-                # 7xkk - ADD Vx, byte
-                # Set Vx = Vx + kk.
-
-                # Adds the value kk to the value of register Vx,
-                # then stores the result in Vx.
-                vx = self.registers.get_v(x)
-                self.registers.set_v(x, vx + kk)
-
-            case _ if opcode & 0xF000 == 0xA000:
-                # Annn - LD I, addr
-                # Set I = nnn.
-
-                # The value of register I is set to nnn.
-                self.registers.set_i(nnn)
-
-            case _ if opcode & 0xF000 == 0xD000:
-                # Dxyn - DRW Vx, Vy, nibble
-                # Display n-byte sprite from memory location I at (Vx, Vy),
-                # set VF = collision.
-
-                # The interpreter reads n bytes from memory, starting at the
-                # address stored in I.These bytes are then displayed as sprites
-                # on screen at coordinates (Vx, Vy). Sprites are XORed onto
-                # the existing screen. If this causes any pixels to be erased,
-                # VF is set to 1, otherwise it is set to 0. If the sprite is
-                # positioned so part of it is outside the coordinates of the
-                # display, it wraps around to the opposite side of the screen.
-                sprite = self.memory.read(self.registers.get_i(), n)
-                x = self.registers.get_v(x)
-                y = self.registers.get_v(y)
-
-                # Rendering the sprite
-                collision_flag = self.display.draw_sprite(sprite, x, y)
-                self.registers.set_v(0xF, int(collision_flag))
-
-            case _ if opcode & 0xF0FF == 0xF007:
-                # Fx07 - LD Vx, DT
-                # Set Vx = delay timer value.
-
-                # The value of DT is placed into Vx.
-                self.registers.set_v(x, self.delay_timer.value)
-
-            case _ if opcode & 0xF0FF == 0xF015:
-                # Fx15 - LD DT, Vx
-                # Set delay timer = Vx.
-
-                # DT is set equal to the value of Vx.
-                self.delay_timer.update(self.registers.get_v(x))
-
-            case _ if opcode & 0xF0FF == 0xF018:
-                # Fx18 - LD ST, Vx
-                # Set sound timer = Vx.
-
-                # ST is set equal to the value of Vx.
-                self.sound_timer.update(self.registers.get_v(x))
-
-            case _ if opcode & 0xF000 == 0x4000:
-                # 4xkk - SNE Vx, byte
-                # Skip next instruction if Vx != kk.
-
-                # The interpreter compares register Vx to kk, and if they are
-                # not equal, increments the program counter by 2.
-                if self.registers.get_v(x) != kk:
-                    self.counter += 2
-
-            case _ if opcode & 0xF00F == 0x8004:
-                # 8xy4 - ADD Vx, Vy
-                # Set Vx = Vx + Vy, set VF = carry.
-
-                # The values of Vx and Vy are added together. If the result
-                # is greater than 8 bits (i.e., > 255,) VF is set to 1,
-                # otherwise 0. Only the lowest 8 bits of the result are kept,
-                # and stored in Vx.
-                vx = self.registers.get_v(x)
-                vy = self.registers.get_v(y)
-                result = vx + vy
-
-                # Store the result in Vx, keeping only the lowest 8 bits
-                self.registers.set_v(x, result & 0xFF)
-
-                # Set VF to 1 if there is a carry, otherwise set it to 0
-                self.registers.set_v(0xF, 1 if result > 0xFF else 0)
-
-            case _ if opcode & 0xF0FF == 0xF00A:
-                # Fx0A - LD Vx, K
-                # Wait for a key press, store the value of the key in Vx.
-
-                # All execution stops until a key is pressed, then the value
-                # of that key is stored in Vx.
-
-                # If key was captured, store the key value in Vx
-                if captured_key := self.keyboard.get_captured_key():
-                    self.registers.set_v(x, captured_key)
-
-                # Keep staying in the same opcode
-                # and wait for a key press to be captured
-                else:
-                    self.counter -= 2  # We decrement to stay in the same opcode
-                    self.keyboard.wait_for_input()
-
-            case _:
-                raise Chip8Panic(f'Unknown opcode "{hex(opcode)}"')
+        self.dispatch_table = build_dispatch_table(type(self))
 
-    def tick(self) -> None:
-        # Fetching opcode and incrementing the counter
-        opcode = self.fetch_opcode()
+        self.instruction_cache = [None] * self.memory.SIZE
+        self.memory.add_write_listener(self.invalidate_instructions)
+
+        self.engine = engine
+        self.compiler = None
+        if engine == 'compiler':
+            self.compiler = BlockCompiler(
+                self.memory, strict=mode == 'strict',
+            )
+
+        self.idle_loops = None
+        if skip_idle:
+            self.idle_loops = IdleLoopDetector(self.memory)
+
+    def fetch_opcode(self) -> int:
+        # Since Chip8 uses 2 bytes opcodes, we are reading one big-endian
+        # "16-bit" word without copying memory
+        return self.memory.read_word(self.counter)
+
+    def fetch_instruction(self) -> tuple[Handler, Operands]:
+        # Decoding instruction under the counter only once, following
+        # executions are served from the cache until memory is overwritten
+        try:
+            instruction = self.instruction_cache[self.counter]
+        except IndexError:
+            instruction = None
+            # Fast mode wraps the counter around memory, strict one panics
+            # reading the opcode
+            if self.mode == 'fast':
+                self.counter &= FastMemory.ADDRESS_MASK
+                instruction = self.instruction_cache[self.counter]
+
+        if instruction is None:
+            instruction = self.dispatch_table[self.fetch_opcode()]
+            self.instruction_cache[self.counter] = instruction
+
+        return instruction
+
+    def invalidate_instructions(self, address: int, length: int) -> None:
+        # Instruction starting one byte before the written range overlaps it
+        start = max(address - 1, 0)
+        end = min(address + length, len(self.instruction_cache))
+        if start < end:
+            self.instruction_cache[start:end] = [None] * (end - start)
+
+    def execute_opcode(self, opcode: int) -> None:
+        # Every opcode is already decoded into its handler and operands
+        handler, operands = self.dispatch_table[opcode]
+        handler(self, *operands)
+
+    # LIST OF IMPLEMENTED OPCODES
+    # https://devernay.free.fr/hacks/chip8/C8TECH10.HTM#3.1
+    # Opcodes are mapped to these handlers by chip8.decoder.OPCODE_PATTERNS
+
+    def op_00e0(self) -> None:
+        # 00E0 - CLS
+        # Clear the display.
+        self.display.clear()
+
+    def op_1nnn(self, nnn: int) -> None:
+        # 1nnn - JP addr
+        # Jump to location nnn.
+
+        # The interpreter sets the program counter to nnn.
+        self.counter = nnn
+
+    def op_3xkk(self, x: int, kk: int) -> None:
+        # 3xkk - SE Vx, byte
+        # Skip next instruction if Vx = kk
+
+        # The interpreter compares register Vx to kk, and if they are
+        # equal, increments the program counter by 2.
+        if self.registers.get_v(x) == kk:
+            self.counter += 2
+
+    def op_4xkk(self, x: int, kk: int) -> None:
+        # 4xkk - SNE Vx, byte
+        # Skip next instruction if Vx != kk.
+
+        # The interpreter compares register Vx to kk, and if they are
+        # not equal, increments the program counter by 2.
+        if self.registers.get_v(x) != kk:
+            self.counter += 2
+
+    def op_6xkk(self, x: int, kk: int) -> None:
+        # 6xkk - LD Vx, byte
+        # Set Vx = kk.
+
+        # The interpreter puts the value kk into register Vx.
+        self.registers.set_v(x, kk)
+
+    def op_7xkk(self, x: int, kk: int) -> None:
+        # 7xkk - ADD Vx, byte
+        # Set Vx = Vx + kk.
+
+        # Adds the value kk to the value of register Vx,
+        # then stores the result in Vx.
+        vx = self.registers.get_v(x)
+        self.registers.set_v(x, vx + kk)
+
+    def op_8xy4(self, x: int, y: int) -> None:
+        # 8xy4 - ADD Vx, Vy
+        # Set Vx = Vx + Vy, set VF = carry.
+
+        # The values of Vx and Vy are added together. If the result
+        # is greater than 8 bits (i.e., > 255,) VF is set to 1,
+        # otherwise 0. Only the lowest 8 bits of the result are kept,
+        # and stored in Vx.
+        vx = self.registers.get_v(x)
+        vy = self.registers.get_v(y)
+        result = vx + vy
+
+        # Store the result in Vx, keeping only the lowest 8 bits
+        self.registers.set_v(x, result & 0xFF)
+
+        # Set VF to 1 if there is a carry, otherwise set it to 0
+        self.registers.set_v(0xF, 1 if result > 0xFF else 0)
+
+    def op_annn(self, nnn: int) -> None:
+        # Annn - LD I, addr
+        # Set I = nnn.
+
+        # The value of register I is set to nnn.
+        self.registers.set_i(nnn)
+
+    def op_dxyn(self, x: int, y: int, n: int) -> None:
+        # Dxyn - DRW Vx, Vy, nibble
+        # Display n-byte sprite from memory location I at (Vx, Vy),
+        # set VF = collision.
+
+        # The interpreter reads n bytes from memory, starting at the
+        # address stored in I.These bytes are then displayed as sprites
+        # on screen at coordinates (Vx, Vy). Sprites are XORed onto
+        # the existing screen. If this causes any pixels to be erased,
+        # VF is set to 1, otherwise it is set to 0. If the sprite is
+        # positioned so part of it is outside the coordinates of the
+        # display, it wraps around to the opposite side of the screen.
+        sprite = self.memory.view(self.registers.get_i(), n)
+        x = self.registers.get_v(x)
+        y = self.registers.get_v(y)
+
+        # Rendering the sprite
+        collision_flag = self.display.draw_sprite(sprite, x, y)
+        self.registers.set_v(0xF, int(collision_flag))
+
+    def op_ex9e(self, x: int) -> None:
+        # Ex9E - SKP Vx
+        # Skip next instruction if key with the value of Vx is pressed.
+
+        # Checks the keyboard, and if the key corresponding to the value
+        # of Vx is currently in the down position, PC is increased by 2.
+        if self.keyboard.is_pressed(self.registers.get_v(x) & 0xF):
+            self.counter += 2
+
+    def op_exa1(self, x: int) -> None:
+        # ExA1 - SKNP Vx
+        # Skip next instruction if key with the value of Vx is not pressed.
+
+        # Checks the keyboard, and if the key corresponding to the value
+        # of Vx is currently in the up position, PC is increased by 2.
+        if not self.keyboard.is_pressed(self.registers.get_v(x) & 0xF):
+            self.counter += 2
+
+    def op_fx07(self, x: int) -> None:
+        # Fx07 - LD Vx, DT
+        # Set Vx = delay timer value.
+
+        # The value of DT is placed into Vx.
+        self.registers.set_v(x, self.delay_timer.value)
+
+    def op_fx0a(self, x: int) -> None:
+        # Fx0A - LD Vx, K
+        # Wait for a key press, store the value of the key in Vx.
+
+        # All execution stops until a key is pressed, then the value
+        # of that key is stored in Vx.
+
+        # If key was captured, store the key value in Vx
+        if (captured_key := self.keyboard.get_captured_key()) is not None:
+            self.registers.set_v(x, captured_key)
+
+        # Keep staying in the same opcode
+        # and wait for a key press to be captured
+        else:
+            self.counter -= 2  # We decrement to stay in the same opcode
+            self.keyboard.wait_for_input()
+
+    def op_fx15(self, x: int) -> None:
+        # Fx15 - LD DT, Vx
+        # Set delay timer = Vx.
+
+        # DT is set equal to the value of Vx.
+        self.delay_timer.update(self.registers.get_v(x))
+
+    def op_fx18(self, x: int) -> None:
+        # Fx18 - LD ST, Vx
+        # Set sound timer = Vx.
+
+        # ST is set equal to the value of Vx.
+        self.sound_timer.update(self.registers.get_v(x))
+
+    def op_unknown(self, opcode: int) -> None:  # noqa: PLR6301
+        raise Chip8Panic(f'Unknown opcode "{hex(opcode)}"')
+
+    def step(self) -> None:
+        # Fetching decoded instruction and incrementing the counter
+        handler, operands = self.fetch_instruction()
         self.counter += 2
 
-        # Executing opcode
-        self.execute_opcode(opcode)
+        # Executing instruction
+        handler(self, *operands)
+
+    def run_cycles(self, cycles: int) -> None:
+        """
+        Executing given amount of instructions without rendering.
+        Compiled blocks are used when they fit into remaining cycles,
+        the interpreter executes everything else. Idle loop the frame
+        starts in is skipped as far as the frame lasts
+        """
+        if self.idle_loops is not None:
+            cycles = self.idle_loops.run_idle(self, cycles)
+
+        if self.compiler is None:
+            for _ in range(cycles):
+                self.step()
+            return
+
+        get_block = self.compiler.get_block
+        while cycles > 0:
+            block = get_block(self.counter)
+            if block is None or block.length > cycles:
+                self.step()
+                cycles -= 1
+            else:
+                block.function(self)
+                cycles -= block.length
+
+    def tick(self) -> None:
+        self.step()
 
         # Rendering VRAM on screen
         self.display.render()
 
-    def run(self) -> None:
-        while True:
-            # Syncronizing timers clock
-            self.delay_timer.synchronize()
-            # self.sound_timer.synchronize()
-
-            # Synchonizing keyboard clock
-            self.keyboard.synchronize()
-
-            # Synchronizing CPU clock
-            self.synchronize()
+    def snapshot(self) -> bytes:
+        """Saving full machine state, see chip8.state for the format"""
+        return save_state(self)
+
+    def restore(self, state: bytes) -> None:
+        load_state(self, state)
+
+    def enable_rewind(
+        self,
+        max_bytes: int = RewindBuffer.DEFAULT_MAX_BYTES,
+        keyframe_interval: int = RewindBuffer.DEFAULT_KEYFRAME_INTERVAL,
+    ) -> RewindBuffer:
+        """Capturing machine state at the end of every frame from now on"""
+        if self.rewind_buffer is None:
+            self.rewind_buffer = RewindBuffer(
+                self, max_bytes, keyframe_interval,
+            )
+            self.scheduler.frame_listeners.append(self.rewind_buffer.capture)
+
+        return self.rewind_buffer
+
+    def rewind(self, frames: int) -> int:
+        """Stepping given amount of frames back, returns frames rewound"""
+        if self.rewind_buffer is None:
+            raise RuntimeError('Rewind is not enabled')
+
+        return self.rewind_buffer.rewind(frames)
+
+    def enable_profiling(self) -> Chip8Profiler:
+        """
+        Counting time per opcode class and address, render and keyboard.
+        Machine is only slowed down while profiling is enabled
+        """
+        if self.profiler is None:
+            self.profiler = Chip8Profiler(self)
+            self.profiler.install()
+
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        if self.profiler is not None:
+            self.profiler.uninstall()
+            self.profiler = None
+
+    def enable_tracing(self, path: str | Path) -> TraceWriter:
+        """Writing a binary record of every executed instruction to path"""
+        if self.trace_writer is None:
+            self.trace_writer = TraceWriter(self, path)
+            self.trace_writer.install()
+
+        return self.trace_writer
+
+    def disable_tracing(self) -> None:
+        if self.trace_writer is not None:
+            self.trace_writer.close()
+            self.trace_writer = None
+
+    def enable_render_thread(
+        self,
+        fps: int = RenderThread.DEFAULT_FPS,
+    ) -> RenderThread:
+        """Rendering from a separate thread, capped at fps"""
+        if self.render_thread is None:
+            self.render_thread = RenderThread(self.display, fps)
+            self.render_thread.start()
+
+        return self.render_thread
+
+    def disable_render_thread(self) -> None:
+        if self.render_thread is not None:
+            self.render_thread.stop()
+            self.render_thread = None
+
+    def export_frames(
+        self,
+        path: str | Path,
+        export_format: str = 'png',
+        scale: int = 1,
+        fps: int | None = None,
+    ) -> FrameExporter:
+        """Writing frames as images to a directory, or raw RGB to a file"""
+        return FrameExporter(self, path, export_format, scale, fps)
+
+    def serve_frames(self, address: Address) -> FrameServer:
+        """Streaming every changed frame to viewers connected to address"""
+        return FrameServer(self, address)
+
+    def record_input(self, path: str | Path) -> InputRecorder:
+        """Logging every captured key with its emulated cycle"""
+        return InputRecorder(self, path)
+
+    def replay_input(self, path: str | Path) -> ReplayKeyboard:
+        """Replacing the terminal keyboard with keys replayed from a log"""
+        keyboard = ReplayKeyboard(
+            read_input_log(path), lambda: self.scheduler.cycles,
+        )
+        keyboard.pressed_keys = self.keyboard.pressed_keys
+        keyboard.waiting_for_input = self.keyboard.waiting_for_input
+        keyboard.captured_key = self.keyboard.captured_key
+
+        self.keyboard = keyboard
+        return keyboard
+
+    @property
+    def turbo(self) -> bool:
+        """Turbo mode runs as fast as the host allows"""
+        return not self.scheduler.throttle
+
+    @turbo.setter
+    def turbo(self, enabled: bool) -> None:
+        # Takes effect on the next frame, even while the machine is running
+        self.scheduler.throttle = not enabled
+
+    def toggle_turbo(self) -> bool:
+        self.turbo = not self.turbo
+        return self.turbo
+
+    @property
+    def instructions_per_second(self) -> float:
+        """Instructions per second actually reached by the last run"""
+        return self.scheduler.instructions_per_second
+
+    def run(
+        self,
+        frames: int | None = None,
+        *,
+        throttle: bool | None = None,
+    ) -> None:
+        """
+        Running the machine frame by frame, forever if frames is None.
+        Unthrottled run ignores wall time and is fully reproducible
+        """
+        if throttle is not None:
+            self.scheduler.throttle = throttle
+
+        # Terminal stays in cbreak mode for the whole run
+        self.keyboard.start()
+        try:
+            self.scheduler.run(frames)
+        finally:
+            self.keyboard.stop()
+
+    async def run_async(
+        self,
+        frames: int | None = None,
+        *,
+        throttle: bool | None = None,
+    ) -> None:
+        """
+        Running the machine as a coroutine, many machines can share a single
+        event loop. Terminal isn't read, keys are queued by the host with
+        keyboard.queue_key
+        """
+        if throttle is not None:
+            self.scheduler.throttle = throttle
+        await self.scheduler.run_async(frames)
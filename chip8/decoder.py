@@ -0,0 +1,123 @@
+from collections.abc import Callable
+from functools import cache
+
+Operands = tuple[int, ...]
+Handler = Callable[..., None]
+
+
+def _no_operands(_opcode: int) -> Operands:
+    return ()
+
+
+def _nnn(opcode: int) -> Operands:
+    # Addr: Lowest 12 bits of the opcode
+    return (opcode & 0x0FFF,)
+
+
+def _x(opcode: int) -> Operands:
+    # Register X: lower 4 bits of the high byte
+    return ((opcode & 0x0F00) >> 8,)
+
+
+def _x_kk(opcode: int) -> Operands:
+    # Register X and immediate byte: the lowest 8 bits
+    return (opcode & 0x0F00) >> 8, opcode & 0x00FF
+
+
+def _x_y(opcode: int) -> Operands:
+    # Register X and register Y: upper 4 bits of the low byte
+    return (opcode & 0x0F00) >> 8, (opcode & 0x00F0) >> 4
+
+
+def _x_y_n(opcode: int) -> Operands:
+    # Register X, register Y and nibble: lowest 4 bits of the opcode
+    return (opcode & 0x0F00) >> 8, (opcode & 0x00F0) >> 4, opcode & 0x000F
+
+
+# Opcode patterns in the order they are matched: (mask, value, handler name,
+# operands decoder). Handler names refer to the Chip8 methods executing them
+OPCODE_PATTERNS: tuple[
+    tuple[int, int, str, Callable[[int], Operands]], ...,
+] = (
+    (0xFFFF, 0x00E0, 'op_00e0', _no_operands),
+    (0xF000, 0x1000, 'op_1nnn', _nnn),
+    (0xF000, 0x3000, 'op_3xkk', _x_kk),
+    (0xF000, 0x4000, 'op_4xkk', _x_kk),
+    (0xF000, 0x6000, 'op_6xkk', _x_kk),
+    (0xF000, 0x7000, 'op_7xkk', _x_kk),
+    (0xF00F, 0x8004, 'op_8xy4', _x_y),
+    (0xF000, 0xA000, 'op_annn', _nnn),
+    (0xF000, 0xD000, 'op_dxyn', _x_y_n),
+    (0xF0FF, 0xE09E, 'op_ex9e', _x),
+    (0xF0FF, 0xE0A1, 'op_exa1', _x),
+    (0xF0FF, 0xF007, 'op_fx07', _x),
+    (0xF0FF, 0xF00A, 'op_fx0a', _x),
+    (0xF0FF, 0xF015, 'op_fx15', _x),
+    (0xF0FF, 0xF018, 'op_fx18', _x),
+)
+
+UNKNOWN_OPCODE_HANDLER: str = 'op_unknown'
+
+
+def decode(opcode: int) -> tuple[str, Operands]:
+    """Returning handler name and decoded operands for a single opcode"""
+    for mask, value, handler_name, decode_operands in OPCODE_PATTERNS:
+        if opcode & mask == value:
+            return handler_name, decode_operands(opcode)
+
+    # Unknown opcodes are passed as is, so the handler can report them
+    return UNKNOWN_OPCODE_HANDLER, (opcode,)
+
+
+def _build_decode_table() -> tuple[tuple[str, Operands], ...]:
+    # Opcodes that match no pattern are decoded as unknown ones
+    table: list[tuple[str, Operands]] = [
+        (UNKNOWN_OPCODE_HANDLER, (opcode,)) for opcode in range(0x10000)
+    ]
+
+    # Many opcodes share the same operands, so we keep a single tuple for each
+    # of them instead of allocating 65536 separate ones
+    interned: dict[Operands, Operands] = {}
+
+    # Filling patterns in reverse order, so earlier patterns win the same way
+    # they do in decode(). Only opcodes matching the pattern are visited:
+    # we enumerate every combination of the bits not covered by the mask
+    for mask, value, handler_name, decode_operands in reversed(
+        OPCODE_PATTERNS,
+    ):
+        free_bits = ~mask & 0xFFFF
+        bits = free_bits
+        while True:
+            opcode = value | bits
+            operands = decode_operands(opcode)
+            operands = interned.setdefault(operands, operands)
+            table[opcode] = handler_name, operands
+
+            if bits == 0:
+                break
+            bits = (bits - 1) & free_bits
+
+    return tuple(table)
+
+
+# Every possible 16-bit opcode decoded once on import
+DECODE_TABLE: tuple[tuple[str, Operands], ...] = _build_decode_table()
+
+
+@cache
+def build_dispatch_table(
+    cpu_class: type,
+) -> tuple[tuple[Handler, Operands], ...]:
+    """
+    Mapping every opcode to the handler of cpu_class and its decoded operands.
+    Table is built once per class and shared by all of its instances
+    """
+    handlers = {
+        name: getattr(cpu_class, name)
+        for name in {name for name, _ in DECODE_TABLE}
+    }
+
+    return tuple(
+        (handlers[handler_name], operands)
+        for handler_name, operands in DECODE_TABLE
+    )
@@ -0,0 +1,232 @@
+from .decoder import DECODE_TABLE, UNKNOWN_OPCODE_HANDLER
+
+# Bumped whenever decoding or the analysis changes its output, cached
+# disassembly of older versions is ignored
+DECODER_VERSION: int = 2
+
+
+def get_opcode_name(opcode: int) -> str:
+    nnn = opcode & 0x0FFF       # Addr: Lowest 12 bits of the opcode
+    n = opcode & 0x000F         # Nibble: Lowest 4 bits of the opcode
+    x = (opcode & 0x0F00) >> 8       # Register X: lower 4 bits of the high byte
+    y = (opcode & 0x00F0) >> 4       # Register Y: upper 4 bits of the high byte
+    kk = opcode & 0x00FF        # Immediate byte: the lowest 8 bits
+
+    match opcode:
+        case 0x00E0:
+            return '00E0 - CLS'
+        case _ if opcode & 0xF000 == 0x1000:
+            return f'1nnn - JP {nnn:04x}'
+        case _ if opcode & 0xF000 == 0x3000:
+            return f'3xkk - SE V{x}, {kk}'
+        case _ if opcode & 0xF000 == 0x4000:
+            return f'4xkk - SNE V{x}, {kk}'
+        case _ if opcode & 0xF000 == 0x6000:
+            return f'6xkk - LD V{x}, {kk}'
+        case _ if opcode & 0xF000 == 0x7000:
+            return f'7xkk - ADD V{x}, {kk}'
+        case _ if opcode & 0xF00F == 0x8004:
+            return f'8xy4 - ADD V{x}, V{y}'
+        case _ if opcode & 0xF000 == 0xA000:
+            return f'Annn - LD I, {nnn}'
+        case _ if opcode & 0xF000 == 0xD000:
+            return f'Dxyn - DRW V{x}, V{y}, {n}'
+        case _ if opcode & 0xF0FF == 0xE09E:
+            return f'Ex9E - SKP V{x}'
+        case _ if opcode & 0xF0FF == 0xE0A1:
+            return f'ExA1 - SKNP V{x}'
+        case _ if opcode & 0xF0FF == 0xF007:
+            return f'Fx07 - LD V{x}, DT'
+        case _ if opcode & 0xF0FF == 0xF00A:
+            return f'Fx0A - LD V{x}, K'
+        case _ if opcode & 0xF0FF == 0xF015:
+            return f'Fx15 - LD DT, V{x}'
+        case _ if opcode & 0xF0FF == 0xF018:
+            return f'Fx18 - LD ST, V{x}'
+        case _:
+            return f'Unknown opcode: "{hex(opcode)}"'
+
+
+def read_opcode(opcode: int) -> str:
+    """
+    Read opcode and return its string representation.
+    """
+    # Convert the opcode to a 4-digit hexadecimal string
+    hex_opcode = f'{opcode:04X}'
+
+    # # Split the opcode into its components
+    nibbles = [ hex_opcode[i : i + 2] for i in range(0, len(hex_opcode), 2) ]
+
+    # Format the opcode as a string
+    return '0x' + ' '.join(nibbles)
+
+
+# Instructions changing control flow, see ControlFlowGraph
+JUMPS: frozenset[str] = frozenset({'op_1nnn'})
+SKIPS: frozenset[str] = frozenset({
+    'op_3xkk', 'op_4xkk', 'op_ex9e', 'op_exa1',
+})
+
+
+class BasicBlock:
+    start: int  # Address of the first instruction
+    end: int  # Address right after the last instruction
+    successors: list[int]  # Start addresses of blocks reachable from it
+
+    def __init__(self, start: int, end: int, successors: list[int]) -> None:
+        self.start = start
+        self.end = end
+        self.successors = successors
+
+
+class ControlFlowGraph:
+    """
+    Recursive-descent analysis of a ROM: starting at the entry point and
+    following jumps and skips, so only reachable bytes are treated as code.
+    Everything else, e.g. sprites embedded between routines, is data
+    """
+
+    rom: bytes
+    origin: int  # Address ROM is loaded at
+
+    instructions: dict[int, int]  # Address -> opcode of reachable code
+    labels: set[int]  # Jump and skip targets
+    blocks: dict[int, BasicBlock]  # Start address -> block
+
+    def __init__(self, rom: bytes, origin: int = 0x200) -> None:
+        self.rom = rom
+        self.origin = origin
+
+        self.instructions = {}
+        self.labels = set()
+        self.blocks = {}
+
+        self.explore()
+        self.build_blocks()
+
+    @property
+    def end(self) -> int:
+        return self.origin + len(self.rom)
+
+    def read_opcode(self, address: int) -> int | None:
+        # Odd-length ROMs may end with half of an instruction
+        offset = address - self.origin
+        if not 0 <= offset < len(self.rom) - 1:
+            return None
+        return (self.rom[offset] << 8) | self.rom[offset + 1]
+
+    def successors(  # noqa: PLR6301
+        self, address: int, opcode: int,
+    ) -> list[int]:
+        handler_name, operands = DECODE_TABLE[opcode]
+
+        if handler_name in JUMPS:
+            return [operands[0]]
+        if handler_name in SKIPS:
+            return [address + 2, address + 4]
+        # Code can't be decoded any further, following bytes may be data
+        if handler_name == UNKNOWN_OPCODE_HANDLER:
+            return []
+        return [address + 2]
+
+    def explore(self) -> None:
+        pending = [self.origin]
+        while pending:
+            address = pending.pop()
+            if address in self.instructions:
+                continue
+
+            opcode = self.read_opcode(address)
+            if opcode is None:
+                continue
+            self.instructions[address] = opcode
+
+            handler_name = DECODE_TABLE[opcode][0]
+            successors = self.successors(address, opcode)
+            if handler_name in JUMPS or handler_name in SKIPS:
+                self.labels.update(successors)
+
+            pending.extend(successors)
+
+    def build_blocks(self) -> None:
+        # Blocks start at the entry point, at every label and right after
+        # each instruction changing control flow
+        leaders = {self.origin} | self.labels
+        for address, opcode in self.instructions.items():
+            if DECODE_TABLE[opcode][0] in JUMPS | SKIPS:
+                leaders.add(address + 2)
+
+        for start in sorted(leaders & self.instructions.keys()):
+            address = start
+            while True:
+                opcode = self.instructions[address]
+                handler_name = DECODE_TABLE[opcode][0]
+                successors = self.successors(address, opcode)
+                address += 2
+
+                if handler_name in JUMPS or handler_name in SKIPS:
+                    break
+                if address in leaders or address not in self.instructions:
+                    break
+
+            self.blocks[start] = BasicBlock(start, address, [
+                successor
+                for successor in successors
+                if successor in self.instructions
+            ])
+
+    def listing(self) -> list[str]:
+        """Disassembly with labels, unreachable bytes are dumped as data"""
+        lines: list[str] = []
+
+        address = self.origin
+        while address < self.end:
+            if address in self.labels:
+                lines.append(f'L{address:04x}:')
+
+            if address in self.instructions:
+                opcode = self.instructions[address]
+                opcode_name = get_opcode_name(opcode)
+                lines.append(f'{address:04x}: {opcode:04x} — {opcode_name}')
+                address += 2
+            else:
+                byte = self.rom[address - self.origin]
+                lines.append(f'{address:04x}: {byte:02x}   — data {byte:08b}')
+                address += 1
+
+        return lines
+
+    def to_json(self) -> dict:
+        code = set()
+        for address in self.instructions:
+            code.update((address, address + 1))
+
+        return {
+            'origin': self.origin,
+            'size': len(self.rom),
+            'entry': self.origin,
+            'labels': sorted(self.labels),
+            'blocks': [
+                {
+                    'start': block.start,
+                    'end': block.end,
+                    'successors': block.successors,
+                    'instructions': [
+                        {
+                            'address': address,
+                            'opcode': self.instructions[address],
+                            'mnemonic': get_opcode_name(
+                                self.instructions[address],
+                            ),
+                        }
+                        for address in range(block.start, block.end, 2)
+                    ],
+                }
+                for block in self.blocks.values()
+            ],
+            'data': [
+                address
+                for address in range(self.origin, self.end)
+                if address not in code
+            ],
+        }
@@ -1,14 +1,94 @@
+import sys
+from collections.abc import Iterator
+
+# Each byte of a packed row unpacked into 8 pixels of 0/1, MSB first
+BYTE_PIXELS: tuple[bytes, ...] = tuple(
+    bytes((byte >> (7 - bit)) & 1 for bit in range(8)) for byte in range(256)
+)
+
+
+class Chip8PixelRow:
+    """
+    View of a single packed display row as a sequence of 0/1 pixels.
+    Reads and writes go straight to the packed row of the display
+    """
+
+    display: 'Chip8Display'
+    y: int
+
+    def __init__(self, display: 'Chip8Display', y: int) -> None:
+        self.display = display
+        self.y = y
+
+    def __len__(self) -> int:
+        return self.display.WIDTH
+
+    def __bytes__(self) -> bytes:
+        row = self.display.rows[self.y]
+        return b''.join(
+            BYTE_PIXELS[(row >> shift) & 0xFF] for shift in range(56, -8, -8)
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(bytes(self))
+
+    def __getitem__(self, x: int | slice) -> int | bytearray:
+        if isinstance(x, slice):
+            return bytearray(bytes(self)[x])
+
+        x = range(self.display.WIDTH)[x]  # Validating and resolving index
+        return (self.display.rows[self.y] >> (self.display.WIDTH - 1 - x)) & 1
+
+    def __setitem__(self, x: int, pixel: int) -> None:
+        x = range(self.display.WIDTH)[x]
+        bit = 1 << (self.display.WIDTH - 1 - x)
+
+        row = self.display.rows[self.y]
+        self.display.rows[self.y] = row | bit if pixel else row & ~bit
+        self.display.dirty_rows |= 1 << self.y
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (bytes, bytearray, Chip8PixelRow)):
+            return bytes(self) == bytes(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
 class Chip8Display:
     WIDTH: int = 64
     HEIGHT: int = 32
+    ROW_MASK: int = (1 << WIDTH) - 1
 
     ASCII_CLEAR: str = '\033[H'
+    ASCII_MOVE_TO_ROW: str = '\033[{row};1H'  # Rows are numbered from 1
     PIXEL_CHAR: str = '▓'
 
-    pixels: list[bytearray]
+    # One 64-bit integer per row, the most significant bit is the x = 0 pixel
+    rows: list[int]
+
+    # Bitmask of rows changed since the last render, bit N is row N
+    dirty_rows: int
+    # Whole frame is printed on the first render, only dirty rows afterwards
+    full_redraw: bool
+
+    # Each byte of a packed row rendered into 8 terminal characters
+    byte_chars: tuple[str, ...]
 
     def __init__(self) -> None:
-        self.clear()
+        self.rows = [0] * self.HEIGHT
+        self.dirty_rows = 0
+        self.full_redraw = True
+
+        self.byte_chars = tuple(
+            ''.join(self.PIXEL_CHAR if pixel else ' ' for pixel in pixels)
+            for pixels in BYTE_PIXELS
+        )
+
+    @property
+    def pixels(self) -> list[Chip8PixelRow]:
+        """Rows of 0/1 pixels, backed by the packed framebuffer"""
+        return [Chip8PixelRow(self, y) for y in range(self.HEIGHT)]
 
     def draw_sprite(
         self,
@@ -23,40 +103,80 @@ class Chip8Display:
         """
         collision_detected = False
 
+        # Sprite is fixed 8 bit width, so it's placed into the leftmost
+        # 8 bits of a row and rotated right by x. Rotation wraps the pixels
+        # going past the right edge to the left side of the screen
+        shift = sprite_x % self.WIDTH
+        wrap_shift = self.WIDTH - shift
+        row_mask = self.ROW_MASK
+        rows = self.rows
+        dirty_rows = self.dirty_rows
+
         for row_index, sprite_byte in enumerate(sprite_data):
-            for bit_index in range(8):  # Sprite is fixed 8 bit width
-                sprite_pixel = (sprite_byte >> (7 - bit_index)) & 1
+            if sprite_byte == 0:
+                continue  # Skip if every pixel is off
+
+            sprite_row = sprite_byte << (self.WIDTH - 8)
+            sprite_row = (
+                (sprite_row >> shift) | (sprite_row << wrap_shift)
+            ) & row_mask
 
-                if sprite_pixel == 0:
-                    continue  # Skip if pixel is off
+            # Wrapping rows vertically
+            dy = (sprite_y + row_index) % self.HEIGHT
 
-                # Wrapping bits horizontally and vertically
-                dx = (sprite_x + bit_index) % self.WIDTH
-                dy = (sprite_y + row_index) % self.HEIGHT
+            # If any sprite pixel is already on, we set collision_detected
+            if rows[dy] & sprite_row:
+                collision_detected = True
 
-                # If pixel is already on, we set collision_detected
-                if self.pixels[dy][dx] == 1:
-                    collision_detected = True
+            # XORing the screen row with sprite row
+            rows[dy] ^= sprite_row
+            dirty_rows |= 1 << dy
 
-                # XORing the screen pixel with sprite pixel
-                self.pixels[dy][dx] ^= sprite_pixel
+        self.dirty_rows = dirty_rows
 
         # If collision is detected, we return glag to set the VF register to 1
         return collision_detected
 
     def clear(self) -> None:
         """Clearing memory and setting it to 0"""
-        self.pixels = [bytearray(self.WIDTH) for _ in range(self.HEIGHT)]
+        for y, row in enumerate(self.rows):
+            if row:
+                self.dirty_rows |= 1 << y
+
+        self.rows[:] = [0] * self.HEIGHT
+
+    def render_row(self, y: int) -> str:
+        row = self.rows[y]
+        byte_chars = self.byte_chars
+        return ''.join(
+            byte_chars[(row >> shift) & 0xFF] for shift in range(56, -8, -8)
+        )
 
     def render(self) -> None:
-        """Rendering display memory to the screen"""
-        print(self.ASCII_CLEAR, end='')  # ANSI clear screen
+        """
+        Rendering display memory to the screen. Only rows changed since
+        the last render are written, nothing at all if the frame is the same
+        """
+        if self.full_redraw:
+            # Rendering each row in a new line except the last one
+            buffer = '\n'.join(self.render_row(y) for y in range(self.HEIGHT))
+            output = self.ASCII_CLEAR + buffer  # Moving cursor home first
+
+            self.full_redraw = False
+
+        elif self.dirty_rows:
+            # Moving cursor to each changed row and rewriting it
+            output = ''.join(
+                self.ASCII_MOVE_TO_ROW.format(row=y + 1) + self.render_row(y)
+                for y in range(self.HEIGHT)
+                if self.dirty_rows >> y & 1
+            )
+
+        else:
+            return
 
-        # Rendering all pixels into buffer list
-        buffer: list[str] = []
-        for row in self.pixels:
-            row_pixels = [self.PIXEL_CHAR if pixel else ' ' for pixel in row]
-            buffer.append(''.join(row_pixels))
+        self.dirty_rows = 0
 
-        # Rendering each row in a new line except the last one
-        print('\n'.join(buffer), end='')
+        # Single buffered write per frame
+        sys.stdout.write(output)
+        sys.stdout.flush()
@@ -0,0 +1,204 @@
+import struct
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from .display import BYTE_PIXELS, Chip8Display
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+
+Color = tuple[int, int, int]
+
+PNG_SIGNATURE: bytes = b'\x89PNG\r\n\x1a\n'
+PNG_HEADER = struct.Struct('>IIBBBBB')  # Size, bit depth, RGB, no interlace
+PNG_CHUNK = struct.Struct('>I')
+
+
+class FrameEncoder:
+    """
+    Encoding packed display rows into scaled RGB images. Each byte of a row
+    is looked up as 8 already scaled pixels, each scaled row is repeated
+    vertically, so no Python code runs per pixel. Unchanged frames aren't
+    encoded again
+    """
+
+    EXTENSION: str = 'rgb'
+
+    scale: int
+    width: int
+    height: int
+
+    byte_lines: tuple[bytes, ...]  # Byte of a row -> 8 scaled RGB pixels
+    row_lines: dict[int, bytes]  # Packed row -> scaled RGB scanline
+
+    last_rows: tuple[int, ...] | None
+    last_frame: bytes
+
+    MAX_CACHED_ROWS: int = 4096
+
+    def __init__(
+        self,
+        scale: int = 1,
+        foreground: Color = (0xFF, 0xFF, 0xFF),
+        background: Color = (0x00, 0x00, 0x00),
+    ) -> None:
+        if scale <= 0:
+            raise ValueError(f'Scale must be positive: {scale}')
+
+        self.scale = scale
+        self.width = Chip8Display.WIDTH * scale
+        self.height = Chip8Display.HEIGHT * scale
+
+        pixel_on = bytes(foreground) * scale
+        pixel_off = bytes(background) * scale
+        self.byte_lines = tuple(
+            b''.join(pixel_on if pixel else pixel_off for pixel in pixels)
+            for pixels in BYTE_PIXELS
+        )
+        self.row_lines = {}
+
+        self.last_rows = None
+        self.last_frame = b''
+
+    def scale_row(self, row: int) -> bytes:
+        line = self.row_lines.get(row)
+        if line is None:
+            # Games draw the same rows over and over, but not unlimited
+            if len(self.row_lines) >= self.MAX_CACHED_ROWS:
+                self.row_lines.clear()
+
+            line = b''.join(
+                map(self.byte_lines.__getitem__, row.to_bytes(8, 'big')),
+            )
+            self.row_lines[row] = line
+        return line
+
+    def encode(self, rows: list[int] | tuple[int, ...]) -> bytes:
+        rows = tuple(rows)
+        if rows != self.last_rows:
+            self.last_rows = rows
+            self.last_frame = self.encode_frame(rows)
+        return self.last_frame
+
+    def encode_frame(self, rows: tuple[int, ...]) -> bytes:
+        """Raw RGB, 3 bytes per pixel, top to bottom"""
+        scale = self.scale
+        return b''.join(self.scale_row(row) * scale for row in rows)
+
+
+class PpmEncoder(FrameEncoder):
+    EXTENSION: str = 'ppm'
+
+    def encode_frame(self, rows: tuple[int, ...]) -> bytes:
+        header = f'P6\n{self.width} {self.height}\n255\n'.encode('ascii')
+        return header + super().encode_frame(rows)
+
+
+class PngEncoder(FrameEncoder):
+    EXTENSION: str = 'png'
+    COMPRESSION_LEVEL: int = 1
+
+    @staticmethod
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return b''.join((
+            PNG_CHUNK.pack(len(data)),
+            kind,
+            data,
+            PNG_CHUNK.pack(zlib.crc32(kind + data)),
+        ))
+
+    def encode_frame(self, rows: tuple[int, ...]) -> bytes:
+        # Every scanline starts with a filter type, 0 is no filtering
+        scale = self.scale
+        scanlines = b''.join(
+            (b'\x00' + self.scale_row(row)) * scale for row in rows
+        )
+
+        header = PNG_HEADER.pack(self.width, self.height, 8, 2, 0, 0, 0)
+        return b''.join((
+            PNG_SIGNATURE,
+            self.chunk(b'IHDR', header),
+            self.chunk(
+                b'IDAT', zlib.compress(scanlines, self.COMPRESSION_LEVEL),
+            ),
+            self.chunk(b'IEND', b''),
+        ))
+
+
+ENCODERS: dict[str, type[FrameEncoder]] = {
+    'raw': FrameEncoder,
+    'ppm': PpmEncoder,
+    'png': PngEncoder,
+}
+
+
+class FrameExporter:
+    """
+    Writing every emulated frame headless: raw RGB frames appended to a
+    single file or pipe, e.g. for ffmpeg, or an image sequence in a directory
+    """
+
+    chip: 'Chip8'
+    encoder: FrameEncoder
+    path: Path
+    fps: int  # Frames exported per emulated second
+    frame_rate: int  # Frames emulated per second
+    stream: BinaryIO | None  # Raw frames only
+    frames_exported: int
+
+    def __init__(
+        self,
+        chip: 'Chip8',
+        path: str | Path,
+        export_format: str = 'png',
+        scale: int = 1,
+        fps: int | None = None,
+    ) -> None:
+        if export_format not in ENCODERS:
+            err_msg = f'Unknown export format: {export_format}'
+            raise ValueError(err_msg)
+
+        frame_rate = chip.scheduler.frame_rate
+        if fps is not None and not 0 < fps <= frame_rate:
+            err_msg = f'Export FPS must be in [1..{frame_rate}]: {fps}'
+            raise ValueError(err_msg)
+
+        self.chip = chip
+        self.encoder = ENCODERS[export_format](scale)
+        self.path = Path(path)
+        self.fps = frame_rate if fps is None else fps
+        self.frame_rate = frame_rate
+        self.frames_exported = 0
+
+        if export_format == 'raw':
+            self.stream = self.path.open('wb')
+        else:
+            self.stream = None
+            self.path.mkdir(parents=True, exist_ok=True)
+
+        chip.scheduler.frame_listeners.append(self.export)
+
+    def export(self) -> None:
+        # Spreading exported frames evenly when fps doesn't divide the rate
+        frames = self.chip.scheduler.frames
+        if frames * self.fps // self.frame_rate == (
+            (frames - 1) * self.fps // self.frame_rate
+        ):
+            return
+
+        frame = self.encoder.encode(self.chip.display.rows)
+        if self.stream is not None:
+            self.stream.write(frame)
+        else:
+            name = f'frame_{self.frames_exported:06d}.{self.encoder.EXTENSION}'
+            (self.path / name).write_bytes(frame)
+
+        self.frames_exported += 1
+
+    def close(self) -> None:
+        if self.export in self.chip.scheduler.frame_listeners:
+            self.chip.scheduler.frame_listeners.remove(self.export)
+
+        if self.stream is not None:
+            self.stream.close()
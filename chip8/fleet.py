@@ -0,0 +1,223 @@
+import contextlib
+import hashlib
+import os
+import struct
+import sys
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .cpu import Chip8
+from .state import DISPLAY
+
+# Shared memory slot of a single machine, native byte order:
+#   sequence   odd while the worker is writing, see Chip8Fleet.read
+#   stop       set by the supervisor to stop the machine
+#   frames, cycles, instructions per second, V0..VF, I, counter, display
+SLOT = struct.Struct('=IBxxxQQd16sHH32Q')
+SEQUENCE = struct.Struct('=I')
+STOP_OFFSET: int = SEQUENCE.size
+STATE_OFFSET: int = STOP_OFFSET + 4
+
+# Everything after the control fields, written by the worker every frame
+STATE = struct.Struct('=QQd16sHH32Q')
+
+FleetResult = dict[str, int | float | str]
+
+# Workers only attach to the segment, the supervisor unlinks it (3.13+)
+ATTACH_OPTIONS: dict[str, bool] = (
+    {'track': False} if sys.version_info >= (3, 13) else {}
+)
+
+
+def frame_hash(rows: list[int] | tuple[int, ...]) -> str:
+    return hashlib.sha256(DISPLAY.pack(*rows)).hexdigest()
+
+
+class _FleetStop(Exception):  # noqa: N818
+    pass
+
+
+def run_instance(  # noqa: PLR0913
+    shm_name: str,
+    slot: int,
+    rom: bytes,
+    frames: int | None,
+    *,
+    engine: str,
+    instructions_per_frame: int | None,
+    turbo: bool,
+) -> FleetResult:
+    """Running a single machine in a worker process, publishing every frame"""
+    shm = shared_memory.SharedMemory(shm_name, **ATTACH_OPTIONS)
+    try:
+        buffer = shm.buf
+        offset = slot * SLOT.size
+
+        chip = Chip8(
+            engine, instructions_per_frame=instructions_per_frame, turbo=turbo,
+        )
+        chip.memory.write(chip.PROGRAM_START, rom)
+        chip.display.render = lambda: None  # Supervisor reads the screen
+
+        registers = chip.registers
+        scheduler = chip.scheduler
+        rows = chip.display.rows
+
+        def publish() -> None:
+            sequence = SEQUENCE.unpack_from(buffer, offset)[0] + 1
+            SEQUENCE.pack_into(buffer, offset, sequence)
+            STATE.pack_into(
+                buffer, offset + STATE_OFFSET,
+                scheduler.frames, scheduler.cycles,
+                scheduler.instructions_per_second,
+                bytes(registers.v), registers.i, chip.counter, *rows,
+            )
+            SEQUENCE.pack_into(buffer, offset, sequence + 1)
+
+            if buffer[offset + STOP_OFFSET]:
+                raise _FleetStop
+
+        scheduler.frame_listeners.append(publish)
+        with contextlib.suppress(_FleetStop):
+            chip.run(frames)
+
+        # Publishing the final state even if the machine was stopped
+        scheduler.frame_listeners.remove(publish)
+        buffer[offset + STOP_OFFSET] = 0
+        publish()
+
+        return {
+            'slot': slot,
+            'frames': scheduler.frames,
+            'cycles': scheduler.cycles,
+            'instructions_per_second': scheduler.instructions_per_second,
+            'frame_hash': frame_hash(rows),
+        }
+    finally:
+        shm.close()
+
+
+class Chip8Fleet:
+    """
+    Many machines spread across worker processes. Every worker publishes
+    its registers and display into a shared memory slot at each frame
+    boundary, so the supervisor reads any screen without pickling
+    """
+
+    MAX_READ_RETRIES: int = 1_000_000  # Torn reads before giving up
+
+    slots: int
+    shm: shared_memory.SharedMemory
+    executor: ProcessPoolExecutor
+    futures: dict[int, Future[FleetResult]]
+    free_slots: list[int]
+
+    def __init__(self, slots: int, workers: int | None = None) -> None:
+        if slots <= 0:
+            raise ValueError(f'Amount of slots must be positive: {slots}')
+
+        self.slots = slots
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=slots * SLOT.size,
+        )
+        self.shm.buf[:] = bytes(len(self.shm.buf))
+
+        self.executor = ProcessPoolExecutor(workers or os.cpu_count())
+        self.futures = {}
+        self.free_slots = list(range(slots - 1, -1, -1))
+
+    def __enter__(self) -> 'Chip8Fleet':
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def start(
+        self,
+        rom: bytes,
+        frames: int | None = None,
+        *,
+        engine: str = 'interpreter',
+        instructions_per_frame: int | None = None,
+        turbo: bool = True,
+    ) -> int:
+        """Starting a ROM in a free slot, runs forever if frames is None"""
+        if not self.free_slots:
+            raise RuntimeError('No free fleet slots')
+
+        slot = self.free_slots.pop()
+        offset = slot * SLOT.size
+        self.shm.buf[offset : offset + SLOT.size] = bytes(SLOT.size)
+
+        self.futures[slot] = self.executor.submit(
+            run_instance, self.shm.name, slot, rom, frames,
+            engine=engine,
+            instructions_per_frame=instructions_per_frame,
+            turbo=turbo,
+        )
+        return slot
+
+    def stop(self, slot: int) -> None:
+        """Asking the machine to stop once the current frame ends"""
+        self.shm.buf[slot * SLOT.size + STOP_OFFSET] = 1
+
+    def read(self, slot: int) -> tuple:
+        """
+        Consistent copy of a slot: (frames, cycles, instructions/s, V0..VF,
+        I, counter, *display rows). Retried while the worker is writing
+        """
+        offset = slot * SLOT.size
+        buffer = self.shm.buf
+        for _ in range(self.MAX_READ_RETRIES):
+            sequence = SEQUENCE.unpack_from(buffer, offset)[0]
+            if sequence % 2 == 0:
+                state = STATE.unpack_from(buffer, offset + STATE_OFFSET)
+                if SEQUENCE.unpack_from(buffer, offset)[0] == sequence:
+                    return state
+                continue
+
+            # Worker that is gone never finishes its write
+            future = self.futures.get(slot)
+            if future is None or future.done():
+                err_msg = f'Worker of slot {slot} stopped while writing it'
+                raise RuntimeError(err_msg)
+
+        err_msg = f'Slot {slot} kept changing for {self.MAX_READ_RETRIES} reads'
+        raise RuntimeError(err_msg)
+
+    def screen(self, slot: int) -> tuple[int, ...]:
+        """Packed display rows of the last published frame"""
+        return self.read(slot)[6:]
+
+    def result(self, slot: int, timeout: float | None = None) -> FleetResult:
+        """Waiting for a machine to finish and releasing its slot"""
+        result = self.futures.pop(slot).result(timeout)
+        self.free_slots.append(slot)
+        return result
+
+    def wait(self) -> list[FleetResult]:
+        return [self.result(slot) for slot in sorted(self.futures)]
+
+    def close(self) -> None:
+        for slot in self.futures:
+            self.stop(slot)
+        self.executor.shutdown(cancel_futures=True)
+        self.futures.clear()
+
+        self.shm.close()
+        self.shm.unlink()
+
+
+def summarize(results: list[FleetResult]) -> dict:
+    """Total throughput and how many machines ended on each screen"""
+    return {
+        'machines': len(results),
+        'frames': sum(result['frames'] for result in results),
+        'instructions_per_second': sum(
+            result['instructions_per_second'] for result in results
+        ),
+        'frame_hashes': dict(Counter(
+            result['frame_hash'] for result in results
+        ).most_common()),
+    }
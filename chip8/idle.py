@@ -0,0 +1,253 @@
+from typing import TYPE_CHECKING
+
+from .decoder import DECODE_TABLE
+from .errors import Chip8Panic
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+    from .memory import Chip8Memory
+    from .scheduler import Chip8Scheduler
+
+# Kinds of idle loops, none of them changes anything but the counter and
+# Vx loaded from the delay timer, so only time can get them out:
+#   jump        1nnn jumping to itself
+#   key_wait    Fx0A waiting for a key
+#   timer_poll  Fx07 Vx, 3xkk/4xkk Vx, 1nnn back to Fx07
+#   key_poll    Ex9E/ExA1, 1nnn back to it
+JUMP: str = 'jump'
+KEY_WAIT: str = 'key_wait'
+TIMER_POLL: str = 'timer_poll'
+KEY_POLL: str = 'key_poll'
+
+SKIPS: frozenset[str] = frozenset({'op_3xkk', 'op_4xkk'})
+KEY_SKIPS: frozenset[str] = frozenset({'op_ex9e', 'op_exa1'})
+
+
+class IdleLoop:
+    kind: str
+    start: int  # Address of the first instruction
+    length: int  # Instructions per iteration
+    skip: str  # Handler name of the skip instruction deciding to exit
+    x: int  # Register polled
+    kk: int  # Byte Vx is compared to by 3xkk/4xkk
+
+    def __init__(  # noqa: PLR0913
+        self,
+        kind: str,
+        start: int,
+        length: int,
+        *,
+        skip: str = '',
+        x: int = 0,
+        kk: int = 0,
+    ) -> None:
+        self.kind = kind
+        self.start = start
+        self.length = length
+        self.skip = skip
+        self.x = x
+        self.kk = kk
+
+    def polls(self, value: int) -> bool:
+        """Timer poll continues with Vx = value, i.e. skip isn't taken"""
+        return (value == self.kk) == (self.skip == 'op_4xkk')
+
+    def continues(self, chip: 'Chip8') -> bool:
+        """Loop can't exit until the end of the current frame"""
+        if self.kind == TIMER_POLL:
+            return self.polls(chip.delay_timer.value)
+
+        keyboard = chip.keyboard
+        if self.kind == KEY_WAIT:
+            return (
+                keyboard.waiting_for_input and keyboard.captured_key is None
+            )
+        if self.kind == KEY_POLL:
+            pressed = keyboard.is_pressed(chip.registers.v[self.x] & 0xF)
+            return pressed == (self.skip == 'op_exa1')
+
+        return True
+
+    def idle_frames(self, chip: 'Chip8', limit: int) -> int:
+        """
+        Whole frames, up to limit, the loop keeps polling for. Keys can
+        come at any moment, so key loops are only skipped within a frame
+        """
+        if self.kind == JUMP:
+            return limit
+        if self.kind != TIMER_POLL:
+            return 0
+
+        # Skip is about to test Vx loaded during the previous frame
+        if chip.counter == self.start + 2 and not self.polls(
+            chip.registers.v[self.x],
+        ):
+            return 0
+
+        # Timer counts down to zero and stays there
+        value = chip.delay_timer.value
+        if self.skip == 'op_3xkk':
+            frames = limit if self.kk > value else value - self.kk
+        elif value != self.kk:
+            frames = 0
+        else:
+            frames = limit if value == 0 else 1
+        return min(frames, limit)
+
+
+class IdleLoopDetector:
+    """
+    Recognizing loops a program idles in until a timer or a key changes.
+    Within a frame those can't change, so whole iterations are skipped at
+    once, and with virtual time whole frames of a timer running out are.
+    Machine ends up exactly where executing the loop would have left it
+    """
+
+    MAX_IDLE_FRAMES: int = 60 * 60  # Frames skipped at once when unlimited
+    MAX_INVALIDATED: int = 64  # Bytes, larger writes drop all loops
+
+    memory: 'Chip8Memory'
+    loops: dict[int, IdleLoop | None]  # Counter -> loop it is inside of
+
+    frames_skipped: int
+    cycles_skipped: int
+
+    def __init__(self, memory: 'Chip8Memory') -> None:
+        self.memory = memory
+        self.loops = {}
+
+        self.frames_skipped = 0
+        self.cycles_skipped = 0
+
+        self.memory.add_write_listener(self.invalidate)
+
+    def invalidate(self, address: int, length: int) -> None:
+        # Loop is at most 3 instructions long, counter can be at any of them
+        if length > self.MAX_INVALIDATED:
+            self.loops.clear()
+            return
+
+        for counter in range(address - 5, address + length + 5):
+            self.loops.pop(counter, None)
+
+    def decode(self, address: int) -> tuple[str, tuple[int, ...]]:
+        try:
+            return DECODE_TABLE[self.memory.read_word(address)]
+        except Chip8Panic:
+            return '', ()
+
+    def find(self, counter: int) -> IdleLoop | None:
+        try:
+            return self.loops[counter]
+        except KeyError:
+            pass
+
+        loop = None
+        for start in (counter, counter - 2, counter - 4):
+            loop = self.match(start)
+            if loop is not None and counter < start + loop.length * 2:
+                break
+            loop = None
+
+        self.loops[counter] = loop
+        return loop
+
+    def match(self, start: int) -> IdleLoop | None:
+        name, operands = self.decode(start)
+        if name == 'op_1nnn' and operands[0] == start:
+            return IdleLoop(JUMP, start, 1)
+        if name == 'op_fx0a':
+            return IdleLoop(KEY_WAIT, start, 1)
+
+        if name in KEY_SKIPS:
+            jump = self.decode(start + 2)
+            if jump == ('op_1nnn', (start,)):
+                return IdleLoop(
+                    KEY_POLL, start, 2, skip=name, x=operands[0],
+                )
+
+        if name == 'op_fx07':
+            x = operands[0]
+            skip, skip_operands = self.decode(start + 2)
+            jump = self.decode(start + 4)
+            if (
+                skip in SKIPS
+                and skip_operands[0] == x
+                and jump == ('op_1nnn', (start,))
+            ):
+                return IdleLoop(
+                    TIMER_POLL, start, 3, skip=skip, x=x, kk=skip_operands[1],
+                )
+
+        return None
+
+    def run_idle(self, chip: 'Chip8', cycles: int) -> int:
+        """
+        Skipping iterations of an idle loop under the counter that fit into
+        cycles, returns cycles left to execute
+        """
+        loop = self.find(chip.counter)
+        if loop is None:
+            return cycles
+
+        # Finishing the current iteration, loop may exit at its skip
+        steps = (loop.start - chip.counter) // 2 % loop.length
+        if steps > cycles:
+            return cycles
+        for _ in range(steps):
+            chip.step()
+        cycles -= steps
+        if chip.counter != loop.start or not loop.continues(chip):
+            return cycles
+
+        iterations = cycles // loop.length
+        if iterations and loop.kind == TIMER_POLL:
+            chip.registers.v[loop.x] = chip.delay_timer.value
+
+        skipped = iterations * loop.length
+        self.cycles_skipped += skipped
+        return cycles - skipped
+
+    def skip_frames(
+        self,
+        chip: 'Chip8',
+        scheduler: 'Chip8Scheduler',
+        limit: int | None,
+    ) -> int:
+        """
+        Skipping whole frames the machine keeps idling for, up to limit.
+        Counter and polled register are set as the skipped cycles would
+        have left them. Returns amount of skipped frames
+        """
+        loop = self.find(chip.counter)
+        if loop is None:
+            return 0
+
+        if limit is None:
+            limit = self.MAX_IDLE_FRAMES
+        frames = loop.idle_frames(chip, limit)
+        if not frames:
+            return 0
+
+        first_frame = scheduler.frames
+        cycles = scheduler.cycles_between(first_frame, first_frame + frames)
+        position = (chip.counter - loop.start) // 2
+
+        if loop.kind == TIMER_POLL:
+            # Last Fx07 executed during the skipped cycles
+            first_load = -position % loop.length
+            if first_load < cycles:
+                last_load = (
+                    first_load
+                    + (cycles - 1 - first_load) // loop.length * loop.length
+                )
+                frame = scheduler.frame_of_cycle(first_frame, last_load)
+                value = max(chip.delay_timer.value - frame, 0)
+                chip.registers.v[loop.x] = value
+
+        chip.counter = loop.start + (position + cycles) % loop.length * 2
+        scheduler.skip_frames(frames)
+
+        self.frames_skipped += frames
+        self.cycles_skipped += cycles
+        return frames
@@ -1,53 +1,164 @@
-import time
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable
+from contextlib import ExitStack
 
 import blessed
 
-from .utils import QuartzClock
 
+class Chip8Keyboard:
+    """
+    Hexadecimal keypad state as a 16-bit bitmap of pressed keys.
+    Terminal is read by a background thread inside a single cbreak session,
+    read keys are applied once per frame, so the CPU never waits for input
+    """
 
-class Chip8Keyboard(QuartzClock):
-    CLOCK_RATE: int = 60  # Hz
     KEY_MAP: dict[str, int] = {  # noqa: RUF012
-        '1': 0x31, '2': 0x32, '3': 0x33, '4': 0x43,
-        'q': 0x34, 'w': 0x35, 'e': 0x36, 'r': 0x44,
-        'a': 0x37, 's': 0x38, 'd': 0x39, 'f': 0x45,
-        'z': 0x41, 'x': 0x30, 'c': 0x42, 'v': 0x46,
+        '1': 0x1, '2': 0x2, '3': 0x3, '4': 0xC,
+        'q': 0x4, 'w': 0x5, 'e': 0x6, 'r': 0xD,
+        'a': 0x7, 's': 0x8, 'd': 0x9, 'f': 0xE,
+        'z': 0xA, 'x': 0x0, 'c': 0xB, 'v': 0xF,
     }
 
+    # Keys are fed by events, so a machine waiting for a key can sleep.
+    # Replayed keys depend on the emulated clock, so it has to keep running
+    EVENT_DRIVEN: bool = True
+
+    # Terminals report presses only, so a key is released once it's not
+    # repeated for a while. Long enough to cover auto-repeat intervals
+    HOLD_FRAMES: int = 15
+    READ_TIMEOUT: float = 0.1  # s, how often the reader checks for stop
+
     terminal: blessed.Terminal
 
+    pressed_keys: int  # Bit N is set while key N is held
+    release_frames: list[int]  # Frame each held key is released at
+    frames: int  # Frames ticked so far
+
     waiting_for_input: bool
-    captured_key: int
+    captured_key: int | None
 
-    def __init__(self) -> None:
-        super().__init__()
+    # Called with every key press and release, e.g. to record input
+    key_listeners: list[Callable[[int, bool], None]]
+
+    # Keys read by the background thread or queued by the host, not applied
+    # yet. Key notifier wakes up a machine sleeping in Fx0A
+    pending_keys: deque[int]
+    key_notifier: Callable[[], None] | None
+    reader: threading.Thread | None
+    stop_reading: threading.Event
+    session: ExitStack
 
+    def __init__(self) -> None:
         self.terminal = blessed.Terminal()
 
+        self.pressed_keys = 0
+        self.release_frames = [0] * 16
+        self.frames = 0
+
         self.waiting_for_input = False
-        self.captured_key = 0
+        self.captured_key = None
+
+        self.key_listeners = []
+
+        self.pending_keys = deque()
+        self.key_notifier = None
+        self.reader = None
+        self.stop_reading = threading.Event()
+        self.session = ExitStack()
 
-    def get_captured_key(self) -> int:
+    def is_pressed(self, key: int) -> bool:
+        return bool(self.pressed_keys >> key & 1)
+
+    def get_captured_key(self) -> int | None:
         captured_key = self.captured_key
-        self.captured_key = 0  # Reset captured key after reading
+        self.captured_key = None  # Reset captured key after reading
 
         return captured_key
 
     def wait_for_input(self) -> None:
-        self.captured_key = 0
+        self.captured_key = None
         self.waiting_for_input = True
 
-    def tick(self) -> None:
-        # No need to read input, we're not waiting
-        if not self.waiting_for_input:
+    def capture_key(self, key: int) -> None:
+        # Once we capture a key, we stop waiting for input
+        self.captured_key = key
+        self.waiting_for_input = False
+
+    def press_key(self, key: int) -> None:
+        self.release_frames[key] = self.frames + self.HOLD_FRAMES
+
+        # Auto-repeat only keeps the key held
+        if self.is_pressed(key):
             return
+        self.pressed_keys |= 1 << key
 
-        # Read input from terminal
-        with self.terminal.cbreak(), self.terminal.hidden_cursor():
-            captured_key = self.terminal.inkey(timeout=1 / self.CLOCK_RATE)
+        if self.waiting_for_input:
+            self.capture_key(key)
 
-        # We're interested only in defined keymap, ignore others keys
-        # Once we capture a key, we stop waiting for input
-        if captured_key and captured_key in self.KEY_MAP:
-            self.captured_key = self.KEY_MAP.get(captured_key)
-            self.wait_for_input = False
+        for listener in self.key_listeners:
+            listener(key, True)
+
+    def release_key(self, key: int) -> None:
+        if not self.is_pressed(key):
+            return
+        self.pressed_keys &= ~(1 << key)
+
+        for listener in self.key_listeners:
+            listener(key, False)
+
+    def queue_key(self, key: int) -> None:
+        """Pressing a key on the next frame, safe to call from any thread"""
+        self.pending_keys.append(key)
+
+        if self.key_notifier is not None:
+            self.key_notifier()
+
+    def start(self) -> None:
+        """Entering cbreak mode once and reading the terminal in background"""
+        # Nothing to read without an interactive terminal
+        if self.reader is not None or not sys.stdin.isatty():
+            return
+
+        self.session.enter_context(self.terminal.cbreak())
+        self.session.enter_context(self.terminal.hidden_cursor())
+
+        self.stop_reading.clear()
+        self.reader = threading.Thread(target=self.read_terminal, daemon=True)
+        self.reader.start()
+
+    def stop(self) -> None:
+        if self.reader is not None:
+            self.stop_reading.set()
+            self.reader.join()
+            self.reader = None
+
+        self.session.close()
+
+    def read_terminal(self) -> None:
+        while not self.stop_reading.is_set():
+            key = self.terminal.inkey(timeout=self.READ_TIMEOUT)
+
+            # We're interested only in defined keymap, ignore others keys
+            if key and (chip8_key := self.KEY_MAP.get(str(key))) is not None:
+                self.queue_key(chip8_key)
+
+    def read_keys(self) -> list[int]:
+        """Keys read since the last frame"""
+        keys: list[int] = []
+        while self.pending_keys:
+            keys.append(self.pending_keys.popleft())
+        return keys
+
+    def tick(self) -> None:
+        self.frames += 1
+
+        for key in self.read_keys():
+            self.press_key(key)
+
+        if not self.pressed_keys:
+            return
+        for key in range(16):
+            if self.is_pressed(key) and self.release_frames[key] <= self.frames:
+                self.release_key(key)
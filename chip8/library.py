@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .decoder import DECODE_TABLE
+from .disassembler import DECODER_VERSION, ControlFlowGraph
+
+ROM_SUFFIXES: tuple[str, ...] = ('.ch8', '.c8')
+
+RomAnalysis = dict[str, int | str | dict[str, int]]
+
+
+def analyze_rom(rom: bytes) -> RomAnalysis:
+    """Histogram of opcode classes among reachable instructions of a ROM"""
+    cfg = ControlFlowGraph(rom)
+
+    # Handler names are "op_" followed by the opcode class
+    histogram = Counter(
+        DECODE_TABLE[opcode][0][3:] for opcode in cfg.instructions.values()
+    )
+
+    return {
+        'sha256': hashlib.sha256(rom).hexdigest(),
+        'size': len(rom),
+        'decoder_version': DECODER_VERSION,
+        'instructions': len(cfg.instructions),
+        'blocks': len(cfg.blocks),
+        'data_bytes': len(rom) - 2 * len(cfg.instructions),
+        'histogram': dict(sorted(histogram.items())),
+    }
+
+
+def find_roms(
+    paths: Iterable[str | Path],
+    suffixes: tuple[str, ...] = ROM_SUFFIXES,
+) -> list[Path]:
+    """Given files as they are, directories searched recursively"""
+    roms: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            roms.extend(sorted(
+                rom
+                for rom in path.rglob('*')
+                if rom.is_file() and rom.suffix.lower() in suffixes
+            ))
+        else:
+            roms.append(path)
+    return roms
+
+
+class DisassemblyCache:
+    """
+    Analyses stored as JSON files named after ROM content hash and decoder
+    version, so renamed or duplicated ROMs are only analysed once
+    """
+
+    directory: Path
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, sha256: str) -> Path:
+        return self.directory / f'{sha256}-v{DECODER_VERSION}.json'
+
+    def get(self, sha256: str) -> RomAnalysis | None:
+        try:
+            return json.loads(self.path(sha256).read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, analysis: RomAnalysis) -> None:
+        # Written aside and renamed, concurrent runs never see partial files
+        path = self.path(str(analysis['sha256']))
+        temporary_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        temporary_path.write_text(json.dumps(analysis), encoding='utf-8')
+        temporary_path.replace(path)
+
+
+def disassemble_library(
+    paths: Iterable[str | Path],
+    cache: DisassemblyCache | None = None,
+    workers: int | None = None,
+) -> Iterator[RomAnalysis]:
+    """
+    Analysing ROMs in a process pool, in the order they were found.
+    Cached analyses are served without starting the pool at all
+    """
+    roms = find_roms(paths)
+
+    results: list[RomAnalysis | None] = [None] * len(roms)
+    misses: list[tuple[int, bytes]] = []
+    for index, path in enumerate(roms):
+        rom = path.read_bytes()
+        analysis = None
+        if cache is not None:
+            analysis = cache.get(hashlib.sha256(rom).hexdigest())
+
+        if analysis is None:
+            misses.append((index, rom))
+        else:
+            results[index] = analysis
+
+    if misses:
+        # Few chunks per worker, ROMs are small and pickling them is cheap
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(misses) // (4 * workers))
+
+        with ProcessPoolExecutor(workers) as executor:
+            analyses = executor.map(
+                analyze_rom, [rom for _, rom in misses], chunksize=chunksize,
+            )
+            for (index, _), analysis in zip(misses, analyses, strict=True):
+                if cache is not None:
+                    cache.put(analysis)
+                results[index] = analysis
+
+    for path, analysis in zip(roms, results, strict=True):
+        yield {'path': str(path), **analysis}
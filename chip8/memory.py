@@ -1,14 +1,34 @@
+from collections.abc import Callable
+
 from .errors import Chip8Panic
-from .utils import parse_byte
+from .utils import mask_byte, parse_byte
+
+# Called with (address, length) of every write done through Chip8Memory
+WriteListener = Callable[[int, int], None]
 
 
 class Chip8Memory:
     SIZE: int = 4 * 1024  # 4 kb
 
     data: bytearray
+    memory_view: memoryview  # Whole data, slicing it doesn't copy
+    write_listeners: list[WriteListener]
 
     def __init__(self) -> None:
         self.data = bytearray(self.SIZE)
+        self.memory_view = memoryview(self.data)
+        self.write_listeners = []
+
+    def add_write_listener(self, listener: WriteListener) -> None:
+        """
+        Subscribing to memory writes, so caches built on top of memory
+        can be invalidated. Writes done directly to data are not reported
+        """
+        self.write_listeners.append(listener)
+
+    def _notify_write(self, address: int, length: int) -> None:
+        for listener in self.write_listeners:
+            listener(address, length)
 
     def read_byte(self, address: int) -> int:
         if not 0 <= address < self.SIZE:
@@ -21,18 +41,66 @@ class Chip8Memory:
             raise Chip8Panic(f'Memory write out of bounds: {hex(address)}')
 
         self.data[address] = parse_byte(byte)
+        self._notify_write(address, 1)
 
     def write(self, address: int, data: bytes | bytearray) -> None:
-        if not 0 <= address + len(data) < self.SIZE:
+        if not 0 <= address <= self.SIZE - len(data):
             raise Chip8Panic(f'Memory write out of bounds: {hex(self.SIZE)}')
 
         self.data[address : address + len(data)] = data
+        self._notify_write(address, len(data))
 
     def read(self, address: int, length: int) -> bytearray:
-        if not 0 <= address + length < self.SIZE:
+        if not 0 <= address <= self.SIZE - length or length < 0:
+            raise Chip8Panic(f'Memory read out of bounds: {hex(self.SIZE)}')
+
+        return self.data[address : address + length]
+
+    def view(self, address: int, length: int) -> memoryview:
+        """
+        Zero-copy read: returns a view of memory instead of copying bytes.
+        View reflects later writes, so it should not be kept around
+        """
+        if not 0 <= address <= self.SIZE - length or length < 0:
             raise Chip8Panic(f'Memory read out of bounds: {hex(self.SIZE)}')
 
-        buffer = bytearray(length)
-        for i in range(length):
-            buffer[i] = self.read_byte(address + i)
-        return buffer
+        return self.memory_view[address : address + length]
+
+    def read_word(self, address: int) -> int:
+        """Reading 16-bit big-endian word, e.g. an opcode"""
+        if not 0 <= address < self.SIZE - 1:
+            raise Chip8Panic(f'Memory read out of bounds: {hex(address)}')
+
+        data = self.data
+        return (data[address] << 8) | data[address + 1]
+
+
+class FastMemory(Chip8Memory):
+    """
+    Fast mode: addresses wrap around memory and written values are masked
+    instead of panicking. Bulk writes, e.g. loading a ROM, are still checked
+    """
+
+    ADDRESS_MASK: int = Chip8Memory.SIZE - 1
+
+    def read_byte(self, address: int) -> int:
+        return self.data[address & self.ADDRESS_MASK]
+
+    def write_byte(self, address: int, byte: int) -> None:
+        address &= self.ADDRESS_MASK
+        self.data[address] = mask_byte(byte)
+        self._notify_write(address, 1)
+
+    def view(self, address: int, length: int) -> memoryview:
+        address &= self.ADDRESS_MASK
+        if address + length <= self.SIZE:
+            return self.memory_view[address : address + length]
+
+        # Sprite going past the end continues from the start of memory
+        end = address + length - self.SIZE
+        return memoryview(self.data[address:] + self.data[:end])
+
+    def read_word(self, address: int) -> int:
+        data = self.data
+        mask = self.ADDRESS_MASK
+        return (data[address & mask] << 8) | data[(address + 1) & mask]
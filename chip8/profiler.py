@@ -0,0 +1,178 @@
+import time
+from typing import TYPE_CHECKING
+
+from .disassembler import get_opcode_name
+from .errors import Chip8Panic
+
+if TYPE_CHECKING:
+    from .compiler import BlockCompiler
+    from .cpu import Chip8
+    from .idle import IdleLoopDetector
+
+
+class Chip8Profiler:
+    """
+    Counting executions and time spent per opcode class and per address.
+    Profiler replaces methods of a single machine with timed ones, so
+    machines without profiling run exactly the same code as before
+    """
+
+    chip: 'Chip8'
+    compiler: 'BlockCompiler | None'  # Suspended while profiling
+    idle_loops: 'IdleLoopDetector | None'  # Suspended while profiling
+    # (owner, attribute name, instance attribute it replaced, replacement)
+    overridden: list[tuple[object, str, object | None, object]]
+
+    # Key -> [executions, total ns]
+    opcode_stats: dict[str, list[int]]  # Opcode class, e.g. "8xy4"
+    address_stats: dict[int, list[int]]
+
+    render_stats: list[int]
+    keyboard_stats: list[int]
+
+    def __init__(self, chip: 'Chip8') -> None:
+        self.chip = chip
+        self.compiler = None
+        self.idle_loops = None
+        self.overridden = []
+
+        self.opcode_stats = {}
+        self.address_stats = {}
+        self.render_stats = [0, 0]
+        self.keyboard_stats = [0, 0]
+
+    def reset(self) -> None:
+        # Cleared in place, installed methods keep references to them
+        self.opcode_stats.clear()
+        self.address_stats.clear()
+        self.render_stats[:] = [0, 0]
+        self.keyboard_stats[:] = [0, 0]
+
+    def install(self) -> None:
+        chip = self.chip
+        step = chip.step  # Tracing may be wrapping it already
+        render = chip.display.render
+        keyboard_tick = chip.keyboard.tick
+
+        opcode_stats = self.opcode_stats
+        address_stats = self.address_stats
+        render_stats = self.render_stats
+        keyboard_stats = self.keyboard_stats
+
+        def profiled_step() -> None:
+            address = chip.counter
+            handler, _ = chip.fetch_instruction()
+
+            start = time.perf_counter_ns()
+            step()
+            elapsed = time.perf_counter_ns() - start
+
+            # Handler names are "op_" followed by the opcode class
+            stats = opcode_stats.setdefault(handler.__name__[3:], [0, 0])
+            stats[0] += 1
+            stats[1] += elapsed
+
+            stats = address_stats.setdefault(address, [0, 0])
+            stats[0] += 1
+            stats[1] += elapsed
+
+        def profiled_render() -> None:
+            start = time.perf_counter_ns()
+            render()
+            render_stats[0] += 1
+            render_stats[1] += time.perf_counter_ns() - start
+
+        def profiled_keyboard_tick() -> None:
+            start = time.perf_counter_ns()
+            keyboard_tick()
+            keyboard_stats[0] += 1
+            keyboard_stats[1] += time.perf_counter_ns() - start
+
+        # Compiled blocks and skipped idle loops don't go through step,
+        # so the whole program is interpreted while profiling
+        self.compiler, chip.compiler = chip.compiler, None
+        self.idle_loops, chip.idle_loops = chip.idle_loops, None
+
+        # Instance attributes take precedence over the class methods.
+        # Attributes already overridden on the instance are put back later
+        for owner, name, method in (
+            (chip, 'step', profiled_step),
+            (chip.display, 'render', profiled_render),
+            (chip.keyboard, 'tick', profiled_keyboard_tick),
+        ):
+            self.overridden.append(
+                (owner, name, vars(owner).get(name), method),
+            )
+            setattr(owner, name, method)
+
+    def uninstall(self) -> None:
+        # Anything installed on top of the profiler wraps its methods,
+        # putting the originals back would silently drop it
+        for owner, name, _, method in self.overridden:
+            if vars(owner).get(name) is not method:
+                err_msg = (
+                    f'{type(owner).__name__}.{name} was replaced after '
+                    'profiling was enabled, disable that first'
+                )
+                raise RuntimeError(err_msg)
+
+        for owner, name, original, _ in reversed(self.overridden):
+            if original is None:
+                vars(owner).pop(name, None)
+            else:
+                setattr(owner, name, original)
+        self.overridden.clear()
+
+        self.chip.compiler, self.compiler = self.compiler, None
+        self.chip.idle_loops, self.idle_loops = self.idle_loops, None
+
+    def top_addresses(self, count: int = 10) -> list[tuple[int, int, int]]:
+        """Hottest addresses by total time: (address, executions, ns)"""
+        hot_addresses = sorted(
+            self.address_stats.items(),
+            key=lambda item: item[1][1],
+            reverse=True,
+        )
+        return [
+            (address, executions, elapsed)
+            for address, (executions, elapsed) in hot_addresses[:count]
+        ]
+
+    def mnemonic(self, address: int) -> str:
+        try:
+            opcode = self.chip.memory.read_word(address)
+        except Chip8Panic:
+            return '?'
+        return f'{opcode:04x} — {get_opcode_name(opcode)}'
+
+    def report(self, count: int = 10) -> str:
+        lines = [f'{"opcode":<8} {"count":>12} {"total ms":>10} {"ns/op":>8}']
+        for name, (executions, elapsed) in sorted(
+            self.opcode_stats.items(),
+            key=lambda item: item[1][1],
+            reverse=True,
+        ):
+            lines.append(
+                f'{name:<8} {executions:>12,} {elapsed / 1e6:>10.2f} '
+                f'{elapsed / executions:>8.0f}',
+            )
+
+        lines.extend(('', f'Top {count} hot addresses:'))
+        for address, executions, elapsed in self.top_addresses(count):
+            lines.append(
+                f'{address:04x}: {executions:>12,} {elapsed / 1e6:>10.2f} ms '
+                f'{self.mnemonic(address)}',
+            )
+
+        lines.append('')
+        for name, (calls, elapsed) in (
+            ('render', self.render_stats),
+            ('keyboard', self.keyboard_stats),
+        ):
+            average = elapsed / calls if calls else 0
+            lines.append(
+                f'{name:<8} {calls:>12,} {elapsed / 1e6:>10.2f} ms '
+                f'{average:>8.0f} ns/call',
+            )
+
+        return '\n'.join(lines)
@@ -0,0 +1,106 @@
+import struct
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from .errors import Chip8Panic
+from .input import Chip8Keyboard
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+
+# Input log layout: header with magic and format version, followed by
+# fixed-size events of (emulated cycle, CHIP-8 key, pressed), little-endian
+INPUT_LOG_MAGIC: bytes = b'C8IN'
+INPUT_LOG_VERSION: int = 2
+
+HEADER = struct.Struct('<4sB')
+EVENT = struct.Struct('<QB?')
+
+InputEvent = tuple[int, int, bool]  # (cycle, key, pressed)
+
+
+def read_input_log(path: str | Path) -> list[InputEvent]:
+    data = Path(path).read_bytes()
+
+    magic, version = HEADER.unpack_from(data)
+    if magic != INPUT_LOG_MAGIC:
+        raise Chip8Panic('Invalid input log: wrong magic bytes')
+    if version != INPUT_LOG_VERSION:
+        raise Chip8Panic(f'Unsupported input log version: {version}')
+
+    if (len(data) - HEADER.size) % EVENT.size:
+        raise Chip8Panic('Invalid input log: truncated event')
+
+    return list(EVENT.iter_unpack(data[HEADER.size :]))
+
+
+class InputRecorder:
+    """Writing every key press and release with its emulated cycle"""
+
+    chip: 'Chip8'
+    file: BinaryIO
+    events: int
+
+    def __init__(self, chip: 'Chip8', path: str | Path) -> None:
+        self.chip = chip
+        self.events = 0
+
+        self.file = Path(path).open('wb')  # noqa: SIM115
+        self.file.write(HEADER.pack(INPUT_LOG_MAGIC, INPUT_LOG_VERSION))
+
+        chip.keyboard.key_listeners.append(self.record)
+
+    def record(self, key: int, pressed: bool) -> None:
+        self.file.write(EVENT.pack(self.chip.scheduler.cycles, key, pressed))
+        self.events += 1
+
+    def close(self) -> None:
+        if self.record in self.chip.keyboard.key_listeners:
+            self.chip.keyboard.key_listeners.remove(self.record)
+        self.file.close()
+
+
+class ReplayKeyboard(Chip8Keyboard):
+    """
+    Input source pressing and releasing recorded keys at the same emulated
+    cycles they were recorded at, no terminal is read
+    """
+
+    EVENT_DRIVEN: bool = False
+
+    events: list[InputEvent]
+    next_event: int  # Index of the next event to apply
+    clock: Callable[[], int]  # Current emulated cycle
+
+    def __init__(
+        self,
+        events: list[InputEvent],
+        clock: Callable[[], int],
+    ) -> None:
+        super().__init__()
+
+        self.events = events
+        self.next_event = 0
+        self.clock = clock
+
+    @property
+    def finished(self) -> bool:
+        return self.next_event >= len(self.events)
+
+    def start(self) -> None:
+        pass
+
+    def tick(self) -> None:
+        self.frames += 1
+
+        # Releases are recorded too, keys are never released on their own
+        cycle = self.clock()
+        while not self.finished and self.events[self.next_event][0] <= cycle:
+            _, key, pressed = self.events[self.next_event]
+            self.next_event += 1
+
+            if pressed:
+                self.press_key(key)
+            else:
+                self.release_key(key)
@@ -0,0 +1,167 @@
+import threading
+import time
+from collections.abc import Callable
+
+from .display import Chip8Display
+
+# Frame handed over to the render thread: rows, dirty rows, full redraw
+PendingFrame = tuple[tuple[int, ...], int, bool]
+
+
+class RenderThread:
+    """
+    Rendering the display from its own thread, so a slow terminal never
+    stalls the CPU. At every frame boundary the CPU only copies the rows
+    aside, the thread renders the latest copy at most fps times a second.
+    Frames replaced before they were rendered are skipped
+    """
+
+    DEFAULT_FPS: int = 60
+
+    display: Chip8Display  # Back buffer, drawn to by the CPU
+    front: Chip8Display  # Front buffer, written to the terminal
+    fps: int
+
+    # Render the thread took over, e.g. wrapped by profiling, and the
+    # instance attribute it replaced, put back once the thread stops
+    render: Callable[[], None] | None
+    replaced_render: Callable[[], None] | None
+
+    pending: PendingFrame | None
+    lock: threading.Lock
+    frame_ready: threading.Condition
+    running: bool
+    thread: threading.Thread | None
+
+    frames_presented: int  # Changed frames handed over by the CPU
+    frames_rendered: int
+    frames_skipped: int  # Replaced by a newer frame before rendering
+    frames_late: int  # Rendered later than their fps slot
+
+    def __init__(
+        self,
+        display: Chip8Display,
+        fps: int = DEFAULT_FPS,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError(f'Render FPS must be positive: {fps}')
+
+        self.display = display
+        self.front = Chip8Display()
+        self.fps = fps
+
+        self.render = None
+        self.replaced_render = None
+
+        self.pending = None
+        self.lock = threading.Lock()
+        self.frame_ready = threading.Condition(self.lock)
+        self.running = False
+        self.thread = None
+
+        self.frames_presented = 0
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self.frames_late = 0
+
+    def start(self) -> None:
+        # Instance attribute takes precedence over Chip8Display.render
+        self.render = self.display.render
+        self.replaced_render = vars(self.display).get('render')
+        self.display.render = self.present
+
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Rendering the last pending frame and stopping the thread"""
+        # Putting the replaced render back would drop a wrapper on top
+        if vars(self.display).get('render') != self.present:
+            err_msg = (
+                'Chip8Display.render was replaced after the render thread '
+                'was started, disable that first'
+            )
+            raise RuntimeError(err_msg)
+
+        with self.lock:
+            self.running = False
+            self.frame_ready.notify()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        if self.replaced_render is None:
+            del self.display.render
+        else:
+            self.display.render = self.replaced_render
+        self.render = self.replaced_render = None
+
+    def present(self) -> None:
+        """Swapping buffers at a frame boundary, never waits for output"""
+        self.hand_over()
+
+        # Back buffer is clean now, so the replaced render draws nothing,
+        # but wrappers of it, e.g. profiling, still see every frame
+        self.render()
+
+    def hand_over(self) -> None:
+        display = self.display
+        dirty_rows, full_redraw = display.dirty_rows, display.full_redraw
+        if not dirty_rows and not full_redraw:
+            return
+
+        with self.lock:
+            # Changes of the skipped frame still have to be redrawn
+            if self.pending is not None:
+                self.frames_skipped += 1
+                dirty_rows |= self.pending[1]
+                full_redraw |= self.pending[2]
+
+            self.pending = (tuple(display.rows), dirty_rows, full_redraw)
+            self.frames_presented += 1
+            self.frame_ready.notify()
+
+        display.dirty_rows = 0
+        display.full_redraw = False
+
+    def run(self) -> None:
+        interval = 1_000_000_000 // self.fps  # ns
+        deadline = time.perf_counter_ns()
+
+        while True:
+            with self.lock:
+                while self.pending is None and self.running:
+                    self.frame_ready.wait()
+                if self.pending is None:
+                    return
+
+            # Newer frames replace the pending one while waiting for a slot
+            delay = deadline - time.perf_counter_ns()
+            if delay > 0 and self.running:
+                time.sleep(delay / 1_000_000_000)
+
+            with self.lock:
+                rows, dirty_rows, full_redraw = self.pending
+                self.pending = None
+
+            front = self.front
+            front.rows[:] = rows
+            front.dirty_rows |= dirty_rows
+            front.full_redraw |= full_redraw
+            front.render()
+            self.frames_rendered += 1
+
+            # Output can't keep up, there is no point to catch up later
+            deadline += interval
+            now = time.perf_counter_ns()
+            if now > deadline:
+                self.frames_late += 1
+                deadline = now
+
+    def report(self) -> str:
+        return (
+            f'{self.frames_rendered} frames rendered, '
+            f'{self.frames_skipped} skipped, {self.frames_late} late'
+        )
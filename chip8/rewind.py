@@ -0,0 +1,143 @@
+import time
+import zlib
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+
+
+def xor_bytes(a: bytes, b: bytes) -> bytes:
+    # XORing two equally sized blobs at once as big integers
+    return (
+        int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')
+    ).to_bytes(len(a), 'big')
+
+
+class RewindBuffer:
+    """
+    Bounded history of machine states, one entry per frame.
+    Most frames are stored as compressed XOR deltas against the previous
+    frame, a compressed keyframe is stored every keyframe_interval frames.
+    Oldest keyframe with its deltas is dropped once the memory cap is hit
+    """
+
+    DEFAULT_MAX_BYTES: int = 4 * 1024 * 1024
+    DEFAULT_KEYFRAME_INTERVAL: int = 60  # Frames, once a second
+    COMPRESSION_LEVEL: int = 1
+
+    chip: 'Chip8'
+    max_bytes: int
+    keyframe_interval: int
+
+    # (is keyframe, compressed payload), the oldest entry is a keyframe
+    entries: deque[tuple[bool, bytes]]
+    previous_state: bytes | None  # Raw state of the last entry
+    frames_since_keyframe: int
+    nbytes: int  # Memory used by payloads
+
+    captures: int
+    capture_time: int  # ns spent capturing in total
+
+    def __init__(
+        self,
+        chip: 'Chip8',
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> None:
+        if keyframe_interval <= 0:
+            err_msg = f'Keyframe interval must be positive: {keyframe_interval}'
+            raise ValueError(err_msg)
+
+        self.chip = chip
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+
+        self.entries = deque()
+        self.previous_state = None
+        self.frames_since_keyframe = 0
+        self.nbytes = 0
+
+        self.captures = 0
+        self.capture_time = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def capture_cost(self) -> float:
+        """Average time added to each frame by capturing it, ns"""
+        return self.capture_time / self.captures if self.captures else 0.0
+
+    def capture(self) -> None:
+        start = time.perf_counter_ns()
+        state = self.chip.snapshot()
+
+        is_keyframe = (
+            self.previous_state is None
+            or self.frames_since_keyframe >= self.keyframe_interval
+        )
+        if is_keyframe:
+            payload = state
+            self.frames_since_keyframe = 0
+        else:
+            payload = xor_bytes(state, self.previous_state)
+
+        # Deltas are mostly zeroes, so they compress really well
+        payload = zlib.compress(payload, self.COMPRESSION_LEVEL)
+        self.entries.append((is_keyframe, payload))
+        self.nbytes += len(payload)
+
+        self.previous_state = state
+        self.frames_since_keyframe += 1
+
+        self.evict()
+
+        self.captures += 1
+        self.capture_time += time.perf_counter_ns() - start
+
+    def evict(self) -> None:
+        # Deltas can't be applied without their keyframe, so the oldest
+        # keyframe is dropped together with all of its deltas
+        while self.nbytes > self.max_bytes and len(self.entries) > 1:
+            _, payload = self.entries.popleft()
+            self.nbytes -= len(payload)
+
+            while self.entries and not self.entries[0][0]:
+                _, payload = self.entries.popleft()
+                self.nbytes -= len(payload)
+
+        if not self.entries:
+            self.previous_state = None
+
+    def rewind(self, frames: int) -> int:
+        """
+        Restoring machine state captured given amount of frames ago,
+        0 is the last captured frame. Newer frames are discarded, so the
+        machine resumes from there. Returns amount of frames rewound
+        """
+        if not self.entries:
+            return 0
+
+        frames = max(0, min(frames, len(self.entries) - 1))
+        target = len(self.entries) - 1 - frames
+
+        # Searching for the keyframe and replaying deltas up to the target
+        keyframe = target
+        while not self.entries[keyframe][0]:
+            keyframe -= 1
+
+        state = zlib.decompress(self.entries[keyframe][1])
+        for index in range(keyframe + 1, target + 1):
+            delta = zlib.decompress(self.entries[index][1])
+            state = xor_bytes(state, delta)
+
+        for _ in range(frames):
+            _, payload = self.entries.pop()
+            self.nbytes -= len(payload)
+
+        self.previous_state = state
+        self.frames_since_keyframe = target - keyframe + 1
+
+        self.chip.restore(state)
+        return frames
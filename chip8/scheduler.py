@@ -0,0 +1,323 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+
+
+class Chip8Scheduler:
+    """
+    Driving the whole machine by a virtual cycle counter.
+    Each timer frame (60 Hz by default) runs its share of CPU cycles, counts
+    down timers, polls the keyboard and renders the display. When throttled,
+    scheduler sleeps until the next frame deadline, otherwise it runs as fast
+    as possible and results depend only on the amount of emulated frames.
+    Async run shares an event loop with other machines and sleeps while the
+    machine waits for a key
+    """
+
+    FRAME_RATE: int = 60  # Hz
+    MAX_LAG_FRAMES: int = 10  # Frames to catch up before dropping behind
+    RATE_WINDOW: int = 1_000_000_000  # ns between instructions/s updates
+
+    chip: 'Chip8'
+    throttle: bool
+
+    frame_rate: int  # Timer frequency, Hz
+    instructions_per_frame: int | None  # Overrides CPU clock rate if set
+
+    cycles: int  # Virtual CPU cycles executed since boot
+    frames: int  # Frames emulated since boot
+
+    # Called at the end of every frame, e.g. to capture rewind history
+    frame_listeners: list[Callable[[], None]]
+
+    # Instructions per second actually reached, measured over wall time.
+    # Idle loop iterations skipped without executing them don't count
+    instructions_per_second: float
+    rate_window_start: int  # ns
+    rate_window_cycles: int  # Executed cycles when the window started
+
+    def __init__(
+        self,
+        chip: 'Chip8',
+        *,
+        throttle: bool = True,
+        frame_rate: int = FRAME_RATE,
+        instructions_per_frame: int | None = None,
+    ) -> None:
+        if frame_rate <= 0:
+            raise ValueError(f'Timer rate must be positive: {frame_rate}')
+        if instructions_per_frame is not None and instructions_per_frame <= 0:
+            err_msg = (
+                'Instructions per frame must be positive: '
+                f'{instructions_per_frame}'
+            )
+            raise ValueError(err_msg)
+
+        self.chip = chip
+        self.throttle = throttle
+
+        self.frame_rate = frame_rate
+        self.instructions_per_frame = instructions_per_frame
+
+        self.cycles = 0
+        self.frames = 0
+
+        self.frame_listeners = []
+
+        self.instructions_per_second = 0.0
+        self.rate_window_start = time.perf_counter_ns()
+        self.rate_window_cycles = 0
+
+    @property
+    def executed_cycles(self) -> int:
+        """Virtual cycles minus the ones idle loop skipping jumped over"""
+        idle_loops = self.chip.idle_loops
+        if idle_loops is None:
+            return self.cycles
+        return self.cycles - idle_loops.cycles_skipped
+
+    @property
+    def clock_rate(self) -> int:
+        """Emulated CPU frequency, Hz"""
+        if self.instructions_per_frame is not None:
+            return self.instructions_per_frame * self.frame_rate
+        return self.chip.clock_rate
+
+    @property
+    def frame_duration(self) -> int:
+        return 1_000_000_000 // self.frame_rate  # ns
+
+    def cycles_in_frame(self, frame: int) -> int:
+        if self.instructions_per_frame is not None:
+            return self.instructions_per_frame
+
+        # CPU rate is rarely a multiple of frame rate, so cycles are spread
+        # across frames: 100 Hz gives 1, 2, 2, 1, 2, 2... cycles per frame
+        rate = self.chip.clock_rate
+        return (
+            (frame + 1) * rate // self.frame_rate
+            - frame * rate // self.frame_rate
+        )
+
+    def cycles_between(self, first_frame: int, last_frame: int) -> int:
+        """Cycles in frames from first_frame up to, excluding, last_frame"""
+        if self.instructions_per_frame is not None:
+            return (last_frame - first_frame) * self.instructions_per_frame
+
+        rate = self.chip.clock_rate
+        return (
+            last_frame * rate // self.frame_rate
+            - first_frame * rate // self.frame_rate
+        )
+
+    def frame_of_cycle(self, first_frame: int, cycle: int) -> int:
+        """Frames after first_frame until the one running its nth cycle"""
+        if self.instructions_per_frame is not None:
+            return cycle // self.instructions_per_frame
+
+        # Inverse of cycles_between, the smallest frame ending past cycle
+        rate = self.chip.clock_rate
+        first_cycle = first_frame * rate // self.frame_rate
+        last_frame = -(-(first_cycle + cycle + 1) * self.frame_rate // rate)
+        return last_frame - first_frame - 1
+
+    def run_frame(self) -> None:
+        chip = self.chip
+
+        cycles = self.cycles_in_frame(self.frames)
+        chip.run_cycles(cycles)
+        self.cycles += cycles
+
+        # Timers count frames by themselves, only the end of a tone
+        # has to be noticed
+        self.frames += 1
+        if chip.sound_timer.playing:
+            chip.sound_timer.emit_edges()
+
+        chip.keyboard.tick()
+        chip.display.render()
+
+        for listener in self.frame_listeners:
+            listener()
+
+    @property
+    def waiting_for_key(self) -> bool:
+        """Machine is spinning in Fx0A and nothing can wake it but a key"""
+        keyboard = self.chip.keyboard
+        return (
+            keyboard.EVENT_DRIVEN
+            and keyboard.waiting_for_input
+            and not keyboard.pending_keys
+        )
+
+    def skip_frames(self, frames: int) -> None:
+        """
+        Advancing virtual time of an idle machine without running it,
+        e.g. the CPU would only repeat Fx0A all this time
+        """
+        chip = self.chip
+        self.cycles += self.cycles_between(self.frames, self.frames + frames)
+        self.frames += frames
+
+        if chip.sound_timer.playing:
+            chip.sound_timer.emit_edges()
+
+        # Held keys are released as if the keyboard was ticked all along
+        chip.keyboard.frames += frames - 1
+        chip.keyboard.tick()
+
+    def skip_idle_frames(self, last_frame: int | None) -> None:
+        """
+        Fast-forwarding virtual time through frames the CPU only spends
+        in an idle loop. Every frame listener and keyboard tick is expected
+        to happen, so nothing is skipped while any of them could matter
+        """
+        chip = self.chip
+        keyboard = chip.keyboard
+        if (
+            chip.idle_loops is None
+            or self.frame_listeners
+            or not keyboard.EVENT_DRIVEN
+            or keyboard.pressed_keys
+            or keyboard.pending_keys
+        ):
+            return
+
+        limit = None if last_frame is None else last_frame - self.frames
+        chip.idle_loops.skip_frames(chip, self, limit)
+
+    def next_deadline(self, deadline: int) -> tuple[int, float]:
+        """Next frame deadline and seconds to sleep until it"""
+        deadline += self.frame_duration
+        delay = deadline - time.perf_counter_ns()
+
+        # Host can't keep up (or turbo was just turned off),
+        # there is no point to catch up forever
+        if -delay > self.MAX_LAG_FRAMES * self.frame_duration:
+            deadline = time.perf_counter_ns()
+
+        return deadline, max(0, delay) / 1_000_000_000
+
+    def measure_rate(self, *, force: bool = False) -> None:
+        now = time.perf_counter_ns()
+        elapsed = now - self.rate_window_start
+        if elapsed <= 0 or (elapsed < self.RATE_WINDOW and not force):
+            return
+
+        # Skipping may be suspended mid-window, e.g. by profiling
+        cycles = self.executed_cycles
+        executed = max(cycles - self.rate_window_cycles, 0)
+        self.instructions_per_second = executed * 1_000_000_000 / elapsed
+
+        self.rate_window_start = now
+        self.rate_window_cycles = cycles
+
+    def run(self, frames: int | None = None) -> None:
+        """Running given amount of frames, forever if frames is None"""
+        deadline = time.perf_counter_ns()
+
+        self.rate_window_start = deadline
+        self.rate_window_cycles = self.executed_cycles
+
+        last_frame = None if frames is None else self.frames + frames
+        try:
+            while last_frame is None or self.frames < last_frame:
+                self.run_frame()
+                self.measure_rate()
+
+                # Throttle can be toggled while running, so it is checked
+                # every frame, turbo mode skips sleeping and idle frames
+                if not self.throttle:
+                    self.skip_idle_frames(last_frame)
+                    continue
+
+                deadline, delay = self.next_deadline(deadline)
+                if delay:
+                    time.sleep(delay)
+        finally:
+            # Short runs and interrupted ones still report their rate
+            self.measure_rate(force=True)
+
+    async def run_async(self, frames: int | None = None) -> None:
+        """
+        Running given amount of frames as a coroutine, yielding to other
+        machines after every frame. Machine waiting for a key sleeps until
+        one is queued and its timers catch up with the time slept
+        """
+        loop = asyncio.get_running_loop()
+        key_queued = asyncio.Event()
+        keyboard = self.chip.keyboard
+        keyboard.key_notifier = lambda: loop.call_soon_threadsafe(
+            key_queued.set,
+        )
+
+        deadline = time.perf_counter_ns()
+
+        self.rate_window_start = deadline
+        self.rate_window_cycles = self.executed_cycles
+
+        last_frame = None if frames is None else self.frames + frames
+        try:
+            while last_frame is None or self.frames < last_frame:
+                self.run_frame()
+                self.measure_rate()
+
+                if self.waiting_for_key:
+                    await self.sleep_until_key(key_queued, last_frame)
+                    deadline = time.perf_counter_ns()
+                    continue
+
+                delay = 0.0
+                if self.throttle:
+                    deadline, delay = self.next_deadline(deadline)
+                else:
+                    self.skip_idle_frames(last_frame)
+                await asyncio.sleep(delay)
+        finally:
+            keyboard.key_notifier = None
+            self.measure_rate(force=True)
+
+    async def sleep_until_key(
+        self,
+        key_queued: asyncio.Event,
+        last_frame: int | None,
+    ) -> None:
+        # Cleared before checking, so a key queued meanwhile isn't missed
+        key_queued.clear()
+        if not self.waiting_for_key:
+            return
+
+        remaining = None if last_frame is None else last_frame - self.frames
+
+        # Waking up when the tone runs out, so it stops on time
+        sound_timer = self.chip.sound_timer
+        if sound_timer.playing:
+            playing = sound_timer.expires - self.frames
+            if remaining is None or playing < remaining:
+                remaining = playing
+
+        # Emulated time doesn't pass in turbo mode, limited run just ends
+        if not self.throttle:
+            if remaining is None:
+                await key_queued.wait()
+            elif remaining:
+                self.skip_frames(remaining)
+            return
+
+        start = time.perf_counter_ns()
+        timeout = None
+        if remaining is not None:
+            timeout = remaining * self.frame_duration / 1_000_000_000
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(key_queued.wait(), timeout)
+
+        skipped = (time.perf_counter_ns() - start) // self.frame_duration
+        if remaining is not None:
+            skipped = min(skipped, remaining)
+        if skipped:
+            self.skip_frames(skipped)
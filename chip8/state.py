@@ -0,0 +1,115 @@
+import struct
+from typing import TYPE_CHECKING
+
+from .errors import Chip8Panic
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+    from .input import Chip8Keyboard
+
+# Save state layout, all numbers are big-endian:
+#   header    magic, format version
+#   machine   V0..VF, I, counter, delay timer, sound timer,
+#             pressed keys, keyboard waiting flag, captured key (0xFF
+#             if none), cycles, frames
+#   keyboard  frames ticked, frames each key stays held for
+#   memory    4096 bytes
+#   display   32 packed 64-bit rows
+STATE_MAGIC: bytes = b'C8ST'
+STATE_VERSION: int = 3
+
+HEADER = struct.Struct('>4sB')
+MACHINE = struct.Struct('>16sHHBBHBBQQ')
+KEYBOARD = struct.Struct('>Q16H')
+
+NO_KEY: int = 0xFF
+DISPLAY = struct.Struct('>32Q')
+
+
+def save_state(chip: 'Chip8') -> bytes:
+    """Capturing full machine state into a compact binary blob"""
+    keyboard = chip.keyboard
+    return b''.join((
+        HEADER.pack(STATE_MAGIC, STATE_VERSION),
+        MACHINE.pack(
+            bytes(chip.registers.v),
+            chip.registers.i,
+            chip.counter,
+            chip.delay_timer.value,
+            chip.sound_timer.value,
+            chip.keyboard.pressed_keys,
+            chip.keyboard.waiting_for_input,
+            NO_KEY if chip.keyboard.captured_key is None
+            else chip.keyboard.captured_key,
+            chip.scheduler.cycles,
+            chip.scheduler.frames,
+        ),
+        KEYBOARD.pack(
+            keyboard.frames,
+            *(
+                max(release_frame - keyboard.frames, 0)
+                for release_frame in keyboard.release_frames
+            ),
+        ),
+        chip.memory.data,
+        DISPLAY.pack(*chip.display.rows),
+    ))
+
+
+def load_state(chip: 'Chip8', state: bytes) -> None:
+    """Restoring machine state captured by save_state"""
+    memory_size = len(chip.memory.data)
+    expected_size = (
+        HEADER.size + MACHINE.size + KEYBOARD.size + memory_size + DISPLAY.size
+    )
+    if len(state) != expected_size:
+        raise Chip8Panic(f'Invalid save state size: {len(state)}')
+
+    magic, version = HEADER.unpack_from(state)
+    if magic != STATE_MAGIC:
+        raise Chip8Panic('Invalid save state: wrong magic bytes')
+    if version != STATE_VERSION:
+        raise Chip8Panic(f'Unsupported save state version: {version}')
+
+    offset = HEADER.size
+    (
+        v, i, counter, delay, sound, pressed_keys, waiting_for_input,
+        captured_key, cycles, frames,
+    ) = MACHINE.unpack_from(state, offset)
+    offset += MACHINE.size
+
+    # Registers and memory are updated in place, compiled code and views
+    # keep referencing the same buffers
+    chip.registers.v[:] = v
+    chip.registers.i = i
+    chip.counter = counter
+
+    chip.keyboard.pressed_keys = pressed_keys
+    chip.keyboard.waiting_for_input = bool(waiting_for_input)
+    chip.keyboard.captured_key = (
+        None if captured_key == NO_KEY else captured_key
+    )
+
+    chip.scheduler.cycles = cycles
+    chip.scheduler.frames = frames
+
+    load_keyboard(chip.keyboard, state, offset)
+    offset += KEYBOARD.size
+
+    # Timers count from the restored frame
+    chip.delay_timer.update(delay)
+    chip.sound_timer.update(sound)
+
+    # Writing through Chip8Memory, so instruction caches are invalidated
+    chip.memory.write(0, state[offset : offset + memory_size])
+    offset += memory_size
+
+    chip.display.rows[:] = DISPLAY.unpack_from(state, offset)
+    chip.display.full_redraw = True
+
+
+def load_keyboard(keyboard: 'Chip8Keyboard', state: bytes, offset: int) -> None:
+    # Held keys are released as many frames later as they would have been
+    frames, *held_frames = KEYBOARD.unpack_from(state, offset)
+    keyboard.frames = frames
+    keyboard.release_frames[:] = [frames + held for held in held_frames]
@@ -0,0 +1,357 @@
+import contextlib
+import re
+import selectors
+import socket
+import stat
+import struct
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .display import Chip8Display
+from .errors import Chip8Panic
+
+if TYPE_CHECKING:
+    from .cpu import Chip8
+
+# Frame stream layout, little-endian except for display rows:
+#   greeting   magic, protocol version, display width and height
+#   messages   type, frame number, payload length, payload
+# Keyframe payload is the whole display, 32 big-endian 64-bit rows. Delta
+# payload is a bitmask of changed rows followed by those rows XORed with
+# the previous frame, with runs of zero bytes encoded as (0, run length)
+STREAM_MAGIC: bytes = b'C8FS'
+STREAM_VERSION: int = 1
+
+GREETING = struct.Struct('<4sBBB')
+MESSAGE = struct.Struct('<BIH')
+ROWS = struct.Struct('>32Q')
+ROW = struct.Struct('>Q')
+ROW_MASK = struct.Struct('<I')
+
+KEYFRAME: int = 1
+DELTA: int = 2
+
+Address = tuple[str, int] | str  # (host, port) or Unix socket path
+Frame = tuple[int, ...]
+
+ZERO_RUN = re.compile(rb'\x00{1,255}')
+ZERO_RUN_TOKEN = re.compile(rb'\x00(.)', re.DOTALL)
+
+
+def parse_address(address: str) -> Address:
+    """"host:port" for TCP, anything else is a Unix socket path"""
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def remove_socket(path: str) -> None:
+    """Removing a stale Unix socket, anything else at path is left alone"""
+    socket_path = Path(path)
+    try:
+        mode = socket_path.stat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f'Not a Unix socket, refusing to remove: {path}')
+    socket_path.unlink(missing_ok=True)
+
+
+def rle_encode(data: bytes) -> bytes:
+    return ZERO_RUN.sub(lambda run: bytes((0, len(run[0]))), data)
+
+
+def rle_decode(data: bytes) -> bytes:
+    return ZERO_RUN_TOKEN.sub(lambda token: bytes(token[1][0]), data)
+
+
+def encode_keyframe(frame: int, rows: Frame) -> bytes:
+    header = MESSAGE.pack(KEYFRAME, frame & 0xFFFFFFFF, ROWS.size)
+    return header + ROWS.pack(*rows)
+
+
+def encode_delta(frame: int, previous: Frame, rows: Frame) -> bytes:
+    changed_rows = 0
+    changes: list[bytes] = []
+    for y, (old, new) in enumerate(zip(previous, rows, strict=True)):
+        if old != new:
+            changed_rows |= 1 << y
+            changes.append(ROW.pack(old ^ new))
+
+    payload = ROW_MASK.pack(changed_rows) + rle_encode(b''.join(changes))
+    return MESSAGE.pack(DELTA, frame & 0xFFFFFFFF, len(payload)) + payload
+
+
+def apply_delta(previous: Frame, payload: bytes) -> Frame:
+    changed_rows = ROW_MASK.unpack_from(payload)[0]
+    changes = rle_decode(payload[ROW_MASK.size :])
+
+    rows = list(previous)
+    offset = 0
+    for y in range(len(rows)):
+        if changed_rows >> y & 1:
+            rows[y] ^= ROW.unpack_from(changes, offset)[0]
+            offset += ROW.size
+    return tuple(rows)
+
+
+class FrameSubscriber:
+    """Connection of a single viewer, owned by the server thread"""
+
+    connection: socket.socket
+    last_frame: Frame | None  # Frame the viewer has, None before keyframe
+    output: bytearray  # Encoded frames the socket didn't accept yet
+    frames_sent: int
+    frames_dropped: int
+
+    def __init__(self, connection: socket.socket) -> None:
+        self.connection = connection
+        self.last_frame = None
+        self.output = bytearray()
+        self.frames_sent = 0
+        self.frames_dropped = 0
+
+
+class FrameServer:
+    """
+    Publishing display frames to any amount of viewers over a socket.
+    CPU loop only hands the latest frame over, encoding and sending happen
+    in a background thread. Viewers still busy with a previous frame skip
+    the new one, their next delta covers all the changes they missed
+    """
+
+    BACKLOG: int = 16
+
+    chip: 'Chip8'
+    display: Chip8Display
+    address: Address
+    listener: socket.socket
+    selector: selectors.BaseSelector
+    subscribers: dict[socket.socket, FrameSubscriber]
+
+    # Latest published frame, replaced by the CPU thread
+    latest: tuple[int, Frame] | None
+    frames_published: int
+
+    wakeup_receiver: socket.socket
+    wakeup_sender: socket.socket
+    running: bool
+    thread: threading.Thread
+
+    def __init__(self, chip: 'Chip8', address: Address) -> None:
+        self.chip = chip
+        self.display = chip.display
+        self.address = address
+
+        if isinstance(address, str):
+            remove_socket(address)
+            self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(address)
+        self.listener.listen(self.BACKLOG)
+        self.listener.setblocking(False)
+
+        # Port 0 binds to any free port
+        if not isinstance(address, str):
+            self.address = self.listener.getsockname()[:2]
+
+        self.wakeup_receiver, self.wakeup_sender = socket.socketpair()
+        self.wakeup_receiver.setblocking(False)
+        self.wakeup_sender.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.selector.register(self.wakeup_receiver, selectors.EVENT_READ)
+        self.subscribers = {}
+
+        self.latest = None
+        self.frames_published = 0
+
+        self.running = True
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+        chip.scheduler.frame_listeners.append(self.publish)
+
+    def publish(self) -> None:
+        """Handing the current display frame over, never blocks"""
+        rows = tuple(self.display.rows)
+        if self.latest is not None and self.latest[1] == rows:
+            return
+
+        self.latest = (self.chip.scheduler.frames, rows)
+        self.frames_published += 1
+
+        # Server thread may be busy and not drained earlier wakeups yet
+        with contextlib.suppress(BlockingIOError):
+            self.wakeup_sender.send(b'\0')
+
+    def close(self) -> None:
+        if self.publish in self.chip.scheduler.frame_listeners:
+            self.chip.scheduler.frame_listeners.remove(self.publish)
+
+        self.running = False
+        with contextlib.suppress(BlockingIOError):
+            self.wakeup_sender.send(b'\0')
+        self.thread.join()
+
+        for connection in list(self.subscribers):
+            self.disconnect(connection)
+        self.selector.close()
+        self.listener.close()
+        self.wakeup_receiver.close()
+        self.wakeup_sender.close()
+
+        if isinstance(self.address, str):
+            remove_socket(self.address)
+
+    def serve(self) -> None:
+        while self.running:
+            for key, events in self.selector.select():
+                connection = key.fileobj
+                if connection is self.listener:
+                    self.accept()
+                elif connection is self.wakeup_receiver:
+                    with contextlib.suppress(BlockingIOError):
+                        self.wakeup_receiver.recv(4096)
+                elif connection not in self.subscribers:
+                    continue  # Disconnected meanwhile
+                elif events & selectors.EVENT_READ:
+                    self.receive(connection)
+                elif events & selectors.EVENT_WRITE:
+                    self.flush(self.subscribers[connection])
+
+            if self.latest is not None:
+                for subscriber in list(self.subscribers.values()):
+                    self.send_latest(subscriber)
+
+    def accept(self) -> None:
+        with contextlib.suppress(BlockingIOError):
+            connection, _ = self.listener.accept()
+            connection.setblocking(False)
+
+            subscriber = FrameSubscriber(connection)
+            subscriber.output += GREETING.pack(
+                STREAM_MAGIC, STREAM_VERSION,
+                self.display.WIDTH, self.display.HEIGHT,
+            )
+            self.subscribers[connection] = subscriber
+            self.selector.register(connection, selectors.EVENT_READ)
+            self.flush(subscriber)
+
+    def receive(self, connection: socket.socket) -> None:
+        # Viewers never send anything, readable socket means it's closed
+        try:
+            data = connection.recv(4096)
+        except ConnectionError:
+            data = b''
+        if not data:
+            self.disconnect(connection)
+
+    def disconnect(self, connection: socket.socket) -> None:
+        self.subscribers.pop(connection, None)
+        self.selector.unregister(connection)
+        connection.close()
+
+    def send_latest(self, subscriber: FrameSubscriber) -> None:
+        frame, rows = self.latest
+        if rows is subscriber.last_frame:
+            return
+
+        # Viewer hasn't received the previous frame yet
+        if subscriber.output and subscriber.last_frame is not None:
+            subscriber.frames_dropped += 1
+            return
+
+        if subscriber.last_frame is None:
+            message = encode_keyframe(frame, rows)
+        else:
+            message = encode_delta(frame, subscriber.last_frame, rows)
+        subscriber.output += message
+        subscriber.last_frame = rows
+        subscriber.frames_sent += 1
+
+        self.flush(subscriber)
+
+    def flush(self, subscriber: FrameSubscriber) -> None:
+        connection = subscriber.connection
+        try:
+            sent = connection.send(subscriber.output)
+        except BlockingIOError:
+            sent = 0
+        except ConnectionError:
+            self.disconnect(connection)
+            return
+        del subscriber.output[:sent]
+
+        # Waiting for the socket to become writable only while behind
+        events = selectors.EVENT_READ
+        if subscriber.output:
+            events |= selectors.EVENT_WRITE
+        if self.selector.get_key(connection).events != events:
+            self.selector.modify(connection, events)
+
+
+class FrameClient:
+    """Receiving frames published by FrameServer"""
+
+    connection: socket.socket
+    width: int
+    height: int
+
+    def __init__(self, address: Address) -> None:
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self.connection = socket.socket(family, socket.SOCK_STREAM)
+        self.connection.connect(address)
+
+        magic, version, self.width, self.height = GREETING.unpack(
+            self.receive(GREETING.size),
+        )
+        if magic != STREAM_MAGIC:
+            raise Chip8Panic('Invalid frame stream: wrong magic bytes')
+        if version != STREAM_VERSION:
+            raise Chip8Panic(f'Unsupported frame stream version: {version}')
+
+    def __enter__(self) -> 'FrameClient':
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def receive(self, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.connection.recv(size - len(data))
+            if not chunk:
+                raise EOFError('Frame stream closed')
+            data += chunk
+        return bytes(data)
+
+    def frames(self) -> Iterator[tuple[int, Frame]]:
+        """Frame number and packed rows of every received frame"""
+        rows: Frame | None = None
+        while True:
+            try:
+                header = self.receive(MESSAGE.size)
+            except EOFError:
+                return
+
+            message_type, frame, length = MESSAGE.unpack(header)
+            payload = self.receive(length)
+
+            if message_type == KEYFRAME:
+                rows = ROWS.unpack(payload)
+            elif message_type == DELTA and rows is not None:
+                rows = apply_delta(rows, payload)
+            else:
+                raise Chip8Panic(f'Unexpected frame message: {message_type}')
+
+            yield frame, rows
+
+    def close(self) -> None:
+        self.connection.close()
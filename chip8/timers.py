@@ -1,30 +1,89 @@
-import time
+import sys
+from typing import TYPE_CHECKING
 
-from .utils import QuartzClock, parse_byte
+from .utils import parse_byte
 
+if TYPE_CHECKING:
+    from .scheduler import Chip8Scheduler
 
-class Chip8Timer(QuartzClock):
-    value: int
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.value = 0
+class Chip8Timer:
+    """
+    Counting down once a frame without ever being ticked: timer keeps the
+    frame it runs out at and computes its value from the current frame
+    """
 
-    def update(self, value: int) -> None:
-        self.value = parse_byte(value)
+    scheduler: 'Chip8Scheduler'
+    expires: int  # Frame the timer reaches zero at
+
+    def __init__(self, scheduler: 'Chip8Scheduler') -> None:
+        self.scheduler = scheduler
+        self.expires = scheduler.frames
+
+    @property
+    def value(self) -> int:
+        return max(self.expires - self.scheduler.frames, 0)
 
-    def tick(self) -> None:
-        if self.value > 0:
-            self.value -= 1
+    @value.setter
+    def value(self, value: int) -> None:
+        self.update(value)
+
+    def update(self, value: int) -> None:
+        self.expires = self.scheduler.frames + parse_byte(value)
 
 
 class DelayTimer(Chip8Timer):
     pass
 
 
+class SoundSink:
+    """Sound output, told when the tone starts and stops. Silent itself"""
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class TerminalBell(SoundSink):
+    """Ringing the terminal bell once a tone starts, it can't be held"""
+
+    def start(self) -> None:  # noqa: PLR6301
+        sys.stdout.write('\a')
+        sys.stdout.flush()
+
+
 class SoundTimer(Chip8Timer):
-    def tick(self) -> None:
-        super().tick()
+    """
+    Tone plays while the timer is above zero. Sink only gets its edges:
+    start once the timer is set, stop once it's cleared or runs out
+    """
+
+    sink: SoundSink
+    playing: bool
+
+    def __init__(
+        self,
+        scheduler: 'Chip8Scheduler',
+        sink: SoundSink | None = None,
+    ) -> None:
+        super().__init__(scheduler)
+        self.sink = SoundSink() if sink is None else sink
+        self.playing = False
+
+    def update(self, value: int) -> None:
+        super().update(value)
+        self.emit_edges()
+
+    def emit_edges(self) -> None:
+        """Telling the sink if the tone started or stopped since last call"""
+        playing = self.expires > self.scheduler.frames
+        if playing == self.playing:
+            return
 
-        if self.value == 0:
-            print('BEEP!')
+        self.playing = playing
+        if playing:
+            self.sink.start()
+        else:
+            self.sink.stop()
@@ -0,0 +1,208 @@
+import queue
+import struct
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from .decoder import DECODE_TABLE
+from .errors import Chip8Panic
+
+if TYPE_CHECKING:
+    from .compiler import BlockCompiler
+    from .cpu import Chip8
+    from .idle import IdleLoopDetector
+
+# Trace layout: header with magic, format version and record size, followed
+# by fixed-size records, little-endian:
+#   cycle, counter, opcode, changed register (0xFF if none), its value, VF, I
+# Instructions change at most one register besides VF, so VF is recorded
+# after every instruction and is the changed register only if it is alone
+TRACE_MAGIC: bytes = b'C8TR'
+TRACE_VERSION: int = 2
+
+HEADER = struct.Struct('<4sBB')
+RECORD = struct.Struct('<QHHBBBH')
+
+NO_REGISTER: int = 0xFF
+FLAG_REGISTER: int = 0xF
+
+TraceRecord = tuple[int, int, int, int, int, int, int]
+
+
+class TraceWriter:
+    """
+    Appending a record per executed instruction to preallocated blocks.
+    Full blocks are written to disk by a background thread and handed back
+    for reuse, so the CPU only waits if the disk can't keep up at all
+    """
+
+    BLOCK_RECORDS: int = 64 * 1024  # 1 MB per block
+    BLOCKS: int = 8
+
+    chip: 'Chip8'
+    compiler: 'BlockCompiler | None'  # Suspended while tracing
+    idle_loops: 'IdleLoopDetector | None'  # Suspended while tracing
+    # Instance step it replaced, e.g. profiled one, and the traced step
+    replaced_step: Callable[[], None] | None
+    traced_step: Callable[[], None] | None
+    path: Path
+    cycle: int  # Cycle of the next traced instruction
+    records: int  # Records written in total
+
+    block: bytearray  # Block being filled
+    offset: int  # Write offset in the current block
+    free_blocks: queue.Queue[bytearray]
+    full_blocks: queue.Queue[tuple[bytearray, int] | None]
+    flusher: threading.Thread
+
+    def __init__(self, chip: 'Chip8', path: str | Path) -> None:
+        self.chip = chip
+        self.compiler = None
+        self.idle_loops = None
+        self.replaced_step = None
+        self.traced_step = None
+        self.path = Path(path)
+        self.cycle = chip.scheduler.cycles
+        self.records = 0
+
+        self.free_blocks = queue.Queue()
+        for _ in range(self.BLOCKS):
+            self.free_blocks.put(bytearray(self.BLOCK_RECORDS * RECORD.size))
+        self.full_blocks = queue.Queue()
+
+        self.block = self.free_blocks.get()
+        self.offset = 0
+
+        file = self.path.open('wb')
+        file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD.size))
+
+        self.flusher = threading.Thread(
+            target=self.flush_blocks, args=(file,), daemon=True,
+        )
+        self.flusher.start()
+
+    def flush_blocks(self, file: BinaryIO) -> None:
+        with file:
+            while (item := self.full_blocks.get()) is not None:
+                block, length = item
+                file.write(memoryview(block)[:length])
+                self.free_blocks.put(block)
+
+    def submit_block(self) -> None:
+        self.full_blocks.put((self.block, self.offset))
+        self.block = self.free_blocks.get()
+        self.offset = 0
+
+    def install(self) -> None:
+        chip = self.chip
+        step = chip.step  # Profiling may be wrapping it already
+        registers = chip.registers
+        memory = chip.memory
+        pack_into = RECORD.pack_into
+        block_size = self.BLOCK_RECORDS * RECORD.size
+
+        def traced_step() -> None:
+            counter = chip.counter
+            opcode = memory.read_word(counter)
+            before = bytes(registers.v)
+
+            step()
+
+            v = registers.v
+            register, value = NO_REGISTER, 0
+            if before != v:
+                register = next(
+                    index for index, byte in enumerate(v)
+                    if byte != before[index]
+                )
+                value = v[register]
+
+            pack_into(
+                self.block, self.offset, self.cycle, counter, opcode,
+                register, value, v[FLAG_REGISTER], registers.i,
+            )
+            self.cycle += 1
+            self.records += 1
+            self.offset += RECORD.size
+            if self.offset == block_size:
+                self.submit_block()
+
+        # Compiled blocks and skipped idle loops don't go through step
+        self.compiler, chip.compiler = chip.compiler, None
+        self.idle_loops, chip.idle_loops = chip.idle_loops, None
+        self.replaced_step = vars(chip).get('step')
+        self.traced_step = chip.step = traced_step
+
+    def close(self) -> None:
+        """Stopping tracing and writing everything left to disk"""
+        # Putting the replaced step back would drop anything wrapping ours
+        chip = self.chip
+        if vars(chip).get('step') is not self.traced_step:
+            err_msg = (
+                'Chip8.step was replaced after tracing was enabled, '
+                'disable that first'
+            )
+            raise RuntimeError(err_msg)
+
+        if self.replaced_step is None:
+            del chip.step
+        else:
+            chip.step = self.replaced_step
+        self.replaced_step = self.traced_step = None
+
+        self.chip.compiler, self.compiler = self.compiler, None
+        self.chip.idle_loops, self.idle_loops = self.idle_loops, None
+
+        if self.offset:
+            self.full_blocks.put((self.block, self.offset))
+        self.full_blocks.put(None)
+        self.flusher.join()
+
+
+def read_trace(
+    path: str | Path,
+    *,
+    address_range: tuple[int, int] | None = None,
+    opcode_class: str | None = None,
+    chunk_records: int = 64 * 1024,
+) -> Iterator[TraceRecord]:
+    """
+    Streaming trace records, only a chunk of the file is kept in memory.
+    Records can be filtered by an inclusive counter range and by an opcode
+    class, e.g. "8xy4"
+    """
+    with Path(path).open('rb') as file:
+        magic, version, record_size = HEADER.unpack(file.read(HEADER.size))
+        if magic != TRACE_MAGIC:
+            raise Chip8Panic('Invalid trace: wrong magic bytes')
+        if version != TRACE_VERSION:
+            raise Chip8Panic(f'Unsupported trace version: {version}')
+        if record_size != RECORD.size:
+            err_msg = (
+                f'Invalid trace: {record_size} bytes per record, '
+                f'expected {RECORD.size}'
+            )
+            raise Chip8Panic(err_msg)
+
+        handler_name = None
+        if opcode_class is not None:
+            handler_name = f'op_{opcode_class.lower()}'
+
+        while chunk := file.read(chunk_records * RECORD.size):
+            # Last record may be cut if the writer was killed
+            chunk = chunk[: len(chunk) - len(chunk) % RECORD.size]
+
+            for record in RECORD.iter_unpack(chunk):
+                counter, opcode = record[1], record[2]
+                if address_range is not None and not (
+                    address_range[0] <= counter <= address_range[1]
+                ):
+                    continue
+                if (
+                    handler_name is not None
+                    and DECODE_TABLE[opcode][0] != handler_name
+                ):
+                    continue
+
+                yield record
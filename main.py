@@ -1,8 +1,12 @@
 import os
+import signal
 import argparse
 from pathlib import Path
 
 from chip8 import Chip8
+from chip8.scheduler import Chip8Scheduler
+from chip8.streaming import parse_address
+from chip8.timers import TerminalBell
 
 
 def clear_screen() -> None:
@@ -10,18 +14,160 @@ def clear_screen() -> None:
 
 
 if __name__ == '__main__':
-    chip = Chip8()
-
     parser = argparse.ArgumentParser(description='Run the CHIP-8 emulator.')
-    parser.add_argument('rom_path', type=str, help='Path to the ROM file to load.')
+    parser.add_argument(
+        'rom_path', type=str, nargs='?',
+        help='Path to the ROM file to load, optional with --state.',
+    )
+    parser.add_argument(
+        '--state', type=str, default=None,
+        help='Path to a save state to resume from.',
+    )
+    parser.add_argument(
+        '--save-state', type=str, default=None,
+        help='Path to write a save state to once stopped.',
+    )
+    parser.add_argument(
+        '--record', type=str, default=None,
+        help='Path to record key presses to.',
+    )
+    parser.add_argument(
+        '--replay', type=str, default=None,
+        help='Path to replay recorded key presses from, no terminal input.',
+    )
+    parser.add_argument(
+        '--frames', type=int, default=None,
+        help='Stop after given amount of frames (default: run forever).',
+    )
+    parser.add_argument(
+        '--profile', type=int, default=None, metavar='N',
+        help='Profile opcodes and print top N hot addresses once stopped.',
+    )
+    parser.add_argument(
+        '--trace', type=str, default=None,
+        help='Path to write binary execution trace to.',
+    )
+    parser.add_argument(
+        '--render-fps', type=int, default=None, metavar='FPS',
+        help='Render from a separate thread at most FPS times a second.',
+    )
+    parser.add_argument(
+        '--export', type=str, default=None, metavar='PATH',
+        help='Directory for image frames, or a file or pipe for raw frames.',
+    )
+    parser.add_argument(
+        '--export-format', choices=('png', 'ppm', 'raw'), default='png',
+        help='Exported frames format (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--export-scale', type=int, default=4,
+        help='Integer scale of exported frames (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--export-fps', type=int, default=None,
+        help='Exported frames per emulated second (default: every frame).',
+    )
+    parser.add_argument(
+        '--serve', type=str, default=None, metavar='ADDRESS',
+        help='Stream frames to viewers on host:port or a Unix socket path.',
+    )
+    parser.add_argument(
+        '--engine', choices=Chip8.ENGINES, default='interpreter',
+        help='Execution engine (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--mode', choices=Chip8.MODES, default='strict',
+        help='Strict mode panics on invalid values and addresses, '
+        'fast mode masks and wraps them (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--clock-rate', type=int, default=Chip8.CLOCK_RATE,
+        help='CPU instructions per second (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--timer-rate', type=int, default=Chip8Scheduler.FRAME_RATE,
+        help='Timers frequency and frame rate, Hz (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--instructions-per-frame', type=int, default=None,
+        help='Fixed amount of instructions per frame, overrides --clock-rate.',
+    )
+    parser.add_argument(
+        '--turbo', action='store_true',
+        help='Run as fast as possible, send SIGUSR1 to toggle it at runtime.',
+    )
+    parser.add_argument(
+        '--no-skip-idle', action='store_true',
+        help='Execute idle loops instead of skipping them.',
+    )
     args = parser.parse_args()
 
-    rom_data = Path(args.rom_path).read_bytes()
-    chip.memory.write(chip.PROGRAM_START, rom_data)
+    if args.rom_path is None and args.state is None:
+        parser.error('either rom_path or --state is required')
+
+    chip = Chip8(
+        args.engine,
+        clock_rate=args.clock_rate,
+        timer_rate=args.timer_rate,
+        instructions_per_frame=args.instructions_per_frame,
+        turbo=args.turbo,
+        skip_idle=not args.no_skip_idle,
+        mode=args.mode,
+    )
+
+    chip.sound_timer.sink = TerminalBell()
+
+    # Turbo mode can be switched on and off while running: kill -USR1 <pid>
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda *_: chip.toggle_turbo())
+
+    # Save state already contains memory with the ROM loaded
+    if args.state is not None:
+        chip.restore(Path(args.state).read_bytes())
+    else:
+        rom_data = Path(args.rom_path).read_bytes()
+        chip.memory.write(chip.PROGRAM_START, rom_data)
+
+    if args.replay is not None:
+        chip.replay_input(args.replay)
+    recorder = None if args.record is None else chip.record_input(args.record)
+    profiler = None if args.profile is None else chip.enable_profiling()
+    if args.trace is not None:
+        chip.enable_tracing(args.trace)
+    render_thread = None
+    if args.render_fps is not None:
+        render_thread = chip.enable_render_thread(args.render_fps)
+    exporter = None
+    if args.export is not None:
+        exporter = chip.export_frames(
+            args.export, args.export_format, args.export_scale, args.export_fps,
+        )
+    server = None
+    if args.serve is not None:
+        server = chip.serve_frames(parse_address(args.serve))
 
     try:
         # clear_screen()
-        chip.run()
+        chip.run(args.frames)
     except KeyboardInterrupt:
         # clear_screen()
         print('\nStopped')
+    finally:
+        if recorder is not None:
+            recorder.close()
+        chip.disable_tracing()
+        chip.disable_render_thread()
+        if exporter is not None:
+            exporter.close()
+        if server is not None:
+            server.close()
+
+    print(f'Reached {chip.instructions_per_second:.0f} instructions/s')
+    if render_thread is not None:
+        print(render_thread.report())
+
+    if profiler is not None:
+        print(profiler.report(args.profile))
+
+    if args.save_state is not None:
+        Path(args.save_state).write_bytes(chip.snapshot())
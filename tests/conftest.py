@@ -0,0 +1,22 @@
+import pytest
+
+from chip8.cpu import Chip8
+
+SPRITE_ADDRESS = 0x300
+
+
+@pytest.fixture
+def make_chip8(mocker):
+    """
+    Factory of machines with program loaded at the program start and the
+    sprite at 0x300. Other arguments go to Chip8, rendering is stubbed out
+    """
+
+    def make_chip8(program, engine='interpreter', *, sprite=b'', **options):
+        chip8 = Chip8(engine, **options)
+        chip8.memory.write(chip8.PROGRAM_START, program)
+        chip8.memory.write(SPRITE_ADDRESS, sprite)
+        mocker.patch.object(chip8.display, 'render')
+        return chip8
+
+    return make_chip8
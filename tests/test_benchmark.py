@@ -0,0 +1,33 @@
+import pytest
+
+from chip8.benchmark import PROGRAMS, find_regressions, run_suite
+
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_benchmark_programs(name):
+    report = run_suite([name], frames=5, instructions_per_frame=50)
+
+    assert len(report['results']) == 2  # One per engine
+    for result in report['results']:
+        assert result['benchmark'] == name
+        assert result['instructions'] == 5 * 50
+        assert result['instructions_per_second'] > 0
+        assert result['ns_per_instruction'] > 0
+
+
+def test_find_regressions():
+    def report(instructions_per_second):
+        return {'results': [{
+            'benchmark': 'alu',
+            'engine': 'interpreter',
+            'instructions_per_second': instructions_per_second,
+        }]}
+
+    baseline = report(1000.0)
+
+    assert find_regressions(report(950.0), baseline, threshold=0.1) == []
+    assert find_regressions(report(2000.0), baseline, threshold=0.1) == []
+
+    regressions = find_regressions(report(800.0), baseline, threshold=0.1)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('alu [interpreter]')
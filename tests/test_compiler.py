@@ -0,0 +1,83 @@
+import pytest
+
+from chip8.cpu import Chip8
+
+PROGRAM = bytes([
+    0x60, 0x05,  # 0x200: LD V0, 5
+    0x61, 0x00,  # 0x202: LD V1, 0
+    0x71, 0x01,  # 0x204: ADD V1, 1
+    0x80, 0x14,  # 0x206: ADD V0, V1
+    0xA3, 0x00,  # 0x208: LD I, 0x300
+    0xD0, 0x11,  # 0x20A: DRW V0, V1, 1
+    0x31, 0x10,  # 0x20C: SE V1, 0x10
+    0x12, 0x04,  # 0x20E: JP 0x204
+    0x12, 0x10,  # 0x210: JP 0x210
+])
+SPRITE = bytes([0b11110000])
+
+
+def machine_state(chip8):
+    return (
+        chip8.counter,
+        bytes(chip8.registers.v),
+        chip8.registers.i,
+        [bytes(row) for row in chip8.display.pixels],
+    )
+
+
+def test_chip8_unknown_engine():
+    with pytest.raises(ValueError, match='Unknown execution engine: jit'):
+        Chip8(engine='jit')
+
+
+@pytest.mark.parametrize('cycles', [1, 2, 5, 6, 7, 50, 111, 200])
+def test_compiler_matches_interpreter(cycles, make_chip8):
+    interpreter = make_chip8(PROGRAM, 'interpreter', sprite=SPRITE)
+    compiler = make_chip8(PROGRAM, 'compiler', sprite=SPRITE)
+
+    interpreter.run_cycles(cycles)
+    compiler.run_cycles(cycles)
+
+    assert machine_state(compiler) == machine_state(interpreter)
+
+
+@pytest.mark.parametrize('cycles', [1, 7, 111, 200])
+def test_compiler_matches_interpreter_in_fast_mode(cycles, make_chip8):
+    interpreter = make_chip8(PROGRAM, 'interpreter', sprite=SPRITE, mode='fast')
+    compiler = make_chip8(PROGRAM, 'compiler', sprite=SPRITE, mode='fast')
+
+    interpreter.run_cycles(cycles)
+    compiler.run_cycles(cycles)
+
+    assert machine_state(compiler) == machine_state(interpreter)
+
+
+def test_compiler_block_boundaries(make_chip8):
+    chip8 = make_chip8(PROGRAM, 'compiler', sprite=SPRITE)
+
+    block = chip8.compiler.get_block(0x200)
+    assert (block.start, block.end, block.length) == (0x200, 0x20C, 6)
+    assert 'chip.op_dxyn(0, 1, 1)' in block.source
+
+    block = chip8.compiler.get_block(0x20C)
+    assert (block.start, block.end, block.length) == (0x20C, 0x20E, 1)
+
+
+def test_compiler_unknown_opcode_is_interpreted(make_chip8):
+    chip8 = make_chip8(bytes([0xFF, 0xFF]), 'compiler')
+
+    assert chip8.compiler.get_block(0x200) is None
+
+
+def test_compiler_invalidates_overwritten_blocks(make_chip8):
+    chip8 = make_chip8(PROGRAM, 'compiler', sprite=SPRITE)
+    chip8.run_cycles(1)
+    assert 0x200 in chip8.compiler.blocks
+
+    # Self-modifying code: LD V0, 5 becomes LD V0, 7
+    chip8.counter = 0x200
+    chip8.memory.write_byte(0x201, 0x07)
+    assert 0x200 not in chip8.compiler.blocks
+
+    chip8.run_cycles(6)
+    assert chip8.registers.get_v(0) == 0x07 + 1
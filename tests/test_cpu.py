@@ -2,10 +2,10 @@ from functools import partial
 
 import pytest
 
-from chip8.cpu import Chip8, Chip8Registers
+from chip8.cpu import Chip8, Chip8Registers, FastRegisters
 from chip8.display import Chip8Display
 from chip8.errors import Chip8Panic
-from chip8.memory import Chip8Memory
+from chip8.memory import Chip8Memory, FastMemory
 
 
 @pytest.fixture
@@ -56,6 +56,74 @@ def test_chip8_initialization(chip8):
     assert isinstance(chip8.registers, Chip8Registers)
 
 
+def test_chip8_unknown_mode():
+    with pytest.raises(ValueError, match='Unknown execution mode: release'):
+        Chip8(mode='release')
+
+
+def test_chip8_fast_mode():
+    chip8 = Chip8(mode='fast')
+
+    assert isinstance(chip8.memory, FastMemory)
+    assert isinstance(chip8.registers, FastRegisters)
+
+
+def test_chip8_fast_registers_mask_values():
+    registers = FastRegisters()
+
+    registers.set_v(1, 300)
+    registers.set_i(0x12345)
+
+    assert registers.get_v(1) == 300 & 0xFF
+    assert registers.get_i() == 0x2345
+
+
+@pytest.mark.parametrize('engine', Chip8.ENGINES)
+def test_chip8_modes_on_overflow(engine):
+    program = bytes([0x60, 0xFF, 0x70, 0x02])  # LD V0, 0xFF; ADD V0, 2
+
+    strict = Chip8(engine)
+    strict.memory.write(0x200, program)
+    with pytest.raises(Chip8Panic, match='257 is not valid for 1 byte'):
+        strict.run_cycles(2)
+
+    fast = Chip8(engine, mode='fast')
+    fast.memory.write(0x200, program)
+    fast.run_cycles(2)
+    assert fast.registers.v[0] == 0x01
+
+
+def test_chip8_fast_mode_sprite_wraps_memory():
+    chip8 = Chip8(mode='fast')
+    chip8.memory.write(0xFFF, bytes([0x80]))
+    chip8.memory.write(0x000, bytes([0x80]))
+    chip8.registers.i = 0xFFF
+
+    chip8.execute_opcode(0xD002)  # DRW V0, V0, 2
+
+    assert chip8.display.rows[0] == chip8.display.rows[1] == 1 << 63
+
+
+@pytest.mark.parametrize('engine', Chip8.ENGINES)
+def test_chip8_modes_on_counter_overflow(engine):
+    # ADD V0, 1 at the end of memory and at its start
+    program = bytes([0x70, 0x01, 0x70, 0x01])
+
+    strict = Chip8(engine)
+    strict.memory.write(0xFFC, program)
+    strict.counter = 0xFFC
+    with pytest.raises(Chip8Panic):
+        strict.run_cycles(3)
+
+    fast = Chip8(engine, mode='fast')
+    fast.memory.write(0xFFC, program)
+    fast.memory.write(0x000, program)
+    fast.counter = 0xFFC
+    fast.run_cycles(4)
+    assert fast.counter == 0x004
+    assert fast.registers.v[0] == 4
+
+
 def test_chip8_fetch_opcode(chip8):
     chip8.memory.write(0x200, bytes([0x12, 0x34]))
     opcode = chip8.fetch_opcode()
@@ -155,8 +223,8 @@ def test_chip8_execute_opcode_Dxyn_with_collision(chip8, mocker):
     assert chip8.registers.get_v(0xF) == 1
 
 
-def test_chip8_execute_opcode_Fx07(chip8, mocker):
-    mocker.patch.object(chip8.delay_timer, 'value', 0xFF)
+def test_chip8_execute_opcode_Fx07(chip8):
+    chip8.delay_timer.update(0xFF)
     chip8.execute_opcode(0xF407)  # Set V4 = delay timer value of 0xFF
 
     assert chip8.registers.get_v(4) == 0xFF
@@ -227,6 +295,39 @@ def test_chip8_execute_opcode_3xkk(v_index, v_value, opcode, offset, chip8):
     assert counter_before_opcode + offset == chip8.counter
 
 
+@pytest.mark.parametrize(('pressed_key', 'opcode', 'offset'), [
+    (0x0, 0xE29E, 2),  # Key V2 (0) is pressed
+    (0x5, 0xE29E, 0),  # Key V2 (0) is not pressed
+    (0x0, 0xE2A1, 0),  # Key V2 (0) is pressed
+    (0x5, 0xE2A1, 2),  # Key V2 (0) is not pressed
+])
+def test_chip8_execute_opcode_Ex9E_ExA1(pressed_key, opcode, offset, chip8):
+    counter_before_opcode = chip8.counter
+
+    chip8.keyboard.press_key(pressed_key)
+    chip8.execute_opcode(opcode)
+
+    assert counter_before_opcode + offset == chip8.counter
+
+
+def test_chip8_execute_opcode_Fx0A(chip8):
+    chip8.counter += 2  # As if fetched by step
+    chip8.execute_opcode(0xF30A)
+
+    # Staying at the same opcode until a key is pressed
+    assert chip8.counter == Chip8.PROGRAM_START
+    assert chip8.keyboard.waiting_for_input
+
+    chip8.registers.set_v(3, 0xAA)
+    chip8.keyboard.press_key(0x0)
+    chip8.counter += 2
+    chip8.execute_opcode(0xF30A)
+
+    # Key 0 is a valid key too
+    assert chip8.registers.get_v(3) == 0x0
+    assert chip8.counter == Chip8.PROGRAM_START + 2
+
+
 def test_chip8_execute_opcode_unknown(chip8):
     with pytest.raises(Chip8Panic, match='Unknown opcode "0xffff"'):
         chip8.execute_opcode(0xFFFF)
@@ -234,30 +335,75 @@ def test_chip8_execute_opcode_unknown(chip8):
 
 def test_chip8_tick(chip8, mocker):
     mocker.patch.object(chip8, 'fetch_opcode', return_value=0x00E0)
-    mocker.patch.object(chip8, 'execute_opcode')
+    mocker.patch.object(chip8.display, 'clear')
     mocker.patch.object(chip8.display, 'render')
 
     chip8.tick()
 
     assert chip8.counter == chip8.PROGRAM_START + 2
-    assert chip8.execute_opcode.called
+    assert chip8.display.clear.called
     assert chip8.display.render.called
 
 
+def test_chip8_instruction_cache(chip8, mocker):
+    chip8.memory.write(0x200, bytes([0x12, 0x00]))  # 1200 - JP 0x200
+    mocker.patch.object(chip8.display, 'render')
+    fetch_spy = mocker.spy(chip8, 'fetch_opcode')
+
+    for _ in range(3):
+        chip8.tick()
+
+    # Instruction is decoded once and then served from the cache
+    assert fetch_spy.call_count == 1
+    assert chip8.instruction_cache[0x200] == (Chip8.op_1nnn, (0x200,))
+
+
+@pytest.mark.parametrize('address', [0x200, 0x201])
+def test_chip8_instruction_cache_invalidation(address, chip8, mocker):
+    chip8.memory.write(0x200, bytes([0x12, 0x00]))  # 1200 - JP 0x200
+    mocker.patch.object(chip8.display, 'render')
+    chip8.tick()
+
+    # Self-modifying code: rewriting any byte of the cached instruction
+    chip8.memory.write(0x200, bytes([0x60, 0x42]))  # 6042 - LD V0, 0x42
+    chip8.memory.write_byte(address, chip8.memory.data[address])
+    assert chip8.instruction_cache[0x200] is None
+
+    chip8.tick()
+    assert chip8.registers.get_v(0) == 0x42
+    assert chip8.counter == 0x202
+
+
 def test_chip8_run(chip8, mocker):
-    # Tests the run method by simulating a few ticks
-    ticks_counter = 0
+    # Tests the run method by simulating a few steps
+    steps_counter = 0
 
-    def self_destructing_tick(_self):
-        nonlocal ticks_counter
-        if ticks_counter == 5:
+    def self_destructing_step(_self):
+        nonlocal steps_counter
+        if steps_counter == 5:
             # Simulate stopping the infinite loop
             raise KeyboardInterrupt
-        ticks_counter += 1
+        steps_counter += 1
 
-    mocker.patch.object(chip8, 'tick', partial(self_destructing_tick, chip8))
+    mocker.patch.object(chip8, 'step', partial(self_destructing_step, chip8))
+    mocker.patch.object(chip8.display, 'render')
 
     with pytest.raises(KeyboardInterrupt):
-        chip8.run()
+        chip8.run(throttle=False)
+
+    assert steps_counter == 5
+
+
+def test_chip8_run_frames(chip8, mocker):
+    chip8.memory.write(0x200, bytes([0x12, 0x00]))  # 1200 - JP 0x200
+    mocker.patch.object(chip8.display, 'render')
+    chip8.idle_loops = None  # Executing the loop every frame
+    chip8.delay_timer.update(0x10)
+
+    chip8.run(frames=6, throttle=False)
 
-    assert ticks_counter == 5
+    # 100 Hz CPU runs 10 cycles in 6 frames of 60 Hz, timers tick once a frame
+    assert chip8.scheduler.frames == 6
+    assert chip8.scheduler.cycles == 10
+    assert chip8.delay_timer.value == 0x10 - 6
+    assert chip8.display.render.call_count == 6
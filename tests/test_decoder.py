@@ -0,0 +1,32 @@
+import pytest
+
+from chip8.cpu import Chip8
+from chip8.decoder import DECODE_TABLE, build_dispatch_table, decode
+
+
+@pytest.mark.parametrize(('opcode', 'handler_name', 'operands'), [
+    (0x00E0, 'op_00e0', ()),
+    (0x1234, 'op_1nnn', (0x234,)),
+    (0x3A12, 'op_3xkk', (0xA, 0x12)),
+    (0x8454, 'op_8xy4', (4, 5)),
+    (0xD23F, 'op_dxyn', (2, 3, 0xF)),
+    (0xF40A, 'op_fx0a', (4,)),
+    (0x8455, 'op_unknown', (0x8455,)),
+    (0xFFFF, 'op_unknown', (0xFFFF,)),
+])
+def test_decode(opcode, handler_name, operands):
+    assert decode(opcode) == (handler_name, operands)
+
+
+def test_decode_table_matches_decode():
+    assert len(DECODE_TABLE) == 0x10000
+    assert all(
+        DECODE_TABLE[opcode] == decode(opcode) for opcode in range(0x10000)
+    )
+
+
+def test_dispatch_table_is_shared_between_instances():
+    table = build_dispatch_table(Chip8)
+
+    assert Chip8().dispatch_table is table
+    assert table[0x1234] == (Chip8.op_1nnn, (0x234,))
@@ -0,0 +1,65 @@
+import json
+
+from chip8.disassembler import ControlFlowGraph
+
+ROM = bytes([
+    0x60, 0x00,  # 0x200: LD V0, 0
+    0x30, 0x01,  # 0x202: SE V0, 1
+    0x12, 0x0A,  # 0x204: JP 0x20A
+    0x12, 0x0C,  # 0x206: JP 0x20C
+    0xF0, 0x90,  # 0x208: sprite data
+    0x70, 0x01,  # 0x20A: ADD V0, 1
+    0x12, 0x02,  # 0x20C: JP 0x202
+    0xFF,        # 0x20E: trailing odd byte
+])
+
+
+def test_cfg_skips_embedded_data():
+    cfg = ControlFlowGraph(ROM)
+
+    assert sorted(cfg.instructions) == [
+        0x200, 0x202, 0x204, 0x206, 0x20A, 0x20C,
+    ]
+    assert cfg.labels == {0x202, 0x204, 0x206, 0x20A, 0x20C}
+
+
+def test_cfg_blocks():
+    cfg = ControlFlowGraph(ROM)
+
+    assert {
+        start: (block.end, block.successors)
+        for start, block in cfg.blocks.items()
+    } == {
+        0x200: (0x202, [0x202]),
+        0x202: (0x204, [0x204, 0x206]),
+        0x204: (0x206, [0x20A]),
+        0x206: (0x208, [0x20C]),
+        0x20A: (0x20C, [0x20C]),
+        0x20C: (0x20E, [0x202]),
+    }
+
+
+def test_cfg_listing():
+    lines = ControlFlowGraph(ROM).listing()
+
+    assert 'L0202:' in lines
+    assert '0208: f0   — data 11110000' in lines
+    assert lines[-1] == '020e: ff   — data 11111111'
+
+
+def test_cfg_stops_at_unknown_opcode():
+    cfg = ControlFlowGraph(bytes([0x60, 0x00, 0x00, 0x00, 0x60, 0x01]))
+
+    assert sorted(cfg.instructions) == [0x200, 0x202]
+
+
+def test_cfg_json():
+    data = json.loads(json.dumps(ControlFlowGraph(ROM).to_json()))
+
+    assert data['entry'] == 0x200
+    assert data['data'] == [0x208, 0x209, 0x20E]
+    assert data['blocks'][1]['instructions'] == [{
+        'address': 0x202,
+        'opcode': 0x3001,
+        'mnemonic': '3xkk - SE V0, 1',
+    }]
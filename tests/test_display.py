@@ -116,3 +116,66 @@ def test_draw_sprite_collision_flag_with_wrapping():
     assert display.pixels[31][0:2] == bytearray([0, 0])
     assert display.pixels[0][62:64] == bytearray([0, 0])
     assert display.pixels[0][0:2] == bytearray([0, 0])
+
+
+def test_render_writes_only_dirty_rows(capsys):
+    display = Chip8Display()
+    display.render()  # First render is a full frame
+    capsys.readouterr()
+
+    display.draw_sprite(bytes([0b10000000, 0, 0b00000001]), 0, 4)
+    display.render()
+    stdout_data = capsys.readouterr().out
+
+    # Rows 4 and 6 are changed, row 5 sprite byte is empty
+    expected_row_4 = display.PIXEL_CHAR + ' ' * (display.WIDTH - 1)
+    expected_row_6 = ' ' * 7 + display.PIXEL_CHAR + ' ' * (display.WIDTH - 8)
+    assert stdout_data == (
+        f'\033[5;1H{expected_row_4}\033[7;1H{expected_row_6}'
+    )
+
+
+def test_render_unchanged_frame_writes_nothing(capsys):
+    display = Chip8Display()
+    display.render()
+    capsys.readouterr()
+
+    display.render()
+    assert not capsys.readouterr().out
+
+    # Clearing an empty screen doesn't change anything either
+    display.clear()
+    display.render()
+    assert not capsys.readouterr().out
+
+
+def test_render_after_clear(capsys):
+    display = Chip8Display()
+    display.draw_sprite(bytes([0xFF]), 0, 10)
+    display.render()
+    capsys.readouterr()
+
+    display.clear()
+    display.render()
+    assert capsys.readouterr().out == '\033[11;1H' + ' ' * display.WIDTH
+
+
+def test_display_packed_rows():
+    display = Chip8Display()
+    display.draw_sprite(bytes([0b10100000]), 62, 1)  # Wrapping around
+
+    assert display.rows[1] == (1 << 1) | (1 << 63)
+    assert display.rows[0] == display.rows[2] == 0
+
+
+def test_display_pixels_view_writes_through():
+    display = Chip8Display()
+    display.pixels[3][5] = 1
+
+    assert display.rows[3] == 1 << (display.WIDTH - 1 - 5)
+    assert display.pixels[3][5] == 1
+    assert display.pixels[3][4:7] == bytearray([0, 1, 0])
+    assert bytes(display.pixels[3]) == bytes(5) + b'\x01' + bytes(58)
+
+    display.pixels[3][5] = 0
+    assert display.rows[3] == 0
@@ -0,0 +1,119 @@
+import struct
+import zlib
+
+import pytest
+
+from chip8.export import FrameEncoder, PngEncoder, PpmEncoder
+
+ROWS = [0] * 32
+ROWS[0] = 1 << 63  # Top left pixel
+ROWS[31] = 0b11  # Two bottom right pixels
+
+WHITE, BLACK = b'\xff\xff\xff', b'\x00\x00\x00'
+
+
+def pixel(rgb, width, x, y):
+    offset = (y * width + x) * 3
+    return rgb[offset : offset + 3]
+
+
+def test_frame_encoder_scales_pixels():
+    encoder = FrameEncoder(scale=3)
+    rgb = encoder.encode(ROWS)
+
+    assert len(rgb) == 192 * 96 * 3
+    assert all(
+        pixel(rgb, 192, x, y) == WHITE for x in range(3) for y in range(3)
+    )
+    assert pixel(rgb, 192, 3, 0) == pixel(rgb, 192, 0, 3) == BLACK
+    assert pixel(rgb, 192, 191, 95) == pixel(rgb, 192, 186, 93) == WHITE
+    assert pixel(rgb, 192, 185, 95) == BLACK
+
+
+def test_frame_encoder_caches_unchanged_frame():
+    encoder = FrameEncoder(scale=2)
+    frame = encoder.encode(ROWS)
+
+    assert encoder.encode(list(ROWS)) is frame
+    assert encoder.encode([0] * 32) is not frame
+
+
+def test_ppm_encoder():
+    ppm = PpmEncoder(scale=2).encode(ROWS)
+
+    assert ppm.startswith(b'P6\n128 64\n255\n')
+    assert ppm.endswith(FrameEncoder(scale=2).encode(ROWS))
+
+
+def test_png_encoder():
+    png = PngEncoder(scale=2).encode(ROWS)
+    assert png.startswith(b'\x89PNG\r\n\x1a\n')
+
+    # Walking the chunks and unpacking the image data
+    chunks = {}
+    offset = 8
+    while offset < len(png):
+        (length,) = struct.unpack_from('>I', png, offset)
+        kind = png[offset + 4 : offset + 8]
+        data = png[offset + 8 : offset + 8 + length]
+        (crc,) = struct.unpack_from('>I', png, offset + 8 + length)
+        assert crc == zlib.crc32(kind + data)
+        chunks[kind] = data
+        offset += 12 + length
+
+    width, height, *_ = struct.unpack('>IIBBBBB', chunks[b'IHDR'])
+    assert (width, height) == (128, 64)
+    assert chunks[b'IEND'] == b''
+
+    scanlines = zlib.decompress(chunks[b'IDAT'])
+    rgb = FrameEncoder(scale=2).encode(ROWS)
+    assert scanlines == b''.join(
+        b'\x00' + rgb[offset : offset + 128 * 3]
+        for offset in range(0, len(rgb), 128 * 3)
+    )
+
+
+def test_frame_encoder_invalid_scale():
+    with pytest.raises(ValueError, match='Scale must be positive'):
+        FrameEncoder(scale=0)
+
+
+@pytest.fixture
+def chip8(make_chip8):
+    return make_chip8(bytes([0x12, 0x00]))  # JP 0x200
+
+
+def test_export_image_sequence(chip8, tmp_path):
+    exporter = chip8.export_frames(tmp_path / 'frames', 'ppm', scale=1, fps=30)
+    chip8.run(frames=10, throttle=False)
+    exporter.close()
+
+    names = sorted(path.name for path in (tmp_path / 'frames').iterdir())
+    assert names == [f'frame_{index:06d}.ppm' for index in range(5)]
+    assert exporter.frames_exported == 5
+
+
+def test_export_fps_not_dividing_frame_rate(chip8, tmp_path):
+    exporter = chip8.export_frames(tmp_path / 'frames', 'ppm', fps=25)
+    chip8.run(frames=120, throttle=False)
+    exporter.close()
+
+    assert exporter.frames_exported == 50
+
+
+def test_export_raw_stream(chip8, tmp_path):
+    chip8.display.rows[:] = ROWS
+    exporter = chip8.export_frames(tmp_path / 'frames.rgb', 'raw', scale=2)
+    chip8.run(frames=3, throttle=False)
+    exporter.close()
+
+    frame = FrameEncoder(scale=2).encode(ROWS)
+    assert (tmp_path / 'frames.rgb').read_bytes() == frame * 3
+    assert exporter.export not in chip8.scheduler.frame_listeners
+
+
+def test_export_invalid_options(chip8, tmp_path):
+    with pytest.raises(ValueError, match='Unknown export format'):
+        chip8.export_frames(tmp_path, 'gif')
+    with pytest.raises(ValueError, match='Export FPS must be in'):
+        chip8.export_frames(tmp_path, 'png', fps=120)
@@ -0,0 +1,84 @@
+import time
+
+import pytest
+
+from chip8.benchmark import PROGRAMS, SPRITE, SPRITE_ADDRESS
+from chip8.cpu import Chip8
+from chip8.fleet import SEQUENCE, Chip8Fleet, frame_hash, summarize
+
+# Sprites benchmark with the sprite loaded right after the program
+ROM = PROGRAMS['sprites'].ljust(
+    SPRITE_ADDRESS - Chip8.PROGRAM_START, b'\x00',
+) + SPRITE
+
+
+@pytest.fixture
+def fleet():
+    with Chip8Fleet(3, workers=2) as fleet:
+        yield fleet
+
+
+@pytest.fixture
+def expected(make_chip8):
+    # Same machine the workers run, in this process
+    return make_chip8(ROM, instructions_per_frame=20, turbo=True)
+
+
+def test_fleet_runs_machines(fleet, expected):
+    for _ in range(2):
+        fleet.start(ROM, 30, instructions_per_frame=20)
+
+    results = fleet.wait()
+    expected.run(30)
+
+    assert [result['frames'] for result in results] == [30, 30]
+    assert {result['frame_hash'] for result in results} == {
+        frame_hash(expected.display.rows),
+    }
+
+    summary = summarize(results)
+    assert summary['machines'] == 2
+    assert summary['frames'] == 60
+    assert summary['frame_hashes'] == {results[0]['frame_hash']: 2}
+
+
+def test_fleet_reads_shared_screen(fleet, expected):
+    slot = fleet.start(ROM, 10, instructions_per_frame=20)
+    fleet.result(slot)
+
+    expected.run(10)
+    state = fleet.read(slot)
+
+    assert state[:2] == (10, 200)
+    assert state[3] == bytes(expected.registers.v)
+    assert fleet.screen(slot) == tuple(expected.display.rows)
+
+
+def test_fleet_stops_endless_machine(fleet):
+    slot = fleet.start(ROM, instructions_per_frame=20, turbo=False)
+    while fleet.read(slot)[0] < 3:
+        time.sleep(0.01)
+
+    fleet.stop(slot)
+    result = fleet.result(slot, timeout=5)
+
+    assert result['frames'] >= 3
+    assert fleet.read(slot)[0] == result['frames']
+
+
+def test_fleet_read_gives_up_on_dead_worker(fleet):
+    # Slot left in the middle of a write with no worker to finish it
+    SEQUENCE.pack_into(fleet.shm.buf, 0, 1)
+
+    with pytest.raises(RuntimeError, match='stopped while writing'):
+        fleet.read(0)
+
+
+def test_fleet_slots_are_limited(fleet):
+    slots = [fleet.start(ROM, 1) for _ in range(3)]
+
+    with pytest.raises(RuntimeError, match='No free fleet slots'):
+        fleet.start(ROM, 1)
+
+    fleet.result(slots[0])
+    assert fleet.start(ROM, 1) == slots[0]
@@ -0,0 +1,172 @@
+import pytest
+
+from chip8.cpu import Chip8
+from chip8.idle import JUMP, KEY_POLL, KEY_WAIT, TIMER_POLL
+
+SPRITE: bytes = bytes([0xF0, 0x90, 0x90, 0x90, 0xF0])
+
+ROMS: dict[str, bytes] = {
+    # Waiting for the delay timer to run out over and over
+    'timer_poll': bytes([
+        0x60, 0x10,  # 0x200: LD V0, 0x10
+        0xF0, 0x15,  # 0x202: LD DT, V0
+        0xF1, 0x07,  # 0x204: LD V1, DT
+        0x31, 0x00,  # 0x206: SE V1, 0
+        0x12, 0x04,  # 0x208: JP 0x204
+        0x12, 0x00,  # 0x20A: JP 0x200
+    ]),
+    # Waiting for the delay timer to reach 5, then drawing
+    'timer_value': bytes([
+        0x63, 0x03,  # 0x200: LD V3, 3
+        0x60, 0x20,  # 0x202: LD V0, 0x20
+        0xF0, 0x15,  # 0x204: LD DT, V0
+        0xF1, 0x07,  # 0x206: LD V1, DT
+        0x31, 0x05,  # 0x208: SE V1, 5
+        0x12, 0x06,  # 0x20A: JP 0x206
+        0xA3, 0x00,  # 0x20C: LD I, 0x300
+        0xD2, 0x25,  # 0x20E: DRW V2, V2, 5
+        0x82, 0x34,  # 0x210: ADD V2, V3
+        0x12, 0x02,  # 0x212: JP 0x202
+    ]),
+    # Polling while the timer holds a value, then forever once it's zero
+    'timer_hold': bytes([
+        0x60, 0x08,  # 0x200: LD V0, 8
+        0xF0, 0x15,  # 0x202: LD DT, V0
+        0xF0, 0x18,  # 0x204: LD ST, V0
+        0xF1, 0x07,  # 0x206: LD V1, DT
+        0x41, 0x08,  # 0x208: SNE V1, 8
+        0x12, 0x06,  # 0x20A: JP 0x206
+        0x60, 0x00,  # 0x20C: LD V0, 0
+        0xF0, 0x15,  # 0x20E: LD DT, V0
+        0xF2, 0x07,  # 0x210: LD V2, DT
+        0x42, 0x00,  # 0x212: SNE V2, 0
+        0x12, 0x10,  # 0x214: JP 0x210
+    ]),
+    # Drawing once and parking in a jump to itself
+    'jump': bytes([
+        0x60, 0x05,  # 0x200: LD V0, 5
+        0xF0, 0x15,  # 0x202: LD DT, V0
+        0xA3, 0x00,  # 0x204: LD I, 0x300
+        0xD0, 0x05,  # 0x206: DRW V0, V0, 5
+        0x12, 0x08,  # 0x208: JP 0x208
+    ]),
+}
+
+CONFIGS: list[dict] = [
+    {'clock_rate': 100},
+    {'clock_rate': 500},
+    {'instructions_per_frame': 1},
+    {'instructions_per_frame': 2},
+    {'instructions_per_frame': 3},
+    {'instructions_per_frame': 100},
+]
+
+CHUNKS: list[int] = [1, 1, 5, 13, 60, 300]
+
+
+@pytest.mark.parametrize('engine', Chip8.ENGINES)
+@pytest.mark.parametrize('config', CONFIGS)
+@pytest.mark.parametrize('name', ROMS)
+def test_idle_skipping_keeps_state(name, config, engine, mocker, make_chip8):
+    expected = make_chip8(
+        ROMS[name], engine, sprite=SPRITE, turbo=True, skip_idle=False,
+        **config,
+    )
+    chip = make_chip8(ROMS[name], engine, sprite=SPRITE, turbo=True, **config)
+    for machine in (expected, chip):
+        machine.sound_timer.sink = mocker.Mock()
+
+    for frames in CHUNKS:
+        expected.run(frames)
+        chip.run(frames)
+        assert chip.snapshot() == expected.snapshot()
+    assert chip.idle_loops.cycles_skipped
+
+    # Tone starts and stops exactly as often
+    assert chip.sound_timer.sink.mock_calls == (
+        expected.sound_timer.sink.mock_calls
+    )
+
+
+@pytest.mark.parametrize('rom', [
+    bytes([0xF0, 0x0A, 0x12, 0x00]),  # Fx0A, JP 0x200
+    bytes([0x60, 0x05, 0xE0, 0x9E, 0x12, 0x02, 0x12, 0x06]),  # SKP V0
+    bytes([0x60, 0x05, 0xE0, 0xA1, 0x12, 0x02, 0x12, 0x00]),  # SKNP V0
+])
+@pytest.mark.parametrize('config', CONFIGS)
+def test_idle_skipping_key_loops(rom, config, make_chip8):
+    expected = make_chip8(rom, turbo=True, skip_idle=False, **config)
+    chip = make_chip8(rom, turbo=True, **config)
+
+    for frames in CHUNKS:
+        for machine in (expected, chip):
+            machine.keyboard.queue_key(5)
+            machine.run(frames)
+        assert chip.snapshot() == expected.snapshot()
+
+
+def test_idle_skipping_fast_forwards_virtual_time(make_chip8):
+    chip = make_chip8(ROMS['jump'], sprite=SPRITE, turbo=True)
+
+    # Ten minutes of emulated time
+    chip.run(60 * 60 * 10)
+
+    assert chip.scheduler.frames == 60 * 60 * 10
+    assert chip.counter == 0x208
+    assert chip.idle_loops.frames_skipped > 60 * 60 * 9
+
+
+def test_idle_skipping_whole_frames_only_without_listeners(make_chip8):
+    expected = make_chip8(ROMS['timer_poll'], turbo=True, skip_idle=False)
+    chip = make_chip8(ROMS['timer_poll'], turbo=True)
+    chip.enable_rewind()
+
+    expected.run(600)
+    chip.run(600)
+
+    assert chip.snapshot() == expected.snapshot()
+    assert chip.idle_loops.frames_skipped == 0
+    assert chip.rewind_buffer.captures == 600
+
+
+def test_idle_loop_detection(make_chip8):
+    chip = make_chip8(
+        ROMS['timer_value'] + ROMS['jump'][-2:], sprite=SPRITE, turbo=True,
+    )
+    idle_loops = chip.idle_loops
+
+    assert idle_loops.find(0x200) is None
+    for counter in (0x206, 0x208, 0x20A):
+        loop = idle_loops.find(counter)
+        assert (loop.kind, loop.start, loop.length) == (TIMER_POLL, 0x206, 3)
+        assert (loop.x, loop.kk) == (1, 5)
+
+    # Jump at 0x214 leads to 0x208, not to itself
+    assert idle_loops.find(0x214) is None
+
+    chip.memory.write(0x300, bytes([0x13, 0x00, 0xF3, 0x0A]))
+    assert idle_loops.find(0x300).kind == JUMP
+    assert idle_loops.find(0x302).kind == KEY_WAIT
+
+    chip.memory.write(0x310, bytes([0xE3, 0x9E, 0x13, 0x10]))
+    assert idle_loops.find(0x312).kind == KEY_POLL
+
+
+def test_idle_loop_invalidated_by_writes(make_chip8):
+    chip = make_chip8(ROMS['timer_poll'], turbo=True)
+
+    assert chip.idle_loops.find(0x208).kind == TIMER_POLL
+
+    chip.memory.write(0x208, bytes([0x12, 0x00]))  # JP 0x200
+    assert chip.idle_loops.find(0x208) is None
+
+
+def test_idle_skipping_suspended_while_profiling(make_chip8):
+    chip = make_chip8(ROMS['jump'], sprite=SPRITE, turbo=True)
+    idle_loops = chip.idle_loops
+
+    chip.enable_profiling()
+    assert chip.idle_loops is None
+
+    chip.disable_profiling()
+    assert chip.idle_loops is idle_loops
@@ -0,0 +1,77 @@
+from chip8.input import Chip8Keyboard
+
+
+def test_keyboard_press_and_release():
+    keyboard = Chip8Keyboard()
+    events = []
+    keyboard.key_listeners.append(lambda key, pressed: events.append(
+        (key, pressed),
+    ))
+
+    keyboard.press_key(0x0)
+    keyboard.press_key(0xF)
+    keyboard.press_key(0xF)  # Auto-repeat
+
+    assert keyboard.pressed_keys == 0b1000_0000_0000_0001
+    assert keyboard.is_pressed(0x0)
+    assert not keyboard.is_pressed(0x1)
+
+    keyboard.release_key(0x0)
+    keyboard.release_key(0x1)  # Not pressed
+
+    assert keyboard.pressed_keys == 0b1000_0000_0000_0000
+    assert events == [(0x0, True), (0xF, True), (0x0, False)]
+
+
+def test_keyboard_capture_only_while_waiting():
+    keyboard = Chip8Keyboard()
+
+    keyboard.press_key(0x1)
+    assert keyboard.get_captured_key() is None
+
+    keyboard.wait_for_input()
+    keyboard.press_key(0x1)  # Still held, not a new press
+    assert keyboard.waiting_for_input
+
+    keyboard.press_key(0x0)
+    assert not keyboard.waiting_for_input
+    assert keyboard.get_captured_key() == 0x0
+    assert keyboard.get_captured_key() is None
+
+
+def test_keyboard_tick_applies_read_keys():
+    keyboard = Chip8Keyboard()
+    keyboard.pending_keys.extend([0x4, 0xC])
+
+    keyboard.tick()
+
+    assert keyboard.pressed_keys == (1 << 0x4) | (1 << 0xC)
+    assert not keyboard.pending_keys
+
+
+def test_keyboard_tick_releases_keys_not_repeated():
+    keyboard = Chip8Keyboard()
+    keyboard.pending_keys.append(0x4)
+    keyboard.tick()
+
+    for _ in range(Chip8Keyboard.HOLD_FRAMES - 2):
+        keyboard.tick()
+    keyboard.pending_keys.append(0x4)  # Auto-repeat keeps it held
+    keyboard.tick()
+
+    for _ in range(Chip8Keyboard.HOLD_FRAMES - 1):
+        keyboard.tick()
+    assert keyboard.is_pressed(0x4)
+
+    keyboard.tick()
+    assert not keyboard.pressed_keys
+
+
+def test_keyboard_start_without_terminal(mocker):
+    mocker.patch('sys.stdin.isatty', return_value=False)
+    keyboard = Chip8Keyboard()
+
+    keyboard.start()
+    assert keyboard.reader is None
+
+    keyboard.stop()
@@ -0,0 +1,70 @@
+from chip8.disassembler import DECODER_VERSION
+from chip8.library import (
+    DisassemblyCache,
+    analyze_rom,
+    disassemble_library,
+    find_roms,
+)
+
+ROM = bytes([
+    0x60, 0x00,  # 0x200: LD V0, 0
+    0x70, 0x01,  # 0x202: ADD V0, 1
+    0x12, 0x02,  # 0x204: JP 0x202
+    0xF0, 0x90,  # 0x206: sprite data
+])
+
+
+def test_analyze_rom():
+    analysis = analyze_rom(ROM)
+
+    assert analysis['size'] == 8
+    assert analysis['decoder_version'] == DECODER_VERSION
+    assert analysis['instructions'] == 3
+    assert analysis['data_bytes'] == 2
+    assert analysis['histogram'] == {'1nnn': 1, '6xkk': 1, '7xkk': 1}
+
+
+def test_find_roms(tmp_path):
+    (tmp_path / 'games').mkdir()
+    (tmp_path / 'games' / 'b.ch8').write_bytes(ROM)
+    (tmp_path / 'games' / 'a.CH8').write_bytes(ROM)
+    (tmp_path / 'games' / 'notes.txt').write_text('')
+    (tmp_path / 'single.rom').write_bytes(ROM)
+
+    assert find_roms([tmp_path / 'games', tmp_path / 'single.rom']) == [
+        tmp_path / 'games' / 'a.CH8',
+        tmp_path / 'games' / 'b.ch8',
+        tmp_path / 'single.rom',
+    ]
+
+
+def test_disassemble_library_cache(tmp_path, mocker):
+    (tmp_path / 'roms').mkdir()
+    (tmp_path / 'roms' / 'a.ch8').write_bytes(ROM)
+    (tmp_path / 'roms' / 'b.ch8').write_bytes(ROM + b'\x00')
+    cache = DisassemblyCache(tmp_path / 'cache')
+
+    first = list(disassemble_library([tmp_path / 'roms'], cache, workers=2))
+    assert [analysis['path'] for analysis in first] == [
+        str(tmp_path / 'roms' / 'a.ch8'),
+        str(tmp_path / 'roms' / 'b.ch8'),
+    ]
+    assert len(list((tmp_path / 'cache').iterdir())) == 2
+
+    # Everything is cached, so no pool is started
+    executor = mocker.patch('chip8.library.ProcessPoolExecutor')
+    second = list(disassemble_library([tmp_path / 'roms'], cache))
+
+    assert second == first
+    executor.assert_not_called()
+
+
+def test_disassembly_cache_versioned(tmp_path, mocker):
+    cache = DisassemblyCache(tmp_path)
+    analysis = analyze_rom(ROM)
+    cache.put(analysis)
+
+    assert cache.get(analysis['sha256']) == analysis
+
+    mocker.patch('chip8.library.DECODER_VERSION', DECODER_VERSION + 1)
+    assert cache.get(analysis['sha256']) is None
@@ -1,7 +1,7 @@
 import pytest
 
 from chip8.errors import Chip8Panic
-from chip8.memory import Chip8Memory
+from chip8.memory import Chip8Memory, FastMemory
 
 
 @pytest.fixture
@@ -63,7 +63,77 @@ def test_read_within_bounds(chip8_memory):
     assert result == bytearray([0x04, 0x05, 0x06])
 
 
-def test_read_out_of_bounds(chip8_memory):
+@pytest.mark.parametrize(('address', 'length'), [
+    (0xFFF, 3),
+    (0x200, -1),
+])
+def test_read_out_of_bounds(address, length, chip8_memory):
     error_msg = 'Memory read out of bounds: 0x1000'
     with pytest.raises(Chip8Panic, match=error_msg):
-        chip8_memory.read(0xFFF, 3)
+        chip8_memory.read(address, length)
+
+
+def test_read_last_bytes(chip8_memory):
+    chip8_memory.data[-2:] = bytes([0x0A, 0x0B])
+    assert chip8_memory.read(0xFFE, 2) == bytearray([0x0A, 0x0B])
+
+
+def test_view_is_zero_copy(chip8_memory):
+    chip8_memory.data[0x400:0x403] = bytes([0x04, 0x05, 0x06])
+    view = chip8_memory.view(0x400, 3)
+
+    assert isinstance(view, memoryview)
+    assert view == bytes([0x04, 0x05, 0x06])
+
+    # View reflects memory itself, not a copy of it
+    chip8_memory.data[0x401] = 0xFF
+    assert view[1] == 0xFF
+    view.release()
+
+
+@pytest.mark.parametrize(('address', 'length'), [
+    (0xFFF, 2),
+    (0x1000, 1),
+    (-1, 2),
+    (0x200, -1),
+])
+def test_view_out_of_bounds(address, length, chip8_memory):
+    with pytest.raises(Chip8Panic, match='Memory read out of bounds: 0x1000'):
+        chip8_memory.view(address, length)
+
+
+def test_read_word(chip8_memory):
+    chip8_memory.data[0xFFE:0x1000] = bytes([0xAB, 0xCD])
+    assert chip8_memory.read_word(0xFFE) == 0xABCD
+
+
+@pytest.mark.parametrize('address', [0xFFF, 0x1000, -1])
+def test_read_word_out_of_bounds(address, chip8_memory):
+    with pytest.raises(Chip8Panic, match='Memory read out of bounds'):
+        chip8_memory.read_word(address)
+
+
+def test_fast_memory_wraps_addresses():
+    memory = FastMemory()
+    memory.data[0xFFF] = 0xAB
+    memory.data[0x000] = 0xCD
+
+    assert memory.read_byte(0x1FFF) == 0xAB
+    assert memory.read_word(0xFFF) == 0xABCD
+    assert bytes(memory.view(0xFFF, 2)) == bytes([0xAB, 0xCD])
+
+
+def test_fast_memory_masks_values(mocker):
+    memory = FastMemory()
+    listener = mocker.Mock()
+    memory.add_write_listener(listener)
+
+    memory.write_byte(0x1200, 0x1EF)
+
+    assert memory.data[0x200] == 0xEF
+    listener.assert_called_once_with(0x200, 1)
+
+
+def test_fast_memory_checks_bulk_writes():
+    with pytest.raises(Chip8Panic, match='Memory write out of bounds'):
+        FastMemory().write(0xFFF, bytes(2))
@@ -0,0 +1,43 @@
+import pytest
+
+PROGRAM = bytes([
+    0x60, 0x01,  # 0x200: LD V0, 1
+    0x81, 0x04,  # 0x202: ADD V1, V0
+    0x12, 0x02,  # 0x204: JP 0x202
+])
+
+
+@pytest.fixture
+def chip8(make_chip8):
+    return make_chip8(PROGRAM, 'compiler', instructions_per_frame=11)
+
+
+def test_profiler_counts(chip8):
+    profiler = chip8.enable_profiling()
+    chip8.run(frames=10, throttle=False)
+
+    assert profiler.opcode_stats['6xkk'][0] == 1
+    assert profiler.opcode_stats['8xy4'][0] == 55
+    assert profiler.opcode_stats['1nnn'][0] == 54
+    assert profiler.render_stats[0] == profiler.keyboard_stats[0] == 10
+
+    hot_addresses = profiler.top_addresses(2)
+    assert {address for address, _, _ in hot_addresses} == {0x202, 0x204}
+    assert sum(executions for _, executions, _ in hot_addresses) == 109
+
+    report = profiler.report(2)
+    assert '0202:' in report
+    assert '8xy4 - ADD V1, V0' in report
+
+
+def test_profiler_disable_restores_machine(chip8):
+    compiler = chip8.compiler
+    chip8.enable_profiling()
+    assert chip8.compiler is None
+    assert 'step' in vars(chip8)
+
+    chip8.disable_profiling()
+    assert chip8.profiler is None
+    assert chip8.compiler is compiler
+    assert 'step' not in vars(chip8)
+    assert 'tick' not in vars(chip8.keyboard)
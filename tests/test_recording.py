@@ -0,0 +1,57 @@
+import pytest
+
+from chip8.errors import Chip8Panic
+from chip8.recording import read_input_log
+
+PROGRAM = bytes([
+    0xF0, 0x0A,  # 0x200: LD V0, K
+    0x81, 0x04,  # 0x202: ADD V1, V0
+    0x12, 0x00,  # 0x204: JP 0x200
+])
+
+# Frame -> key pressed during that frame
+PRESSED_KEYS = {3: 0x1, 4: 0x5, 20: 0xF, 21: 0x0, 40: 0xD}
+
+
+def test_record_and_replay(tmp_path, make_chip8, mocker):
+    log_path = tmp_path / 'input.c8in'
+
+    chip8 = make_chip8(PROGRAM, clock_rate=500)
+    mocker.patch.object(
+        chip8.keyboard, 'read_keys',
+        side_effect=lambda: [
+            key
+            for frame, key in PRESSED_KEYS.items()
+            if frame == chip8.scheduler.frames
+        ],
+    )
+    recorder = chip8.record_input(log_path)
+    chip8.run(frames=60, throttle=False)
+    recorder.close()
+
+    # Every key is pressed and released later on
+    assert recorder.events == 2 * len(PRESSED_KEYS)
+    events = read_input_log(log_path)
+    assert [key for _, key, pressed in events if pressed] == list(
+        PRESSED_KEYS.values(),
+    )
+
+    # Replaying on a fresh machine without any terminal input
+    replayed = make_chip8(PROGRAM, clock_rate=500)
+    keyboard = replayed.replay_input(log_path)
+    replayed.run(frames=60, throttle=False)
+
+    assert keyboard.finished
+    assert replayed.snapshot() == chip8.snapshot()
+
+
+def test_read_input_log_invalid(tmp_path):
+    log_path = tmp_path / 'input.c8in'
+
+    log_path.write_bytes(b'XXXX\x01')
+    with pytest.raises(Chip8Panic, match='wrong magic bytes'):
+        read_input_log(log_path)
+
+    log_path.write_bytes(b'C8IN\x02' + bytes(7))
+    with pytest.raises(Chip8Panic, match='truncated event'):
+        read_input_log(log_path)
@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+from chip8.display import Chip8Display
+from chip8.render import RenderThread
+
+
+@pytest.fixture
+def display():
+    return Chip8Display()
+
+
+def test_render_thread_renders_latest_frame(display, mocker):
+    render_thread = RenderThread(display, fps=1000)
+    rendered = []
+    mocker.patch.object(
+        render_thread.front, 'render',
+        side_effect=lambda: rendered.append(tuple(render_thread.front.rows)),
+    )
+
+    render_thread.start()
+    display.render()  # First frame is always rendered
+    display.draw_sprite(b'\xff', 0, 3)
+    display.render()
+    render_thread.stop()
+
+    assert rendered[-1] == tuple(display.rows)
+    assert render_thread.frames_presented == 2
+    assert render_thread.frames_rendered + render_thread.frames_skipped == 2
+    assert 'render' not in vars(display)
+
+
+def test_render_thread_skips_frames_for_slow_output(display, mocker):
+    render_thread = RenderThread(display, fps=1000)
+    mocker.patch.object(
+        render_thread.front, 'render', side_effect=lambda: time.sleep(0.05),
+    )
+
+    render_thread.start()
+    start = time.perf_counter()
+    for x in range(20):
+        display.draw_sprite(b'\x80', x, 0)
+        display.render()
+    elapsed = time.perf_counter() - start
+    render_thread.stop()
+
+    # CPU side never waited for the output
+    assert elapsed < 0.05
+    assert render_thread.frames_skipped > 0
+    assert render_thread.frames_late > 0
+    assert (
+        render_thread.frames_rendered + render_thread.frames_skipped == 20
+    )
+
+    # Changes of skipped frames are redrawn with the next rendered frame
+    assert render_thread.front.rows == display.rows
+
+
+def test_render_thread_ignores_unchanged_frames(display, mocker):
+    render_thread = RenderThread(display)
+    mocker.patch.object(render_thread.front, 'render')
+    display.full_redraw = False
+
+    render_thread.hand_over()
+
+    assert render_thread.frames_presented == 0
+    assert render_thread.pending is None
+
+
+def test_render_thread_invalid_fps(display):
+    with pytest.raises(ValueError, match='Render FPS must be positive'):
+        RenderThread(display, fps=0)
+
+
+@pytest.mark.parametrize('profile_first', [True, False])
+def test_render_thread_with_profiling(profile_first, make_chip8, mocker):
+    chip8 = make_chip8(bytes([0x00, 0xE0, 0x12, 0x00]), turbo=True)
+    render = chip8.display.render
+
+    if profile_first:
+        profiler = chip8.enable_profiling()
+        render_thread = chip8.enable_render_thread(1000)
+    else:
+        render_thread = chip8.enable_render_thread(1000)
+        profiler = chip8.enable_profiling()
+    mocker.patch.object(render_thread.front, 'render')
+
+    chip8.run(frames=5)
+
+    disable_first, disable_last = (
+        chip8.disable_render_thread, chip8.disable_profiling,
+    )
+    if not profile_first:
+        disable_first, disable_last = disable_last, disable_first
+
+    # Whatever was enabled last has to be disabled first
+    with pytest.raises(RuntimeError, match='disable that first'):
+        disable_last()
+    disable_first()
+    disable_last()
+
+    assert profiler.render_stats[0] == 5
+    assert render_thread.frames_presented >= 1
+    assert chip8.display.render is render
@@ -0,0 +1,60 @@
+import pytest
+
+PROGRAM = bytes([
+    0x60, 0x00,  # 0x200: LD V0, 0
+    0xA3, 0x00,  # 0x202: LD I, 0x300
+    0x81, 0x04,  # 0x204: ADD V1, V0
+    0x70, 0x01,  # 0x206: ADD V0, 1
+    0xD0, 0x11,  # 0x208: DRW V0, V1, 1
+    0x30, 0xF0,  # 0x20A: SE V0, 0xF0
+    0x12, 0x04,  # 0x20C: JP 0x204
+    0x12, 0x0E,  # 0x20E: JP 0x20E
+])
+
+
+@pytest.fixture
+def chip8(make_chip8):
+    return make_chip8(PROGRAM, sprite=bytes([0b11010000]), clock_rate=300)
+
+
+def test_rewind_not_enabled(chip8):
+    with pytest.raises(RuntimeError, match='Rewind is not enabled'):
+        chip8.rewind(1)
+
+
+def test_rewind_restores_past_frames(chip8):
+    rewind_buffer = chip8.enable_rewind(keyframe_interval=8)
+
+    states = []
+    for _ in range(40):
+        chip8.run(frames=1, throttle=False)
+        states.append(chip8.snapshot())
+
+    assert len(rewind_buffer) == 40
+    assert rewind_buffer.entries[0][0]  # Oldest entry is a keyframe
+
+    # Rewinding across a keyframe boundary
+    assert chip8.rewind(13) == 13
+    assert chip8.snapshot() == states[-14]
+    assert len(rewind_buffer) == 27
+
+    # Resuming after rewind gives the same frames again
+    chip8.run(frames=5, throttle=False)
+    assert chip8.snapshot() == states[-9]
+    assert chip8.rewind(2) == 2
+    assert chip8.snapshot() == states[-11]
+
+
+def test_rewind_memory_cap(chip8):
+    rewind_buffer = chip8.enable_rewind(max_bytes=2048, keyframe_interval=4)
+    chip8.run(frames=100, throttle=False)
+
+    assert rewind_buffer.nbytes <= 2048
+    assert 0 < len(rewind_buffer) < 100
+    assert rewind_buffer.entries[0][0]
+    assert rewind_buffer.capture_cost > 0
+
+    # Can't go further back than the oldest kept frame
+    frames_kept = len(rewind_buffer)
+    assert chip8.rewind(1000) == frames_kept - 1
+    assert chip8.scheduler.frames == 100 - frames_kept + 1
@@ -0,0 +1,220 @@
+import asyncio
+from itertools import count
+
+import pytest
+
+from chip8.cpu import Chip8
+from chip8.scheduler import Chip8Scheduler
+
+COUNTING_LOOP = bytes([0x70, 0x01, 0x12, 0x00])  # ADD V0, 1; JP 0x200
+
+
+@pytest.fixture
+def chip8(make_chip8):
+    return make_chip8(COUNTING_LOOP)
+
+
+@pytest.mark.parametrize(('clock_rate', 'cycles'), [
+    (60, [1] * 6),
+    (100, [1, 2, 2, 1, 2, 2]),
+    (500, [8, 8, 9, 8, 8, 9]),
+])
+def test_scheduler_cycles_in_frame(clock_rate, cycles, chip8):
+    chip8.clock_rate = clock_rate
+
+    assert [chip8.scheduler.cycles_in_frame(i) for i in range(6)] == cycles
+    assert sum(
+        chip8.scheduler.cycles_in_frame(i) for i in range(60)
+    ) == clock_rate
+
+
+def test_scheduler_unthrottled_is_reproducible(chip8, make_chip8, mocker):
+    sleep = mocker.patch('time.sleep')
+
+    chip8.run(frames=120, throttle=False)
+    other = make_chip8(COUNTING_LOOP)
+    other.run(frames=120, throttle=False)
+
+    assert not sleep.called
+    assert chip8.scheduler.cycles == other.scheduler.cycles == 200
+    assert chip8.registers.v == other.registers.v
+    assert chip8.registers.get_v(0) == 100
+
+
+def test_scheduler_throttled_sleeps_until_deadline(chip8, mocker):
+    clock = mocker.patch('time.perf_counter_ns', return_value=0)
+    sleep = mocker.patch('time.sleep')
+
+    scheduler = Chip8Scheduler(chip8)
+    scheduler.run(frames=3)
+
+    assert clock.called
+    assert sleep.call_count == 3
+    assert sleep.call_args_list[-1].args[0] == pytest.approx(3 / 60, 1e-6)
+
+
+def test_scheduler_instructions_per_frame(chip8):
+    chip8.scheduler.instructions_per_frame = 10
+
+    assert chip8.scheduler.clock_rate == 600
+    chip8.run(frames=3, throttle=False)
+    assert chip8.scheduler.cycles == 30
+
+
+def test_scheduler_timer_rate_follows_emulated_time(make_chip8):
+    chip8 = make_chip8(
+        bytes([0x12, 0x00]),  # 1200 - JP 0x200
+        clock_rate=1000, timer_rate=50, turbo=True, skip_idle=False,
+    )
+    chip8.delay_timer.update(100)
+
+    # One emulated second: 1000 cycles and 50 timer ticks, whatever the
+    # wall time it took in turbo mode
+    chip8.run(frames=50)
+    assert chip8.scheduler.cycles == 1000
+    assert chip8.delay_timer.value == 50
+    assert chip8.instructions_per_second > 0
+
+
+def test_scheduler_rate_excludes_skipped_cycles(make_chip8, mocker):
+    chip8 = make_chip8(
+        bytes([0x60, 0x01, 0x12, 0x02]),  # LD V0, 1; JP 0x202
+        instructions_per_frame=1000, turbo=True,
+    )
+
+    # Clock ticking a millisecond per reading
+    mocker.patch('time.perf_counter_ns', side_effect=count(0, 1_000_000))
+
+    # An hour of emulated time, the jump only executes in the first frame
+    # until it is recognized as an idle loop
+    chip8.run(frames=60 * 60 * 60)
+    assert chip8.scheduler.cycles == 60 * 60 * 60 * 1000
+    assert chip8.scheduler.executed_cycles == 1000
+
+    # Every cycle counted would be millions per millisecond
+    assert 0 < chip8.instructions_per_second <= 1000 * 1000
+
+
+def test_scheduler_turbo_toggle(chip8):
+    assert not chip8.turbo
+    assert chip8.toggle_turbo()
+    assert not chip8.scheduler.throttle
+    assert not chip8.toggle_turbo()
+    assert chip8.scheduler.throttle
+
+
+@pytest.mark.parametrize('options', [
+    {'clock_rate': 0},
+    {'timer_rate': 0},
+    {'instructions_per_frame': -1},
+])
+def test_scheduler_invalid_rates(options):
+    with pytest.raises(ValueError, match='must be positive'):
+        Chip8(**options)
+
+
+WAIT_FOR_KEY = bytes([
+    0xF0, 0x0A,  # 0x200: LD V0, K
+    0x71, 0x01,  # 0x202: ADD V1, 1
+    0x12, 0x00,  # 0x204: JP 0x200
+])
+
+
+def test_scheduler_run_async_many_machines(make_chip8):
+    machines = [
+        make_chip8(COUNTING_LOOP, instructions_per_frame=10)
+        for _ in range(100)
+    ]
+
+    async def run_all():
+        await asyncio.gather(*(
+            machine.run_async(frames=20, throttle=False)
+            for machine in machines
+        ))
+
+    asyncio.run(run_all())
+
+    for machine in machines:
+        assert machine.scheduler.frames == 20
+        assert machine.registers.v[0] == 100
+
+
+def test_scheduler_run_async_sleeps_waiting_for_key(make_chip8, mocker):
+    chip8 = make_chip8(WAIT_FOR_KEY, instructions_per_frame=10)
+    chip8.delay_timer.update(30)
+    run_cycles = mocker.spy(chip8, 'run_cycles')
+
+    async def run():
+        task = asyncio.create_task(chip8.run_async(throttle=False))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # Only the first frame was run, the machine sleeps since then
+        assert run_cycles.call_count == 1
+        assert chip8.keyboard.waiting_for_input
+
+        chip8.keyboard.queue_key(0x7)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+
+    asyncio.run(run())
+
+    assert chip8.registers.v[0] == 0x7
+    assert chip8.registers.v[1] > 0
+
+
+def test_scheduler_run_async_timers_catch_up(make_chip8, mocker):
+    chip8 = make_chip8(WAIT_FOR_KEY, instructions_per_frame=10)
+    chip8.delay_timer.update(30)
+    run_cycles = mocker.spy(chip8, 'run_cycles')
+
+    # Waiting is cut short by the frames limit, time still passes
+    asyncio.run(chip8.run_async(frames=6))
+
+    assert run_cycles.call_count == 1
+    assert chip8.scheduler.frames == 6
+    assert chip8.scheduler.cycles == 60
+    assert chip8.delay_timer.value == 24
+
+
+@pytest.mark.parametrize('throttle', [True, False])
+def test_scheduler_run_async_stops_tone_waiting_for_key(
+    throttle, make_chip8, mocker,
+):
+    chip8 = make_chip8(bytes([
+        0x60, 0x06,  # 0x200: LD V0, 6
+        0xF0, 0x18,  # 0x202: LD ST, V0
+        0xF1, 0x0A,  # 0x204: LD V1, K
+    ]), instructions_per_frame=10)
+    chip8.sound_timer.sink = mocker.Mock()
+
+    async def run():
+        task = asyncio.create_task(chip8.run_async(throttle=throttle))
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if chip8.sound_timer.sink.stop.called:
+                break
+        task.cancel()
+
+    asyncio.run(run())
+
+    assert chip8.sound_timer.sink.mock_calls == [
+        mocker.call.start(), mocker.call.stop(),
+    ]
+    assert chip8.scheduler.frames >= 6
+    assert chip8.keyboard.waiting_for_input
+
+
+def test_scheduler_skip_frames(chip8):
+    chip8.scheduler.instructions_per_frame = None
+    chip8.clock_rate = 100
+    chip8.sound_timer.update(3)
+    chip8.keyboard.press_key(0x1)
+
+    chip8.scheduler.skip_frames(600)
+
+    assert chip8.scheduler.frames == 600
+    assert chip8.scheduler.cycles == 1000
+    assert chip8.sound_timer.value == 0
+    assert not chip8.keyboard.pressed_keys
@@ -0,0 +1,95 @@
+import pytest
+
+from chip8.errors import Chip8Panic
+from chip8.state import HEADER
+
+PROGRAM = bytes([
+    0x60, 0x00,  # 0x200: LD V0, 0
+    0xA3, 0x00,  # 0x202: LD I, 0x300
+    0x70, 0x01,  # 0x204: ADD V0, 1
+    0xD0, 0x01,  # 0x206: DRW V0, V0, 1
+    0x30, 0x30,  # 0x208: SE V0, 0x30
+    0x12, 0x04,  # 0x20A: JP 0x204
+    0x12, 0x0C,  # 0x20C: JP 0x20C
+])
+
+
+@pytest.fixture
+def chip8(make_chip8):
+    return make_chip8(PROGRAM, sprite=bytes([0b10110000]))
+
+
+def machine_state(chip8):
+    return (
+        chip8.counter,
+        bytes(chip8.registers.v),
+        chip8.registers.i,
+        chip8.delay_timer.value,
+        chip8.sound_timer.value,
+        chip8.scheduler.cycles,
+        chip8.scheduler.frames,
+        bytes(chip8.memory.data),
+        list(chip8.display.rows),
+    )
+
+
+def test_snapshot_size(chip8):
+    assert len(chip8.snapshot()) < 5 * 1024
+
+
+def test_restore_resumes_identically(chip8, make_chip8):
+    chip8.delay_timer.update(0x40)
+    chip8.run(frames=30, throttle=False)
+    state = chip8.snapshot()
+
+    chip8.run(frames=60, throttle=False)
+    expected = machine_state(chip8)
+
+    # Resuming a fresh machine from the snapshot
+    other = make_chip8(b'')
+    other.restore(state)
+    assert other.display.full_redraw
+
+    other.run(frames=60, throttle=False)
+    assert machine_state(other) == expected
+
+
+def test_restore_keeps_held_keys(chip8, make_chip8):
+    chip8.run(frames=3, throttle=False)
+    chip8.keyboard.press_key(0x1)
+    chip8.run(frames=5, throttle=False)
+    state = chip8.snapshot()
+
+    # Key is released at the same frame after restoring
+    other = make_chip8(b'')
+    other.restore(state)
+    for machine in (chip8, other):
+        held = []
+        for _ in range(15):
+            machine.run(frames=1, throttle=False)
+            held.append(machine.keyboard.is_pressed(0x1))
+        assert held == [True] * 9 + [False] * 6
+
+
+def test_restore_invalidates_instruction_cache(chip8):
+    state = chip8.snapshot()
+    chip8.run_cycles(3)
+    assert chip8.instruction_cache[0x200] is not None
+
+    chip8.restore(state)
+    assert chip8.instruction_cache[0x200] is None
+    assert chip8.counter == 0x200
+
+
+def test_restore_invalid_state(chip8):
+    state = chip8.snapshot()
+
+    with pytest.raises(Chip8Panic, match='Invalid save state size'):
+        chip8.restore(state[:-1])
+
+    with pytest.raises(Chip8Panic, match='wrong magic bytes'):
+        chip8.restore(b'XXXX' + state[4:])
+
+    version = HEADER.pack(b'C8ST', 99)
+    with pytest.raises(Chip8Panic, match='Unsupported save state version: 99'):
+        chip8.restore(version + state[HEADER.size:])
@@ -0,0 +1,154 @@
+import socket
+import time
+
+import pytest
+
+from chip8.streaming import (
+    DELTA,
+    KEYFRAME,
+    MESSAGE,
+    FrameClient,
+    apply_delta,
+    encode_delta,
+    parse_address,
+    rle_decode,
+    rle_encode,
+)
+
+# Drawing the "0" digit sprite at x = V0 and moving it right every frame
+PROGRAM = bytes([
+    0xA2, 0x0A,  # 0x200: LD I, 0x20A
+    0x62, 0x01,  # 0x202: LD V2, 1
+    0xD0, 0x15,  # 0x204: DRW V0, V1, 5
+    0x80, 0x24,  # 0x206: ADD V0, V2
+    0x12, 0x04,  # 0x208: JP 0x204
+    0xF0, 0x90, 0x90, 0x90, 0xF0,  # 0x20A: sprite
+])
+
+
+@pytest.fixture
+def chip8(make_chip8):
+    return make_chip8(PROGRAM, instructions_per_frame=3)
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'\x00',
+    b'\x01\x02',
+    bytes(300),
+    b'\x00\x00\x05\x00\xff' + bytes(255) + b'\x01',
+])
+def test_rle_round_trip(data):
+    assert rle_decode(rle_encode(data)) == data
+
+
+def test_rle_compresses_zero_runs():
+    assert rle_encode(bytes(8) + b'\x0f' + bytes(7)) == b'\x00\x08\x0f\x00\x07'
+
+
+def test_delta_only_has_changed_rows():
+    previous = (0,) * 32
+    rows = (0,) * 5 + (0xF0 << 56,) + (0,) * 26
+
+    message = encode_delta(7, previous, rows)
+    message_type, frame, length = MESSAGE.unpack_from(message)
+
+    assert (message_type, frame) == (DELTA, 7)
+    assert length < 16
+    assert apply_delta(previous, message[MESSAGE.size :]) == rows
+    assert KEYFRAME != DELTA
+
+
+@pytest.mark.parametrize(('address', 'expected'), [
+    ('localhost:9000', ('localhost', 9000)),
+    ('run/chip8.sock', 'run/chip8.sock'),
+    ('frames.sock', 'frames.sock'),
+])
+def test_parse_address(address, expected):
+    assert parse_address(address) == expected
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize('unix', [False, True])
+def test_frame_server_streams_frames(unix, chip8, tmp_path):
+    address = str(tmp_path / 'frames.sock') if unix else ('127.0.0.1', 0)
+    server = chip8.serve_frames(address)
+
+    try:
+        clients = [FrameClient(server.address) for _ in range(3)]
+        wait_for(lambda: len(server.subscribers) == 3)
+
+        chip8.run(frames=1, throttle=False)
+        received = [next(client.frames()) for client in clients]
+
+        assert all(rows == tuple(chip8.display.rows) for _, rows in received)
+    finally:
+        for client in clients:
+            client.close()
+        server.close()
+
+    assert server.frames_published == 1
+
+
+def test_frame_server_keeps_files_at_address(chip8, tmp_path):
+    path = tmp_path / 'main.py'
+    path.write_text('print()')
+
+    with pytest.raises(FileExistsError, match='Not a Unix socket'):
+        chip8.serve_frames(str(path))
+
+    assert path.read_text() == 'print()'
+
+
+def test_frame_server_applies_deltas(chip8):
+    server = chip8.serve_frames(('127.0.0.1', 0))
+
+    try:
+        with FrameClient(server.address) as client:
+            wait_for(lambda: len(server.subscribers) == 1)
+            frames = client.frames()
+
+            for _ in range(5):
+                chip8.run(frames=1, throttle=False)
+                frame, rows = next(frames)
+
+                assert frame == chip8.scheduler.frames
+                assert rows == tuple(chip8.display.rows)
+    finally:
+        server.close()
+
+
+def test_frame_server_drops_frames_for_slow_viewers(chip8):
+    server = chip8.serve_frames(('127.0.0.1', 0))
+
+    try:
+        # Viewer connects, but never reads anything
+        client = FrameClient(server.address)
+        wait_for(lambda: len(server.subscribers) == 1)
+        subscriber = next(iter(server.subscribers.values()))
+        subscriber.connection.setsockopt(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, 1024,
+        )
+
+        start = time.perf_counter()
+        chip8.run(frames=3000, throttle=False)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 5  # CPU loop is never blocked by the viewer
+
+        # Server thread may have kept up so far, it can't once the socket
+        # buffers are full
+        deadline = time.monotonic() + 5
+        while not subscriber.frames_dropped:
+            assert time.monotonic() < deadline
+            chip8.run(frames=100, throttle=False)
+            time.sleep(0.01)
+    finally:
+        client.close()
+        server.close()
@@ -0,0 +1,73 @@
+from chip8.cpu import Chip8
+from chip8.timers import TerminalBell
+
+
+def test_timer_counts_down_frames():
+    chip8 = Chip8()
+    chip8.delay_timer.update(3)
+
+    values = []
+    for _ in range(5):
+        values.append(chip8.delay_timer.value)
+        chip8.scheduler.frames += 1
+
+    assert values == [3, 2, 1, 0, 0]
+
+
+def test_timer_value_setter():
+    chip8 = Chip8()
+    chip8.scheduler.frames = 100
+
+    chip8.delay_timer.value = 0x20
+    chip8.scheduler.frames += 0x10
+
+    assert chip8.delay_timer.value == 0x10
+
+
+def test_sound_timer_edges(make_chip8, mocker):
+    chip8 = make_chip8(bytes([0x12, 0x00]), turbo=True)  # JP 0x200
+    sink = chip8.sound_timer.sink = mocker.Mock()
+
+    chip8.sound_timer.update(3)
+    chip8.sound_timer.update(5)  # Tone keeps playing
+    assert sink.mock_calls == [mocker.call.start()]
+
+    chip8.run(frames=4)
+    assert sink.mock_calls == [mocker.call.start()]
+
+    chip8.run(frames=1)
+    assert sink.mock_calls == [mocker.call.start(), mocker.call.stop()]
+    assert chip8.sound_timer.value == 0
+
+    chip8.run(frames=10)
+    assert len(sink.mock_calls) == 2
+
+
+def test_sound_timer_cleared(mocker):
+    chip8 = Chip8()
+    sink = chip8.sound_timer.sink = mocker.Mock()
+
+    chip8.sound_timer.update(10)
+    chip8.sound_timer.update(0)
+    chip8.sound_timer.update(0)
+
+    assert sink.mock_calls == [mocker.call.start(), mocker.call.stop()]
+
+
+def test_sound_timer_stops_when_frames_are_skipped(mocker):
+    chip8 = Chip8()
+    sink = chip8.sound_timer.sink = mocker.Mock()
+
+    chip8.sound_timer.update(30)
+    chip8.scheduler.skip_frames(600)
+
+    assert sink.mock_calls == [mocker.call.start(), mocker.call.stop()]
+
+
+def test_terminal_bell(capsys):
+    bell = TerminalBell()
+
+    bell.start()
+    bell.stop()
+
+    assert capsys.readouterr().out == '\a'
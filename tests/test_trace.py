@@ -0,0 +1,121 @@
+import pytest
+
+from chip8.errors import Chip8Panic
+from chip8.trace import NO_REGISTER, read_trace
+
+PROGRAM = bytes([
+    0x60, 0x01,  # 0x200: LD V0, 1
+    0xA3, 0x00,  # 0x202: LD I, 0x300
+    0x81, 0x04,  # 0x204: ADD V1, V0
+    0x12, 0x04,  # 0x206: JP 0x204
+])
+
+
+@pytest.fixture
+def chip8(make_chip8):
+    return make_chip8(PROGRAM, 'compiler', instructions_per_frame=10)
+
+
+def test_trace_records(chip8, tmp_path, mocker):
+    trace_path = tmp_path / 'run.c8tr'
+    mocker.patch('chip8.trace.TraceWriter.BLOCK_RECORDS', 7)  # Many blocks
+
+    writer = chip8.enable_tracing(trace_path)
+    assert chip8.compiler is None
+    chip8.run(frames=10, throttle=False)
+    chip8.disable_tracing()
+
+    assert chip8.compiler is not None
+    assert writer.records == 100
+
+    records = list(read_trace(trace_path))
+    assert len(records) == 100
+    assert [record[0] for record in records] == list(range(100))
+    assert records[0] == (0, 0x200, 0x6001, 0, 1, 0, 0)
+    assert records[1] == (1, 0x202, 0xA300, NO_REGISTER, 0, 0, 0x300)
+    assert records[2] == (2, 0x204, 0x8104, 1, 1, 0, 0x300)
+    assert records[3] == (3, 0x206, 0x1204, NO_REGISTER, 0, 0, 0x300)
+
+
+def test_trace_records_carry(make_chip8, tmp_path):
+    trace_path = tmp_path / 'run.c8tr'
+    chip8 = make_chip8(bytes([
+        0x60, 0xFF,  # 0x200: LD V0, 0xFF
+        0x61, 0x01,  # 0x202: LD V1, 1
+        0x80, 0x14,  # 0x204: ADD V0, V1
+        0x6F, 0x00,  # 0x206: LD VF, 0
+    ]))
+
+    chip8.enable_tracing(trace_path)
+    chip8.run_cycles(4)
+    chip8.disable_tracing()
+
+    # V0 overflows, VF holds the carry
+    records = list(read_trace(trace_path))
+    assert records[2] == (2, 0x204, 0x8014, 0, 0, 1, 0)
+    assert records[3] == (3, 0x206, 0x6F00, 0xF, 0, 0, 0)
+
+
+def test_trace_filters(chip8, tmp_path):
+    trace_path = tmp_path / 'run.c8tr'
+    chip8.enable_tracing(trace_path)
+    chip8.run(frames=2, throttle=False)
+    chip8.disable_tracing()
+
+    by_address = list(read_trace(trace_path, address_range=(0x200, 0x202)))
+    assert [record[1] for record in by_address] == [0x200, 0x202]
+
+    by_opcode = list(read_trace(trace_path, opcode_class='8XY4'))
+    assert len(by_opcode) == 9
+    assert all(record[2] == 0x8104 for record in by_opcode)
+
+    small_chunks = list(read_trace(trace_path, chunk_records=3))
+    assert small_chunks == list(read_trace(trace_path))
+
+
+def test_read_trace_invalid(tmp_path):
+    trace_path = tmp_path / 'run.c8tr'
+    trace_path.write_bytes(b'XXXX\x01\x10')
+
+    with pytest.raises(Chip8Panic, match='wrong magic bytes'):
+        list(read_trace(trace_path))
+
+    trace_path.write_bytes(b'C8TR\x01\x10')
+    with pytest.raises(Chip8Panic, match='Unsupported trace version: 1'):
+        list(read_trace(trace_path))
+
+    trace_path.write_bytes(b'C8TR\x02\x10')
+    with pytest.raises(Chip8Panic, match='16 bytes per record, expected 17'):
+        list(read_trace(trace_path))
+
+
+@pytest.mark.parametrize('profile_first', [True, False])
+def test_trace_with_profiling(profile_first, chip8, tmp_path):
+    compiler, idle_loops = chip8.compiler, chip8.idle_loops
+    trace_path = tmp_path / 'run.c8tr'
+
+    if profile_first:
+        profiler = chip8.enable_profiling()
+        chip8.enable_tracing(trace_path)
+    else:
+        chip8.enable_tracing(trace_path)
+        profiler = chip8.enable_profiling()
+
+    chip8.run(frames=10, throttle=False)
+
+    disable_first, disable_last = chip8.disable_tracing, chip8.disable_profiling
+    if not profile_first:
+        disable_first, disable_last = disable_last, disable_first
+
+    # Whatever was enabled last has to be disabled first
+    with pytest.raises(RuntimeError, match='disable that first'):
+        disable_last()
+    disable_first()
+    disable_last()
+
+    assert len(list(read_trace(trace_path))) == 100
+    assert sum(stats[0] for stats in profiler.opcode_stats.values()) == 100
+
+    assert chip8.compiler is compiler
+    assert chip8.idle_loops is idle_loops
+    assert 'step' not in vars(chip8)
@@ -1,7 +1,7 @@
 import pytest
 
 from chip8.errors import Chip8Panic
-from chip8.utils import parse_byte
+from chip8.utils import mask_byte, parse_byte
 
 
 @pytest.mark.parametrize(('value', 'length', 'expected_msg'), [
@@ -21,3 +21,14 @@ def test_parse_byte(value, length, expected_msg):
     # If expected_msg is a string, we expect an exception
     with pytest.raises(Chip8Panic, match=expected_msg):
         parse_byte(value, length)
+
+
+@pytest.mark.parametrize(('value', 'length', 'expected'), [
+    (255, 1, 255),
+    (256, 1, 0),
+    (0x1AB, 1, 0xAB),
+    (0x12345, 2, 0x2345),
+    (0x1000000, 3, 0),
+])
+def test_mask_byte(value, length, expected):
+    assert mask_byte(value, length) == expected